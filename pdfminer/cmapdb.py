@@ -16,9 +16,17 @@ import os
 import os.path
 import gzip
 import codecs
+import mmap
 import marshal
 import struct
 import logging
+import hashlib
+import threading
+from io import BytesIO
+from array import array
+from bisect import bisect_right
+from operator import itemgetter
+from collections import OrderedDict
 from .psparser import PSStackParser
 from .psparser import PSSyntaxError
 from .psparser import PSEOF
@@ -54,9 +62,32 @@ class CMapBase:
     def add_code2cid(self, code, cid):
         return
 
+    def add_code2cid_range(self, start, end, cid):
+        """Maps the codes from start to end to consecutive CIDs."""
+        prefix = start[:-4]
+        svar = start[-4:]
+        s1 = nunpack(svar)
+        e1 = nunpack(end[-4:])
+        vlen = len(svar)
+        for i in range(e1-s1+1):
+            x = prefix+struct.pack('>L', s1+i)[-vlen:]
+            self.add_code2cid(x, cid+i)
+        return
+
     def add_cid2unichr(self, cid, code):
         return
 
+    def add_cid2unichr_range(self, start, end, code):
+        """Maps the CIDs from start to end to consecutive UTF-16 codes."""
+        var = code[-4:]
+        base = nunpack(var)
+        prefix = code[:-4]
+        vlen = len(var)
+        for i in range(end-start+1):
+            x = prefix+struct.pack('>L', base+i)[-vlen:]
+            self.add_cid2unichr(start+i, x)
+        return
+
     def use_cmap(self, cmap):
         return
 
@@ -65,9 +96,13 @@ class CMapBase:
 ##
 class CMap(CMapBase):
 
+    UNDEFINED = -1
+    PREFIX = -2
+
     def __init__(self, **kwargs):
         CMapBase.__init__(self, **kwargs)
         self.code2cid = {}
+        self._tables = None
         return
 
     def __repr__(self):
@@ -85,21 +120,95 @@ class CMap(CMapBase):
                 else:
                     dst[k] = v
         copy(self.code2cid, cmap.code2cid)
+        self._tables = None
+        return
+
+    def compile(self):
+        """Compiles the code2cid trie into flat tables.
+
+        cids1[b] is the CID of a one-byte code b and cids2[b<<8|c]
+        is the CID of a two-byte code (b,c). An entry is either UNDEFINED
+        or PREFIX if there is no such code or it starts a longer code.
+        The tables are lists, which itemgetter() indexes fastest.
+        """
+        (cids1, cids2) = self.fill_tables([self.UNDEFINED]*256, None)
+        self.set_tables(cids1, cids2)
+        return
+
+    def fill_tables(self, cids1, cids2):
+        """Puts the codes in the code2cid trie into the tables."""
+        for (b, v) in self.code2cid.items():
+            if isinstance(v, int):
+                cids1[b] = v
+                continue
+            cids1[b] = self.PREFIX
+            if cids2 is None:
+                cids2 = [self.UNDEFINED]*65536
+            for (c, cid) in v.items():
+                if isinstance(cid, int):
+                    cids2[b << 8 | c] = cid
+                else:
+                    cids2[b << 8 | c] = self.PREFIX
+        return (cids1, cids2)
+
+    def set_tables(self, cids1, cids2):
+        prefixes = bytes(b for b in range(256) if cids1[b] == self.PREFIX)
+        others = bytes(b for b in range(256) if cids1[b] != self.PREFIX)
+        self._tables = (cids1, cids2, prefixes, others)
         return
 
     def decode(self, code):
+        """Returns a list of CIDs for a byte string."""
         if self.debug:
             logging.debug('decode: %r, %r' % (self, code))
-        d = self.code2cid
-        for c in code:
-            if c in d:
-                d = d[c]
-                if isinstance(d, int):
-                    yield d
-                    d = self.code2cid
-            else:
-                d = self.code2cid
-        return
+        if self._tables is None:
+            self.compile()
+        (cids1, cids2, prefixes, others) = self._tables
+        PREFIX = self.PREFIX
+        n = len(code)
+        if n <= 16:
+            # short strings are faster to decode one by one.
+            keys = None
+        elif not code.translate(None, others):
+            # no prefix byte: all one-byte codes.
+            (keys, table) = (code, cids1)
+        elif n % 2 == 0 and not code[::2].translate(None, prefixes):
+            # every other byte is a prefix: all two-byte codes.
+            (keys, table) = (struct.unpack('>%dH' % (n//2), code), cids2)
+        else:
+            keys = None
+        if keys:
+            cids = list(itemgetter(*keys)(table))
+            if 0 <= min(cids):
+                return cids
+            if PREFIX not in cids:
+                return [cid for cid in cids if 0 <= cid]
+        cids = []
+        bytes_ = iter(code)
+        for b in bytes_:
+            cid = cids1[b]
+            if cid == PREFIX:
+                c = next(bytes_, None)
+                if c is None: break
+                cid = cids2[b << 8 | c]
+                if cid == PREFIX:
+                    cid = self.decode_long(b, c, bytes_)
+            if 0 <= cid:
+                cids.append(cid)
+        return cids
+
+    def decode_long(self, b, c, bytes_):
+        """Returns the CID of a code longer than two bytes.
+
+        The code starts with b and c, and the rest is read from bytes_.
+        """
+        d = self.code2cid[b][c]
+        for x in bytes_:
+            if x not in d: break
+            d = d[x]
+            if isinstance(d, int):
+                return d
+        return self.UNDEFINED
 
     def dump(self, out=sys.stdout, code2cid=None, code=None):
         if code2cid is None:
@@ -151,28 +260,110 @@ class UnicodeMap(CMapBase):
 
 ##  FileCMap
 ##
+##  Ranges of one- or two-byte codes are kept as (length, start, end, cid)
+##  in the order they are added, and individual codes in the trie.
+##
 class FileCMap(CMap):
 
+    def __init__(self, **kwargs):
+        CMap.__init__(self, **kwargs)
+        self.ranges = []
+        return
+
     def add_code2cid(self, code, cid):
         assert isinstance(code, bytes) and isinstance(cid, int)
         d = self.code2cid
         for c in code[:-1]:
-            c = ord(c)
             if c in d:
                 d = d[c]
             else:
                 t = {}
                 d[c] = t
                 d = t
-        c = ord(code[-1])
+        c = code[-1]
         d[c] = cid
+        self._tables = None
+        return
+
+    def add_code2cid_range(self, start, end, cid):
+        assert isinstance(start, bytes) and isinstance(end, bytes) and isinstance(cid, int)
+        length = len(start)
+        if 2 < length or start == end:
+            CMap.add_code2cid_range(self, start, end, cid)
+            return
+        (s1, e1) = (nunpack(start), nunpack(end))
+        if e1 < s1:
+            return
+        # the codes added before are overridden.
+        for b in range(s1 >> 8, (e1 >> 8)+1):
+            if length == 1:
+                d = self.code2cid
+            else:
+                d = self.code2cid.get(b)
+                if not isinstance(d, dict): continue
+            for c in [c for c in d if s1 <= (b << 8 | c if length == 2 else c) <= e1]:
+                del d[c]
+        self.ranges.append((length, s1, e1, cid))
+        self._tables = None
+        return
+
+    def compile(self):
+        cids1 = [self.UNDEFINED]*256
+        cids2 = None
+        for (length, start, end, cid) in self.ranges:
+            if length == 1:
+                cids1[start:end+1] = range(cid, cid+end-start+1)
+            else:
+                if cids2 is None:
+                    cids2 = [self.UNDEFINED]*65536
+                cids2[start:end+1] = range(cid, cid+end-start+1)
+                cids1[start >> 8:(end >> 8)+1] = [self.PREFIX]*((end >> 8)-(start >> 8)+1)
+        (cids1, cids2) = self.fill_tables(cids1, cids2)
+        self.set_tables(cids1, cids2)
+        return
+
+    def dump(self, out=sys.stdout, code2cid=None, code=None):
+        if code2cid is None:
+            for (length, start, end, cid) in self.ranges:
+                out.write('code %r-%r = cid %d-%d\n' %
+                          (start.to_bytes(length, 'big'), end.to_bytes(length, 'big'),
+                           cid, cid+end-start))
+        CMap.dump(self, out=out, code2cid=code2cid, code=code)
         return
 
 
 ##  FileUnicodeMap
 ##
+##  Ranges of CIDs are kept in an interval table (starts, ranges)
+##  sorted and without overlaps. A range (start, end, prefix, base, vlen)
+##  maps a CID to prefix + (base+cid-start) in vlen bytes as UTF-16BE.
+##  Each string is put in cid2unichr when it is first looked up.
+##
 class FileUnicodeMap(UnicodeMap):
 
+    def __init__(self, **kwargs):
+        UnicodeMap.__init__(self, **kwargs)
+        self.starts = []
+        self.ranges = []
+        return
+
+    def get_unichr(self, cid):
+        if self.debug:
+            logging.debug('get_unichr: %r, %r' % (self, cid))
+        if cid in self.cid2unichr:
+            return self.cid2unichr[cid]
+        i = bisect_right(self.starts, cid)-1
+        if 0 <= i:
+            (start, end, prefix, base, vlen) = self.ranges[i]
+            if cid <= end:
+                u = base+cid-start
+                if not prefix and vlen == 2 and not (0xd800 <= (u & 0xffff) < 0xe000):
+                    # a single UTF-16 code unit.
+                    return chr(u & 0xffff)
+                x = prefix+struct.pack('>L', u)[-vlen:]
+                return x.decode('UTF-16BE', 'ignore')
+        raise KeyError(cid)
+
     def add_cid2unichr(self, cid, code):
         assert isinstance(cid, int)
         if isinstance(code, PSLiteral):
@@ -187,6 +378,42 @@ class FileUnicodeMap(UnicodeMap):
             raise TypeError(code)
         return
 
+    def add_cid2unichr_range(self, start, end, code):
+        assert isinstance(start, int) and isinstance(end, int)
+        if not isinstance(code, bytes) or end <= start:
+            UnicodeMap.add_cid2unichr_range(self, start, end, code)
+            return
+        # the CIDs added before are overridden.
+        if len(self.cid2unichr) < end-start:
+            for cid in [cid for cid in self.cid2unichr if start <= cid <= end]:
+                del self.cid2unichr[cid]
+        else:
+            for cid in range(start, end+1):
+                self.cid2unichr.pop(cid, None)
+        var = code[-4:]
+        new = [(start, end, code[:-4], nunpack(var), len(var))]
+        i0 = i1 = max(0, bisect_right(self.starts, start)-1)
+        while i1 < len(self.ranges) and self.ranges[i1][0] <= end:
+            (s1, e1, prefix, base, vlen) = self.ranges[i1]
+            if end < s1 or e1 < start:
+                if i1 == i0:
+                    i0 += 1
+            else:
+                if s1 < start:
+                    new.insert(0, (s1, start-1, prefix, base, vlen))
+                if end < e1:
+                    new.append((end+1, e1, prefix, base+end+1-s1, vlen))
+            i1 += 1
+        self.ranges[i0:i1] = new
+        self.starts[i0:i1] = [r[0] for r in new]
+        return
+
+    def dump(self, out=sys.stdout):
+        for (start, end, prefix, base, vlen) in self.ranges:
+            out.write('cid %d-%d = code %r+%d\n' % (start, end, prefix, base))
+        UnicodeMap.dump(self, out=out)
+        return
+
 
 ##  PyCMap
 ##
@@ -214,24 +441,236 @@ class PyUnicodeMap(UnicodeMap):
         return
 
 
+##  Binary CMap format
+##
+##  Binary files are uncompressed and little-endian, so that they
+##  can be mapped into memory and shared among processes.
+##
+##  A CMap file (NAME.bin) has:
+##    header: magic, flags (bit 0: vertical), n1, n2, n3, n4
+##    for each code length L = 1..4:
+##      starts[nL], ends[nL] (uint32), cids[nL] (int32)
+##  Each (start, end, cid) is a run of L-byte codes that map to
+##  consecutive CIDs from cid, or that all start a longer code
+##  if cid is CMap.PREFIX.
+##
+##  A Unicode map file (to-unicode-REGISTRY.bin) has:
+##    header: magic, nh, nv
+##    codepoints_h[nh], codepoints_v[nv] (uint32, 0 if undefined)
+##
+BINARY_CMAP_MAGIC = b'PDFCMAP1'
+BINARY_CMAP_HEADER = '<8s5I'
+BINARY_UMAP_MAGIC = b'PDFUMAP1'
+BINARY_UMAP_HEADER = '<8s2I'
+
+# get_code_runs: returns the runs of each code length in a code2cid trie.
+def get_code_runs(code2cid):
+    codes = []
+
+    def walk(d, prefix, length):
+        assert length <= 4
+        for (k, v) in d.items():
+            code = prefix << 8 | k
+            if isinstance(v, int):
+                codes.append((length, code, v))
+            else:
+                codes.append((length, code, CMap.PREFIX))
+                walk(v, code, length+1)
+        return
+    walk(code2cid, 0, 1)
+    codes.sort()
+    runs = [[], [], [], []]
+    for (length, code, cid) in codes:
+        r = runs[length-1]
+        if r:
+            (start, end, cid0) = r[-1]
+            if code == end+1 and (
+                    (cid == cid0 == CMap.PREFIX) or
+                    (0 <= cid0 and cid == cid0+code-start)):
+                r[-1] = (start, code, cid0)
+                continue
+        r.append((code, code, cid))
+    return runs
+
+# write_binary_cmap
+def write_binary_cmap(fp, code2cid, vertical=False):
+    runs = get_code_runs(code2cid)
+    fp.write(struct.pack(BINARY_CMAP_HEADER, BINARY_CMAP_MAGIC,
+                         int(vertical), *map(len, runs)))
+    for r in runs:
+        n = len(r)
+        fp.write(struct.pack('<%dI' % n, *(start for (start, _, _) in r)))
+        fp.write(struct.pack('<%dI' % n, *(end for (_, end, _) in r)))
+        fp.write(struct.pack('<%di' % n, *(cid for (_, _, cid) in r)))
+    return
+
+# write_binary_unicodemap
+def write_binary_unicodemap(fp, cid2unichr_h, cid2unichr_v):
+    tables = []
+    for cid2unichr in (cid2unichr_h, cid2unichr_v):
+        codepoints = [0] * (max(cid2unichr, default=-1)+1)
+        for (cid, c) in cid2unichr.items():
+            codepoints[cid] = ord(c)
+        tables.append(codepoints)
+    fp.write(struct.pack(BINARY_UMAP_HEADER, BINARY_UMAP_MAGIC, *map(len, tables)))
+    for codepoints in tables:
+        fp.write(struct.pack('<%dI' % len(codepoints), *codepoints))
+    return
+
+# get_binary_array: returns a little-endian array in data as a sequence.
+def get_binary_array(data, offset, n, typecode):
+    a = memoryview(data)[offset:offset+n*4].cast(typecode)
+    if sys.byteorder != 'little':
+        a = array(typecode, a)
+        a.byteswap()
+    return a
+
+
+##  BinaryCMap
+##
+##  A CMap that reads the code runs from a binary file.
+##  The lookup tables are built from the runs on first use,
+##  and longer codes are searched in the runs directly.
+##
+class BinaryCMap(CMap):
+
+    def __init__(self, name, data):
+        CMapBase.__init__(self, CMapName=name)
+        (magic, flags, *counts) = struct.unpack_from(BINARY_CMAP_HEADER, data)
+        if magic != BINARY_CMAP_MAGIC:
+            raise CMapError('invalid binary cmap: %r' % name)
+        if flags & 1:
+            self.attrs['WMode'] = 1
+        self.runs = []
+        offset = struct.calcsize(BINARY_CMAP_HEADER)
+        for n in counts:
+            starts = get_binary_array(data, offset, n, 'I')
+            ends = get_binary_array(data, offset+n*4, n, 'I')
+            cids = get_binary_array(data, offset+n*8, n, 'i')
+            self.runs.append((starts, ends, cids))
+            offset += n*12
+        self._tables = None
+        self._code2cid = None
+        return
+
+    @property
+    def code2cid(self):
+        """Returns the code2cid trie, which is only built on demand."""
+        if self._code2cid is None:
+            code2cid = {}
+            for (length, (starts, ends, cids)) in enumerate(self.runs, start=1):
+                for (start, end, cid0) in zip(starts, ends, cids):
+                    for code in range(start, end+1):
+                        key = code.to_bytes(length, 'big')
+                        d = code2cid
+                        for b in key[:-1]:
+                            d = d[b]
+                        if cid0 == self.PREFIX:
+                            d[key[-1]] = {}
+                        else:
+                            d[key[-1]] = cid0+code-start
+            self._code2cid = code2cid
+        return self._code2cid
+
+    def compile(self):
+        # cids2 is needed even without two-byte runs
+        # as long as cids1 has a prefix.
+        cids1 = [self.UNDEFINED]*256
+        cids2 = [self.UNDEFINED]*65536
+        for (table, (starts, ends, cids)) in zip((cids1, cids2), self.runs):
+            for (start, end, cid0) in zip(starts, ends, cids):
+                if start == end:
+                    table[start] = cid0
+                elif cid0 == self.PREFIX:
+                    table[start:end+1] = [self.PREFIX]*(end-start+1)
+                else:
+                    table[start:end+1] = range(cid0, cid0+end-start+1)
+        self.set_tables(cids1, cids2)
+        return
+
+    def decode_long(self, b, c, bytes_):
+        code = b << 8 | c
+        for (starts, ends, cids) in self.runs[2:]:
+            x = next(bytes_, None)
+            if x is None: break
+            code = code << 8 | x
+            i = bisect_right(starts, code)-1
+            if i < 0 or ends[i] < code: break
+            cid = cids[i]
+            if cid != self.PREFIX:
+                return cid+code-starts[i]
+        return self.UNDEFINED
+
+
+##  BinaryUnicodeMap
+##
+class BinaryUnicodeMap(UnicodeMap):
+
+    def __init__(self, name, data, vertical):
+        CMapBase.__init__(self, CMapName=name)
+        (magic, nh, nv) = struct.unpack_from(BINARY_UMAP_HEADER, data)
+        if magic != BINARY_UMAP_MAGIC:
+            raise CMapError('invalid binary unicode map: %r' % name)
+        offset = struct.calcsize(BINARY_UMAP_HEADER)
+        if vertical:
+            self.codepoints = get_binary_array(data, offset+nh*4, nv, 'I')
+            self.attrs['WMode'] = 1
+        else:
+            self.codepoints = get_binary_array(data, offset, nh, 'I')
+        self._cid2unichr = None
+        return
+
+    @property
+    def cid2unichr(self):
+        """Returns the cid2unichr dict, which is only built on demand."""
+        if self._cid2unichr is None:
+            self._cid2unichr = dict(
+                (cid, chr(u)) for (cid, u) in enumerate(self.codepoints) if u)
+        return self._cid2unichr
+
+    def get_unichr(self, cid):
+        if self.debug:
+            logging.debug('get_unichr: %r, %r' % (self, cid))
+        if 0 <= cid < len(self.codepoints):
+            u = self.codepoints[cid]
+            if u:
+                return chr(u)
+        raise KeyError(cid)
+
+
 ##  CMapDB
 ##
 class CMapDB:
 
     _cmap_cache = {}
     _umap_cache = {}
+    _tounicode_cache = OrderedDict()
+    _tounicode_lock = threading.Lock()
+
+    # The number of parsed ToUnicode maps kept by get_tounicode_map().
+    tounicode_cache_size = 1000
+    tounicode_hits = 0
+    tounicode_misses = 0
 
     class CMapNotFound(CMapError):
         pass
 
     @classmethod
     def _load_data(klass, name):
-        filename = '%s.marshal.gz' % name
+        """Returns a memory-mapped binary file or a marshalled module."""
         logging.info('loading: %r' % name)
         cmap_paths = (os.environ.get('CMAP_PATH', '/usr/share/pdfminer/'),
                       os.path.join(os.path.dirname(__file__), 'cmap'),)
         for directory in cmap_paths:
-            path = os.path.join(directory, filename)
+            path = os.path.join(directory, '%s.bin' % name)
+            if os.path.exists(path):
+                with open(path, 'rb') as fp:
+                    try:
+                        return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                    except ValueError:
+                        # an empty file cannot be mapped.
+                        logging.warning('empty binary cmap: %r' % path)
+            path = os.path.join(directory, '%s.marshal.gz' % name)
             if os.path.exists(path):
                 gzfile = gzip.open(path)
                 try:
@@ -252,7 +691,11 @@ class CMapDB:
         except KeyError:
             pass
         data = klass._load_data(name)
-        klass._cmap_cache[name] = cmap = PyCMap(name, data)
+        if isinstance(data, mmap.mmap):
+            cmap = BinaryCMap(name, data)
+        else:
+            cmap = PyCMap(name, data)
+        klass._cmap_cache[name] = cmap
         return cmap
 
     @classmethod
@@ -262,9 +705,40 @@ class CMapDB:
         except KeyError:
             pass
         data = klass._load_data('to-unicode-%s' % name)
-        klass._umap_cache[name] = umaps = [PyUnicodeMap(name, data, v) for v in (False, True)]
+        if isinstance(data, mmap.mmap):
+            umaps = [BinaryUnicodeMap(name, data, v) for v in (False, True)]
+        else:
+            umaps = [PyUnicodeMap(name, data, v) for v in (False, True)]
+        klass._umap_cache[name] = umaps
         return umaps[vertical]
 
+    @classmethod
+    def get_tounicode_map(klass, data):
+        """Returns a FileUnicodeMap parsed from a ToUnicode stream.
+
+        Maps are cached by the hash of the stream data and shared
+        by all fonts (and threads) with the same data, so they must
+        not be modified. FileUnicodeMap is not changed by lookups.
+        """
+        key = hashlib.sha1(data).digest()
+        cache = klass._tounicode_cache
+        with klass._tounicode_lock:
+            umap = cache.get(key)
+            if umap is not None:
+                cache.move_to_end(key)
+                klass.tounicode_hits += 1
+                return umap
+            klass.tounicode_misses += 1
+        # Parse without the lock; another thread may store the same map.
+        umap = FileUnicodeMap()
+        CMapParser(umap, BytesIO(data)).run()
+        if 0 < klass.tounicode_cache_size:
+            with klass._tounicode_lock:
+                cache[key] = umap
+                while klass.tounicode_cache_size < len(cache):
+                    cache.popitem(last=False)
+        return umap
+
 
 ##  CMapParser
 ##
@@ -350,15 +824,7 @@ class CMapParser(PSStackParser):
                 eprefix = e[:-4]
                 if sprefix != eprefix:
                     continue
-                svar = s[-4:]
-                evar = e[-4:]
-                s1 = nunpack(svar)
-                e1 = nunpack(evar)
-                vlen = len(svar)
-                #assert s1 <= e1
-                for i in range(e1-s1+1):
-                    x = sprefix+struct.pack('>L', s1+i)[-vlen:]
-                    self.cmap.add_code2cid(x, cid+i)
+                self.cmap.add_code2cid_range(s, e, cid)
             return
 
         if token is self.KEYWORD_BEGINCIDCHAR:
@@ -387,13 +853,7 @@ class CMapParser(PSStackParser):
                     for i in range(e1-s1+1):
                         self.cmap.add_cid2unichr(s1+i, code[i])
                 else:
-                    var = code[-4:]
-                    base = nunpack(var)
-                    prefix = code[:-4]
-                    vlen = len(var)
-                    for i in range(e1-s1+1):
-                        x = prefix+struct.pack('>L', base+i)[-vlen:]
-                        self.cmap.add_cid2unichr(s1+i, x)
+                    self.cmap.add_cid2unichr_range(s1, e1, code)
             return
 
         if token is self.KEYWORD_BEGINBFCHAR:
@@ -560,8 +1020,17 @@ class CMapConverter:
         fp.write(marshal.dumps(data))
         return
 
+    def dump_cmap_binary(self, fp, enc):
+        write_binary_cmap(fp, self.code2cid.get(enc, {}),
+                          self.is_vertical.get(enc, False))
+        return
+
+    def dump_unicodemap_binary(self, fp):
+        write_binary_unicodemap(fp, self.cid2unichr_h, self.cid2unichr_v)
+        return
+
 # convert_cmap
-def convert_cmap(outdir, regname, enc2codec, paths):
+def convert_cmap(outdir, regname, enc2codec, paths, binary=False):
     converter = CMapConverter(enc2codec)
 
     for path in paths:
@@ -571,18 +1040,28 @@ def convert_cmap(outdir, regname, enc2codec, paths):
 
     files = []
     for enc in converter.get_encs():
-        fname = '%s.marshal.gz' % enc
-        path = os.path.join(outdir, fname)
-        print('writing: %r...' % path)
-        with gzip.open(path, 'wb') as fp:
-            converter.dump_cmap(fp, enc)
+        if binary:
+            path = os.path.join(outdir, '%s.bin' % enc)
+            print('writing: %r...' % path)
+            with open(path, 'wb') as fp:
+                converter.dump_cmap_binary(fp, enc)
+        else:
+            path = os.path.join(outdir, '%s.marshal.gz' % enc)
+            print('writing: %r...' % path)
+            with gzip.open(path, 'wb') as fp:
+                converter.dump_cmap(fp, enc)
         files.append(path)
 
-    fname = 'to-unicode-%s.marshal.gz' % regname
-    path = os.path.join(outdir, fname)
-    print('writing: %r...' % path)
-    with gzip.open(path, 'wb') as fp:
-        converter.dump_unicodemap(fp)
+    if binary:
+        path = os.path.join(outdir, 'to-unicode-%s.bin' % regname)
+        print('writing: %r...' % path)
+        with open(path, 'wb') as fp:
+            converter.dump_unicodemap_binary(fp)
+    else:
+        path = os.path.join(outdir, 'to-unicode-%s.marshal.gz' % regname)
+        print('writing: %r...' % path)
+        with gzip.open(path, 'wb') as fp:
+            converter.dump_unicodemap(fp)
     files.append(path)
     return files
 
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
-import logging
 import re
+from collections import namedtuple
 from .pdfdevice import PDFTextDevice
-from .pdffont import PDFUnicodeNotDefined
+from .pdfinterp import PDFResourceManager
+from .pdfinterp import PDFPageInterpreter
+from .pdfpage import PDFPage
 from .layout import LTContainer
 from .layout import LTPage
 from .layout import LTText
@@ -12,25 +14,40 @@ from .layout import LTCurve
 from .layout import LTFigure
 from .layout import LTImage
 from .layout import LTChar
+from .layout import LTCharStore
 from .layout import LTTextLine
 from .layout import LTTextBox
 from .layout import LTTextBoxVertical
 from .layout import LTTextGroup
+from .layout import get_char_geometry
+from .layout import get_run_geometry
 from .utils import apply_matrix_pt
 from .utils import mult_matrix
 from .utils import q
 from .utils import bbox2str
 
 
+# count_items: the number of layout items in an item, including itself.
+def count_items(item):
+    if isinstance(item, LTContainer):
+        return 1+sum(count_items(obj) for obj in item)
+    return 1
+
+
 ##  PDFLayoutAnalyzer
 ##
 class PDFLayoutAnalyzer(PDFTextDevice):
 
+    # charstore: keep the characters of each page in an LTCharStore.
+    charstore = False
+
     def __init__(self, rsrcmgr, pageno=1, laparams=None):
         PDFTextDevice.__init__(self, rsrcmgr)
         self.pageno = pageno
         self.laparams = laparams
         self._stack = []
+        self._charstore = None
+        self._lastfigure = None
         return
 
     def begin_page(self, page, ctm):
@@ -39,13 +56,15 @@ class PDFLayoutAnalyzer(PDFTextDevice):
         (x1, y1) = apply_matrix_pt(ctm, (x1, y1))
         mediabox = (0, 0, abs(x0-x1), abs(y0-y1))
         self.cur_item = LTPage(self.pageno, mediabox)
+        if self.charstore:
+            self._charstore = LTCharStore()
         return
 
     def end_page(self, page):
         assert not self._stack
         assert isinstance(self.cur_item, LTPage)
         if self.laparams is not None:
-            self.cur_item.analyze(self.laparams)
+            self.cur_item.analyze(self.laparams, self.budget)
         self.pageno += 1
         self.receive_layout(self.cur_item)
         return
@@ -60,6 +79,16 @@ class PDFLayoutAnalyzer(PDFTextDevice):
         assert isinstance(self.cur_item, LTFigure)
         self.cur_item = self._stack.pop()
         self.cur_item.add(fig)
+        self._lastfigure = fig
+        return
+
+    def save_figure(self):
+        # The page analysis changes the figure later, so keep a copy.
+        fig = self._lastfigure.moved(0, 0)
+        return (fig, count_items(fig))
+
+    def replay_figure(self, figure, dx, dy):
+        self.cur_item.add(figure.moved(dx, dy))
         return
 
     def render_image(self, name, stream):
@@ -103,22 +132,37 @@ class PDFLayoutAnalyzer(PDFTextDevice):
         self.cur_item.add(LTCurve(gstate.linewidth, pts))
         return
 
+    def render_glyph_run(self, textstate, cids, positions):
+        font = textstate.font
+        fontsize = textstate.fontsize
+        scaling = textstate.scaling * .01
+        (a, b, c, d, e, f) = mult_matrix(textstate.matrix, self.ctm)
+        # translate_matrix() for each position.
+        matrices = [(a, b, c, d, x*a+y*c+e, x*b+y*d+f) for (x, y) in positions]
+        texts = [self.get_char_text(font, cid) for cid in cids]
+        geometries = get_run_geometry(matrices, font, fontsize, scaling, textstate.rise,
+                                      map(font.char_width, cids), map(font.char_disp, cids))
+        if self._charstore is not None:
+            items = self._charstore.add_run(matrices, font.fontname, texts, geometries)
+        else:
+            fontname = font.fontname
+            items = [LTChar.from_geometry(m, fontname, text, geometry)
+                     for (m, text, geometry) in zip(matrices, texts, geometries)]
+        self.cur_item.extend(items)
+        return
+
     def render_char(self, matrix, font, fontsize, scaling, rise, cid):
-        try:
-            text = font.to_unichr(cid)
-            assert isinstance(text, str), text
-        except PDFUnicodeNotDefined:
-            text = self.handle_undefined_char(font, cid)
+        text = self.get_char_text(font, cid)
         textwidth = font.char_width(cid)
         textdisp = font.char_disp(cid)
-        item = LTChar(matrix, font, fontsize, scaling, rise, text, textwidth, textdisp)
+        if self._charstore is not None:
+            item = self._charstore.add(matrix, font, fontsize, scaling, rise,
+                                       text, textwidth, textdisp)
+        else:
+            item = LTChar(matrix, font, fontsize, scaling, rise, text, textwidth, textdisp)
         self.cur_item.add(item)
         return item.adv
 
-    def handle_undefined_char(self, font, cid):
-        logging.info('undefined: %r, %r' % (font, cid))
-        return f'(cid:{cid})'
-
     def receive_layout(self, ltpage):
         return
 
@@ -140,6 +184,99 @@ class PDFPageAggregator(PDFLayoutAnalyzer):
         return self.result
 
 
+##  GlyphRecorder
+##
+##  Keeps the characters of the current page in an LTCharStore
+##  without making layout objects. Lines, curves and images
+##  are ignored. The store of the last page is in self.result.
+##
+class GlyphRecorder(PDFLayoutAnalyzer):
+
+    def __init__(self, rsrcmgr, pageno=1):
+        PDFLayoutAnalyzer.__init__(self, rsrcmgr, pageno=pageno)
+        self.result = None
+        return
+
+    def begin_page(self, page, ctm):
+        PDFLayoutAnalyzer.begin_page(self, page, ctm)
+        self._charstore = LTCharStore()
+        return
+
+    def end_page(self, page):
+        assert not self._stack
+        self.result = self._charstore
+        self._charstore = None
+        self.pageno += 1
+        return
+
+    # Figures have no characters in them, so they cannot be replayed.
+    def save_figure(self):
+        return None
+
+    def render_image(self, name, stream):
+        return
+
+    def paint_path(self, gstate, stroke, fill, evenodd, path):
+        return
+
+    def render_glyph_run(self, textstate, cids, positions):
+        font = textstate.font
+        fontsize = textstate.fontsize
+        scaling = textstate.scaling * .01
+        (a, b, c, d, e, f) = mult_matrix(textstate.matrix, self.ctm)
+        matrices = [(a, b, c, d, x*a+y*c+e, x*b+y*d+f) for (x, y) in positions]
+        texts = [self.get_char_text(font, cid) for cid in cids]
+        geometries = get_run_geometry(matrices, font, fontsize, scaling, textstate.rise,
+                                      map(font.char_width, cids), map(font.char_disp, cids))
+        self._charstore.extend(matrices, font.fontname, texts, geometries)
+        return
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid):
+        text = self.get_char_text(font, cid)
+        geometry = get_char_geometry(matrix, font, fontsize, scaling, rise,
+                                     font.char_width(cid), font.char_disp(cid))
+        self._charstore.extend([matrix], font.fontname, [text], [geometry])
+        return geometry[0]
+
+
+# GlyphRecord: a character yielded by iter_glyphs().
+GlyphRecord = namedtuple('GlyphRecord',
+                         'pageno text x0 y0 x1 y1 fontname size upright')
+
+
+# iter_glyphs: yields the characters of a document page by page.
+#   Each character is a GlyphRecord; pageno starts from 1.
+#   With columns=True, yields (pageno, charstore) for each page
+#   instead. The numeric columns of an LTCharStore are arrays
+#   (bboxes has x0, y0, x1, y1 for each character), so they can be
+#   passed to numpy.frombuffer() without copying.
+#   Only the characters of the current page are kept.
+def iter_glyphs(doc, pagenos=None, maxpages=0, rsrcmgr=None, columns=False):
+    if rsrcmgr is None:
+        rsrcmgr = PDFResourceManager()
+    device = GlyphRecorder(rsrcmgr)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    for (i, page) in enumerate(PDFPage.create_pages(doc)):
+        if pagenos and (i not in pagenos):
+            continue
+        interpreter.process_page(page)
+        (store, device.result) = (device.result, None)
+        pageno = i+1
+        if columns:
+            yield (pageno, store)
+        else:
+            (texts, bboxes, sizes, uprights) = (store.texts, store.bboxes,
+                                                store.sizes, store.uprights)
+            fontnames = [store.fontnames[fontid] for fontid in store.fontids]
+            for j in range(len(texts)):
+                (x0, y0, x1, y1) = bboxes[j*4:j*4+4]
+                yield GlyphRecord(pageno, texts[j], x0, y0, x1, y1,
+                                  fontnames[j], sizes[j], bool(uprights[j]))
+        if maxpages and maxpages <= i+1:
+            break
+    return
+
+
 ##  PDFConverter
 ##
 class PDFConverter(PDFLayoutAnalyzer):
@@ -154,11 +291,15 @@ class PDFConverter(PDFLayoutAnalyzer):
 ##
 class TextConverter(PDFConverter):
 
+    capabilities = ('text',)
+
     def __init__(self, rsrcmgr, outfp, pageno=1, laparams=None,
                  showpageno=False, imagewriter=None):
         PDFConverter.__init__(self, rsrcmgr, outfp, pageno=pageno, laparams=laparams)
         self.showpageno = showpageno
         self.imagewriter = imagewriter
+        if imagewriter is not None:
+            self.capabilities = ('text', 'images')
         return
 
     def write_text(self, text):
@@ -196,6 +337,100 @@ class TextConverter(PDFConverter):
         return
 
 
+##  FastTextConverter
+##
+##  Writes the text of each string as soon as it is shown, without
+##  building layout objects. Spaces and newlines are guessed from the
+##  distance between consecutive glyphs and strings.
+##  The text comes out in the order of the content stream: columns,
+##  tables and text drawn out of order are not rearranged as
+##  TextConverter does with LAParams, and overprinted text is repeated.
+##
+class FastTextConverter(PDFTextDevice):
+
+    capabilities = ('text',)
+
+    # word_margin: a gap wider than this (in em) is a space.
+    # line_margin: a baseline shift larger than this (in em) is a newline.
+    def __init__(self, rsrcmgr, outfp, pageno=1, showpageno=False,
+                 word_margin=.2, line_margin=.5):
+        PDFTextDevice.__init__(self, rsrcmgr)
+        self.outfp = outfp
+        self.pageno = pageno
+        self.showpageno = showpageno
+        self.word_margin = word_margin
+        self.line_margin = line_margin
+        # the end of the last string and whether it ended with a space.
+        self._lastpos = None
+        self._lastspace = False
+        return
+
+    def write_text(self, text):
+        self.outfp.write(text)
+        return
+
+    def begin_page(self, page, ctm):
+        if self.showpageno:
+            self.write_text('Page %s\n' % self.pageno)
+        self._lastpos = None
+        self._lastspace = False
+        return
+
+    def end_page(self, page):
+        if self._lastpos is not None:
+            self.write_text('\n')
+        self.write_text('\f')
+        self.pageno += 1
+        return
+
+    def render_glyph_run(self, textstate, cids, positions):
+        font = textstate.font
+        fontsize = textstate.fontsize
+        scaling = textstate.scaling * .01
+        vertical = font.is_vertical()
+        (a, b, c, d, e, f) = mult_matrix(textstate.matrix, self.ctm)
+        # (ux, uy): the direction of the text in device space.
+        if vertical:
+            (ux, uy) = (-c, -d)
+        else:
+            (ux, uy) = (a, b)
+        em = (ux*ux+uy*uy)**.5 * fontsize
+        if em == 0:
+            return
+        (ux, uy) = (ux*fontsize/em, uy*fontsize/em)
+        # a gap between two glyphs wider than word_margin is a space.
+        # Vertical text advances downward.
+        (i, sign) = (1, -1) if vertical else (0, 1)
+        margin = self.word_margin * fontsize
+        texts = []
+        end = None
+        for (cid, pos) in zip(cids, positions):
+            text = self.get_char_text(font, cid)
+            if (end is not None and margin < (pos[i]-end)*sign and
+                text != ' ' and not texts[-1].endswith(' ')):
+                texts.append(' ')
+            texts.append(text)
+            end = pos[i] + font.char_width(cid) * fontsize * scaling
+        # the start and the end of the string in device space.
+        (x, y) = positions[0]
+        (x1, y1) = textstate.linematrix
+        (sx, sy) = (x*a+y*c+e, x*b+y*d+f)
+        (ex, ey) = (x1*a+y1*c+e, x1*b+y1*d+f)
+        if self._lastpos is not None:
+            (dx, dy) = (sx-self._lastpos[0], sy-self._lastpos[1])
+            along = dx*ux+dy*uy
+            across = dx*uy-dy*ux
+            if self.line_margin*em < abs(across) or along < -em:
+                self.write_text('\n')
+            elif self.word_margin*em < along and not self._lastspace and texts[0] != ' ':
+                self.write_text(' ')
+        text = ''.join(texts)
+        self.write_text(text)
+        self._lastpos = (ex, ey)
+        self._lastspace = text.endswith(' ')
+        return
+
+
 ##  HTMLConverter
 ##
 class HTMLConverter(PDFConverter):
@@ -1,17 +1,33 @@
 #!/usr/bin/env python
 import re
 from .psparser import PSLiteral
-from .glyphlist import glyphname2unicode
-from .latin_enc import ENCODING
 
 
 STRIP_NAME = re.compile(r'[0-9]+')
 
+# The glyph list is large; it is imported on the first use.
+_glyphname2unicode = None
+
+def get_glyphname2unicode():
+    global _glyphname2unicode
+    if _glyphname2unicode is None:
+        from .glyphlist import glyphname2unicode
+        _glyphname2unicode = glyphname2unicode
+    return _glyphname2unicode
+
+# glyphname2unicode: loaded on access.
+# Module __getattr__ (PEP 562) needs Python 3.7.
+def __getattr__(name):
+    if name == 'glyphname2unicode':
+        return get_glyphname2unicode()
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
 
 ##  name2unicode
 ##
 def name2unicode(name):
     """Converts Adobe glyph names to Unicode numbers."""
+    glyphname2unicode = _glyphname2unicode or get_glyphname2unicode()
     if name in glyphname2unicode:
         return glyphname2unicode[name]
     m = STRIP_NAME.search(name)
@@ -24,30 +40,48 @@ def name2unicode(name):
 ##
 class EncodingDB:
 
-    std2unicode = {}
-    mac2unicode = {}
-    win2unicode = {}
-    pdf2unicode = {}
-    for (name, std, mac, win, pdf) in ENCODING:
-        c = name2unicode(name)
-        if std:
-            std2unicode[std] = c
-        if mac:
-            mac2unicode[mac] = c
-        if win:
-            win2unicode[win] = c
-        if pdf:
-            pdf2unicode[pdf] = c
+    # The tables are built on the first use.
+    # std2unicode, mac2unicode, win2unicode and pdf2unicode
+    # are None until load() is called.
+    encodings = None
+    std2unicode = None
+    mac2unicode = None
+    win2unicode = None
+    pdf2unicode = None
 
-    encodings = {
-        'StandardEncoding': std2unicode,
-        'MacRomanEncoding': mac2unicode,
-        'WinAnsiEncoding': win2unicode,
-        'PDFDocEncoding': pdf2unicode,
-    }
+    @classmethod
+    def load(klass):
+        from .latin_enc import ENCODING
+        std2unicode = {}
+        mac2unicode = {}
+        win2unicode = {}
+        pdf2unicode = {}
+        for (name, std, mac, win, pdf) in ENCODING:
+            c = name2unicode(name)
+            if std:
+                std2unicode[std] = c
+            if mac:
+                mac2unicode[mac] = c
+            if win:
+                win2unicode[win] = c
+            if pdf:
+                pdf2unicode[pdf] = c
+        klass.std2unicode = std2unicode
+        klass.mac2unicode = mac2unicode
+        klass.win2unicode = win2unicode
+        klass.pdf2unicode = pdf2unicode
+        klass.encodings = {
+            'StandardEncoding': std2unicode,
+            'MacRomanEncoding': mac2unicode,
+            'WinAnsiEncoding': win2unicode,
+            'PDFDocEncoding': pdf2unicode,
+        }
+        return
 
     @classmethod
     def get_encoding(klass, name, diff=None):
+        if klass.encodings is None:
+            klass.load()
         cid2unicode = klass.encodings.get(name, klass.std2unicode)
         if diff:
             cid2unicode = cid2unicode.copy()
@@ -4,6 +4,10 @@
 
 Font metrics are used to compute the boundary of each character
 written with a proportional font.
+Each font is stored as (descriptor, chars, widths), where widths
+is a packed array of little-endian unsigned shorts in the order of
+chars. Use get_font_metrics() to get the descriptor and the
+width of each character.
 
 The following data were extracted from the AFM files:
 
@@ -28,19 +32,65 @@ The following data were extracted from the AFM files:
 
 ###  END Verbatim copy of the license part
 
-FONT_METRICS = {
- 'Courier': ({'FontName': 'Courier', 'Descent': -194.0, 'FontBBox': (-6.0, -249.0, 639.0, 803.0), 'FontWeight': 'Medium', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': 0.0, 'Ascent': 627.0}, {u' ': 600, u'!': 600, u'"': 600, u'#': 600, u'$': 600, u'%': 600, u'&': 600, u"'": 600, u'(': 600, u')': 600, u'*': 600, u'+': 600, u',': 600, u'-': 600, u'.': 600, u'/': 600, u'0': 600, u'1': 600, u'2': 600, u'3': 600, u'4': 600, u'5': 600, u'6': 600, u'7': 600, u'8': 600, u'9': 600, u':': 600, u';': 600, u'<': 600, u'=': 600, u'>': 600, u'?': 600, u'@': 600, u'A': 600, u'B': 600, u'C': 600, u'D': 600, u'E': 600, u'F': 600, u'G': 600, u'H': 600, u'I': 600, u'J': 600, u'K': 600, u'L': 600, u'M': 600, u'N': 600, u'O': 600, u'P': 600, u'Q': 600, u'R': 600, u'S': 600, u'T': 600, u'U': 600, u'V': 600, u'W': 600, u'X': 600, u'Y': 600, u'Z': 600, u'[': 600, u'\\': 600, u']': 600, u'^': 600, u'_': 600, u'`': 600, u'a': 600, u'b': 600, u'c': 600, u'd': 600, u'e': 600, u'f': 600, u'g': 600, u'h': 600, u'i': 600, u'j': 600, u'k': 600, u'l': 600, u'm': 600, u'n': 600, u'o': 600, u'p': 600, u'q': 600, u'r': 600, u's': 600, u't': 600, u'u': 600, u'v': 600, u'w': 600, u'x': 600, u'y': 600, u'z': 600, u'{': 600, u'|': 600, u'}': 600, u'~': 600, u'\xa1': 600, u'\xa2': 600, u'\xa3': 600, u'\xa4': 600, u'\xa5': 600, u'\xa6': 600, u'\xa7': 600, u'\xa8': 600, u'\xa9': 600, u'\xaa': 600, u'\xab': 600, u'\xac': 600, u'\xae': 600, u'\xaf': 600, u'\xb0': 600, u'\xb1': 600, u'\xb2': 600, u'\xb3': 600, u'\xb4': 600, u'\xb5': 600, u'\xb6': 600, u'\xb7': 600, u'\xb8': 600, u'\xb9': 600, u'\xba': 600, u'\xbb': 600, u'\xbc': 600, u'\xbd': 600, u'\xbe': 600, u'\xbf': 600, u'\xc0': 600, u'\xc1': 600, u'\xc2': 600, u'\xc3': 600, u'\xc4': 600, u'\xc5': 600, u'\xc6': 600, u'\xc7': 600, u'\xc8': 600, u'\xc9': 600, u'\xca': 600, u'\xcb': 600, u'\xcc': 600, u'\xcd': 600, u'\xce': 600, u'\xcf': 600, u'\xd0': 600, u'\xd1': 600, u'\xd2': 600, u'\xd3': 600, u'\xd4': 600, u'\xd5': 600, u'\xd6': 600, u'\xd7': 600, u'\xd8': 600, u'\xd9': 600, u'\xda': 600, u'\xdb': 600, u'\xdc': 600, u'\xdd': 600, u'\xde': 600, u'\xdf': 600, u'\xe0': 600, u'\xe1': 600, u'\xe2': 600, u'\xe3': 600, u'\xe4': 600, u'\xe5': 600, u'\xe6': 600, u'\xe7': 600, u'\xe8': 600, u'\xe9': 600, u'\xea': 600, u'\xeb': 600, u'\xec': 600, u'\xed': 600, u'\xee': 600, u'\xef': 600, u'\xf0': 600, u'\xf1': 600, u'\xf2': 600, u'\xf3': 600, u'\xf4': 600, u'\xf5': 600, u'\xf6': 600, u'\xf7': 600, u'\xf8': 600, u'\xf9': 600, u'\xfa': 600, u'\xfb': 600, u'\xfc': 600, u'\xfd': 600, u'\xfe': 600, u'\xff': 600, u'\u0100': 600, u'\u0101': 600, u'\u0102': 600, u'\u0103': 600, u'\u0104': 600, u'\u0105': 600, u'\u0106': 600, u'\u0107': 600, u'\u010c': 600, u'\u010d': 600, u'\u010e': 600, u'\u010f': 600, u'\u0110': 600, u'\u0111': 600, u'\u0112': 600, u'\u0113': 600, u'\u0116': 600, u'\u0117': 600, u'\u0118': 600, u'\u0119': 600, u'\u011a': 600, u'\u011b': 600, u'\u011e': 600, u'\u011f': 600, u'\u0122': 600, u'\u0123': 600, u'\u012a': 600, u'\u012b': 600, u'\u012e': 600, u'\u012f': 600, u'\u0130': 600, u'\u0131': 600, u'\u0136': 600, u'\u0137': 600, u'\u0139': 600, u'\u013a': 600, u'\u013b': 600, u'\u013c': 600, u'\u013d': 600, u'\u013e': 600, u'\u0141': 600, u'\u0142': 600, u'\u0143': 600, u'\u0144': 600, u'\u0145': 600, u'\u0146': 600, u'\u0147': 600, u'\u0148': 600, u'\u014c': 600, u'\u014d': 600, u'\u0150': 600, u'\u0151': 600, u'\u0152': 600, u'\u0153': 600, u'\u0154': 600, u'\u0155': 600, u'\u0156': 600, u'\u0157': 600, u'\u0158': 600, u'\u0159': 600, u'\u015a': 600, u'\u015b': 600, u'\u015e': 600, u'\u015f': 600, u'\u0160': 600, u'\u0161': 600, u'\u0162': 600, u'\u0163': 600, u'\u0164': 600, u'\u0165': 600, u'\u016a': 600, u'\u016b': 600, u'\u016e': 600, u'\u016f': 600, u'\u0170': 600, u'\u0171': 600, u'\u0172': 600, u'\u0173': 600, u'\u0178': 600, u'\u0179': 600, u'\u017a': 600, u'\u017b': 600, u'\u017c': 600, u'\u017d': 600, u'\u017e': 600, u'\u0192': 600, u'\u0218': 600, u'\u0219': 600, u'\u02c6': 600, u'\u02c7': 600, u'\u02d8': 600, u'\u02d9': 600, u'\u02da': 600, u'\u02db': 600, u'\u02dc': 600, u'\u02dd': 600, u'\u2013': 600, u'\u2014': 600, u'\u2018': 600, u'\u2019': 600, u'\u201a': 600, u'\u201c': 600, u'\u201d': 600, u'\u201e': 600, u'\u2020': 600, u'\u2021': 600, u'\u2022': 600, u'\u2026': 600, u'\u2030': 600, u'\u2039': 600, u'\u203a': 600, u'\u2044': 600, u'\u2122': 600, u'\u2202': 600, u'\u2206': 600, u'\u2211': 600, u'\u2212': 600, u'\u221a': 600, u'\u2260': 600, u'\u2264': 600, u'\u2265': 600, u'\u25ca': 600, u'\uf6c3': 600, u'\ufb01': 600, u'\ufb02': 600}),
- 'Courier-Bold': ({'FontName': 'Courier-Bold', 'Descent': -194.0, 'FontBBox': (-88.0, -249.0, 697.0, 811.0), 'FontWeight': 'Bold', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': 0.0, 'Ascent': 627.0}, {u' ': 600, u'!': 600, u'"': 600, u'#': 600, u'$': 600, u'%': 600, u'&': 600, u"'": 600, u'(': 600, u')': 600, u'*': 600, u'+': 600, u',': 600, u'-': 600, u'.': 600, u'/': 600, u'0': 600, u'1': 600, u'2': 600, u'3': 600, u'4': 600, u'5': 600, u'6': 600, u'7': 600, u'8': 600, u'9': 600, u':': 600, u';': 600, u'<': 600, u'=': 600, u'>': 600, u'?': 600, u'@': 600, u'A': 600, u'B': 600, u'C': 600, u'D': 600, u'E': 600, u'F': 600, u'G': 600, u'H': 600, u'I': 600, u'J': 600, u'K': 600, u'L': 600, u'M': 600, u'N': 600, u'O': 600, u'P': 600, u'Q': 600, u'R': 600, u'S': 600, u'T': 600, u'U': 600, u'V': 600, u'W': 600, u'X': 600, u'Y': 600, u'Z': 600, u'[': 600, u'\\': 600, u']': 600, u'^': 600, u'_': 600, u'`': 600, u'a': 600, u'b': 600, u'c': 600, u'd': 600, u'e': 600, u'f': 600, u'g': 600, u'h': 600, u'i': 600, u'j': 600, u'k': 600, u'l': 600, u'm': 600, u'n': 600, u'o': 600, u'p': 600, u'q': 600, u'r': 600, u's': 600, u't': 600, u'u': 600, u'v': 600, u'w': 600, u'x': 600, u'y': 600, u'z': 600, u'{': 600, u'|': 600, u'}': 600, u'~': 600, u'\xa1': 600, u'\xa2': 600, u'\xa3': 600, u'\xa4': 600, u'\xa5': 600, u'\xa6': 600, u'\xa7': 600, u'\xa8': 600, u'\xa9': 600, u'\xaa': 600, u'\xab': 600, u'\xac': 600, u'\xae': 600, u'\xaf': 600, u'\xb0': 600, u'\xb1': 600, u'\xb2': 600, u'\xb3': 600, u'\xb4': 600, u'\xb5': 600, u'\xb6': 600, u'\xb7': 600, u'\xb8': 600, u'\xb9': 600, u'\xba': 600, u'\xbb': 600, u'\xbc': 600, u'\xbd': 600, u'\xbe': 600, u'\xbf': 600, u'\xc0': 600, u'\xc1': 600, u'\xc2': 600, u'\xc3': 600, u'\xc4': 600, u'\xc5': 600, u'\xc6': 600, u'\xc7': 600, u'\xc8': 600, u'\xc9': 600, u'\xca': 600, u'\xcb': 600, u'\xcc': 600, u'\xcd': 600, u'\xce': 600, u'\xcf': 600, u'\xd0': 600, u'\xd1': 600, u'\xd2': 600, u'\xd3': 600, u'\xd4': 600, u'\xd5': 600, u'\xd6': 600, u'\xd7': 600, u'\xd8': 600, u'\xd9': 600, u'\xda': 600, u'\xdb': 600, u'\xdc': 600, u'\xdd': 600, u'\xde': 600, u'\xdf': 600, u'\xe0': 600, u'\xe1': 600, u'\xe2': 600, u'\xe3': 600, u'\xe4': 600, u'\xe5': 600, u'\xe6': 600, u'\xe7': 600, u'\xe8': 600, u'\xe9': 600, u'\xea': 600, u'\xeb': 600, u'\xec': 600, u'\xed': 600, u'\xee': 600, u'\xef': 600, u'\xf0': 600, u'\xf1': 600, u'\xf2': 600, u'\xf3': 600, u'\xf4': 600, u'\xf5': 600, u'\xf6': 600, u'\xf7': 600, u'\xf8': 600, u'\xf9': 600, u'\xfa': 600, u'\xfb': 600, u'\xfc': 600, u'\xfd': 600, u'\xfe': 600, u'\xff': 600, u'\u0100': 600, u'\u0101': 600, u'\u0102': 600, u'\u0103': 600, u'\u0104': 600, u'\u0105': 600, u'\u0106': 600, u'\u0107': 600, u'\u010c': 600, u'\u010d': 600, u'\u010e': 600, u'\u010f': 600, u'\u0110': 600, u'\u0111': 600, u'\u0112': 600, u'\u0113': 600, u'\u0116': 600, u'\u0117': 600, u'\u0118': 600, u'\u0119': 600, u'\u011a': 600, u'\u011b': 600, u'\u011e': 600, u'\u011f': 600, u'\u0122': 600, u'\u0123': 600, u'\u012a': 600, u'\u012b': 600, u'\u012e': 600, u'\u012f': 600, u'\u0130': 600, u'\u0131': 600, u'\u0136': 600, u'\u0137': 600, u'\u0139': 600, u'\u013a': 600, u'\u013b': 600, u'\u013c': 600, u'\u013d': 600, u'\u013e': 600, u'\u0141': 600, u'\u0142': 600, u'\u0143': 600, u'\u0144': 600, u'\u0145': 600, u'\u0146': 600, u'\u0147': 600, u'\u0148': 600, u'\u014c': 600, u'\u014d': 600, u'\u0150': 600, u'\u0151': 600, u'\u0152': 600, u'\u0153': 600, u'\u0154': 600, u'\u0155': 600, u'\u0156': 600, u'\u0157': 600, u'\u0158': 600, u'\u0159': 600, u'\u015a': 600, u'\u015b': 600, u'\u015e': 600, u'\u015f': 600, u'\u0160': 600, u'\u0161': 600, u'\u0162': 600, u'\u0163': 600, u'\u0164': 600, u'\u0165': 600, u'\u016a': 600, u'\u016b': 600, u'\u016e': 600, u'\u016f': 600, u'\u0170': 600, u'\u0171': 600, u'\u0172': 600, u'\u0173': 600, u'\u0178': 600, u'\u0179': 600, u'\u017a': 600, u'\u017b': 600, u'\u017c': 600, u'\u017d': 600, u'\u017e': 600, u'\u0192': 600, u'\u0218': 600, u'\u0219': 600, u'\u02c6': 600, u'\u02c7': 600, u'\u02d8': 600, u'\u02d9': 600, u'\u02da': 600, u'\u02db': 600, u'\u02dc': 600, u'\u02dd': 600, u'\u2013': 600, u'\u2014': 600, u'\u2018': 600, u'\u2019': 600, u'\u201a': 600, u'\u201c': 600, u'\u201d': 600, u'\u201e': 600, u'\u2020': 600, u'\u2021': 600, u'\u2022': 600, u'\u2026': 600, u'\u2030': 600, u'\u2039': 600, u'\u203a': 600, u'\u2044': 600, u'\u2122': 600, u'\u2202': 600, u'\u2206': 600, u'\u2211': 600, u'\u2212': 600, u'\u221a': 600, u'\u2260': 600, u'\u2264': 600, u'\u2265': 600, u'\u25ca': 600, u'\uf6c3': 600, u'\ufb01': 600, u'\ufb02': 600}),
- 'Courier-BoldOblique': ({'FontName': 'Courier-BoldOblique', 'Descent': -194.0, 'FontBBox': (-49.0, -249.0, 758.0, 811.0), 'FontWeight': 'Bold', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': -11.0, 'Ascent': 627.0}, {u' ': 600, u'!': 600, u'"': 600, u'#': 600, u'$': 600, u'%': 600, u'&': 600, u"'": 600, u'(': 600, u')': 600, u'*': 600, u'+': 600, u',': 600, u'-': 600, u'.': 600, u'/': 600, u'0': 600, u'1': 600, u'2': 600, u'3': 600, u'4': 600, u'5': 600, u'6': 600, u'7': 600, u'8': 600, u'9': 600, u':': 600, u';': 600, u'<': 600, u'=': 600, u'>': 600, u'?': 600, u'@': 600, u'A': 600, u'B': 600, u'C': 600, u'D': 600, u'E': 600, u'F': 600, u'G': 600, u'H': 600, u'I': 600, u'J': 600, u'K': 600, u'L': 600, u'M': 600, u'N': 600, u'O': 600, u'P': 600, u'Q': 600, u'R': 600, u'S': 600, u'T': 600, u'U': 600, u'V': 600, u'W': 600, u'X': 600, u'Y': 600, u'Z': 600, u'[': 600, u'\\': 600, u']': 600, u'^': 600, u'_': 600, u'`': 600, u'a': 600, u'b': 600, u'c': 600, u'd': 600, u'e': 600, u'f': 600, u'g': 600, u'h': 600, u'i': 600, u'j': 600, u'k': 600, u'l': 600, u'm': 600, u'n': 600, u'o': 600, u'p': 600, u'q': 600, u'r': 600, u's': 600, u't': 600, u'u': 600, u'v': 600, u'w': 600, u'x': 600, u'y': 600, u'z': 600, u'{': 600, u'|': 600, u'}': 600, u'~': 600, u'\xa1': 600, u'\xa2': 600, u'\xa3': 600, u'\xa4': 600, u'\xa5': 600, u'\xa6': 600, u'\xa7': 600, u'\xa8': 600, u'\xa9': 600, u'\xaa': 600, u'\xab': 600, u'\xac': 600, u'\xae': 600, u'\xaf': 600, u'\xb0': 600, u'\xb1': 600, u'\xb2': 600, u'\xb3': 600, u'\xb4': 600, u'\xb5': 600, u'\xb6': 600, u'\xb7': 600, u'\xb8': 600, u'\xb9': 600, u'\xba': 600, u'\xbb': 600, u'\xbc': 600, u'\xbd': 600, u'\xbe': 600, u'\xbf': 600, u'\xc0': 600, u'\xc1': 600, u'\xc2': 600, u'\xc3': 600, u'\xc4': 600, u'\xc5': 600, u'\xc6': 600, u'\xc7': 600, u'\xc8': 600, u'\xc9': 600, u'\xca': 600, u'\xcb': 600, u'\xcc': 600, u'\xcd': 600, u'\xce': 600, u'\xcf': 600, u'\xd0': 600, u'\xd1': 600, u'\xd2': 600, u'\xd3': 600, u'\xd4': 600, u'\xd5': 600, u'\xd6': 600, u'\xd7': 600, u'\xd8': 600, u'\xd9': 600, u'\xda': 600, u'\xdb': 600, u'\xdc': 600, u'\xdd': 600, u'\xde': 600, u'\xdf': 600, u'\xe0': 600, u'\xe1': 600, u'\xe2': 600, u'\xe3': 600, u'\xe4': 600, u'\xe5': 600, u'\xe6': 600, u'\xe7': 600, u'\xe8': 600, u'\xe9': 600, u'\xea': 600, u'\xeb': 600, u'\xec': 600, u'\xed': 600, u'\xee': 600, u'\xef': 600, u'\xf0': 600, u'\xf1': 600, u'\xf2': 600, u'\xf3': 600, u'\xf4': 600, u'\xf5': 600, u'\xf6': 600, u'\xf7': 600, u'\xf8': 600, u'\xf9': 600, u'\xfa': 600, u'\xfb': 600, u'\xfc': 600, u'\xfd': 600, u'\xfe': 600, u'\xff': 600, u'\u0100': 600, u'\u0101': 600, u'\u0102': 600, u'\u0103': 600, u'\u0104': 600, u'\u0105': 600, u'\u0106': 600, u'\u0107': 600, u'\u010c': 600, u'\u010d': 600, u'\u010e': 600, u'\u010f': 600, u'\u0110': 600, u'\u0111': 600, u'\u0112': 600, u'\u0113': 600, u'\u0116': 600, u'\u0117': 600, u'\u0118': 600, u'\u0119': 600, u'\u011a': 600, u'\u011b': 600, u'\u011e': 600, u'\u011f': 600, u'\u0122': 600, u'\u0123': 600, u'\u012a': 600, u'\u012b': 600, u'\u012e': 600, u'\u012f': 600, u'\u0130': 600, u'\u0131': 600, u'\u0136': 600, u'\u0137': 600, u'\u0139': 600, u'\u013a': 600, u'\u013b': 600, u'\u013c': 600, u'\u013d': 600, u'\u013e': 600, u'\u0141': 600, u'\u0142': 600, u'\u0143': 600, u'\u0144': 600, u'\u0145': 600, u'\u0146': 600, u'\u0147': 600, u'\u0148': 600, u'\u014c': 600, u'\u014d': 600, u'\u0150': 600, u'\u0151': 600, u'\u0152': 600, u'\u0153': 600, u'\u0154': 600, u'\u0155': 600, u'\u0156': 600, u'\u0157': 600, u'\u0158': 600, u'\u0159': 600, u'\u015a': 600, u'\u015b': 600, u'\u015e': 600, u'\u015f': 600, u'\u0160': 600, u'\u0161': 600, u'\u0162': 600, u'\u0163': 600, u'\u0164': 600, u'\u0165': 600, u'\u016a': 600, u'\u016b': 600, u'\u016e': 600, u'\u016f': 600, u'\u0170': 600, u'\u0171': 600, u'\u0172': 600, u'\u0173': 600, u'\u0178': 600, u'\u0179': 600, u'\u017a': 600, u'\u017b': 600, u'\u017c': 600, u'\u017d': 600, u'\u017e': 600, u'\u0192': 600, u'\u0218': 600, u'\u0219': 600, u'\u02c6': 600, u'\u02c7': 600, u'\u02d8': 600, u'\u02d9': 600, u'\u02da': 600, u'\u02db': 600, u'\u02dc': 600, u'\u02dd': 600, u'\u2013': 600, u'\u2014': 600, u'\u2018': 600, u'\u2019': 600, u'\u201a': 600, u'\u201c': 600, u'\u201d': 600, u'\u201e': 600, u'\u2020': 600, u'\u2021': 600, u'\u2022': 600, u'\u2026': 600, u'\u2030': 600, u'\u2039': 600, u'\u203a': 600, u'\u2044': 600, u'\u2122': 600, u'\u2202': 600, u'\u2206': 600, u'\u2211': 600, u'\u2212': 600, u'\u221a': 600, u'\u2260': 600, u'\u2264': 600, u'\u2265': 600, u'\u25ca': 600, u'\uf6c3': 600, u'\ufb01': 600, u'\ufb02': 600}),
- 'Courier-Oblique': ({'FontName': 'Courier-Oblique', 'Descent': -194.0, 'FontBBox': (-49.0, -249.0, 749.0, 803.0), 'FontWeight': 'Medium', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': -11.0, 'Ascent': 627.0}, {u' ': 600, u'!': 600, u'"': 600, u'#': 600, u'$': 600, u'%': 600, u'&': 600, u"'": 600, u'(': 600, u')': 600, u'*': 600, u'+': 600, u',': 600, u'-': 600, u'.': 600, u'/': 600, u'0': 600, u'1': 600, u'2': 600, u'3': 600, u'4': 600, u'5': 600, u'6': 600, u'7': 600, u'8': 600, u'9': 600, u':': 600, u';': 600, u'<': 600, u'=': 600, u'>': 600, u'?': 600, u'@': 600, u'A': 600, u'B': 600, u'C': 600, u'D': 600, u'E': 600, u'F': 600, u'G': 600, u'H': 600, u'I': 600, u'J': 600, u'K': 600, u'L': 600, u'M': 600, u'N': 600, u'O': 600, u'P': 600, u'Q': 600, u'R': 600, u'S': 600, u'T': 600, u'U': 600, u'V': 600, u'W': 600, u'X': 600, u'Y': 600, u'Z': 600, u'[': 600, u'\\': 600, u']': 600, u'^': 600, u'_': 600, u'`': 600, u'a': 600, u'b': 600, u'c': 600, u'd': 600, u'e': 600, u'f': 600, u'g': 600, u'h': 600, u'i': 600, u'j': 600, u'k': 600, u'l': 600, u'm': 600, u'n': 600, u'o': 600, u'p': 600, u'q': 600, u'r': 600, u's': 600, u't': 600, u'u': 600, u'v': 600, u'w': 600, u'x': 600, u'y': 600, u'z': 600, u'{': 600, u'|': 600, u'}': 600, u'~': 600, u'\xa1': 600, u'\xa2': 600, u'\xa3': 600, u'\xa4': 600, u'\xa5': 600, u'\xa6': 600, u'\xa7': 600, u'\xa8': 600, u'\xa9': 600, u'\xaa': 600, u'\xab': 600, u'\xac': 600, u'\xae': 600, u'\xaf': 600, u'\xb0': 600, u'\xb1': 600, u'\xb2': 600, u'\xb3': 600, u'\xb4': 600, u'\xb5': 600, u'\xb6': 600, u'\xb7': 600, u'\xb8': 600, u'\xb9': 600, u'\xba': 600, u'\xbb': 600, u'\xbc': 600, u'\xbd': 600, u'\xbe': 600, u'\xbf': 600, u'\xc0': 600, u'\xc1': 600, u'\xc2': 600, u'\xc3': 600, u'\xc4': 600, u'\xc5': 600, u'\xc6': 600, u'\xc7': 600, u'\xc8': 600, u'\xc9': 600, u'\xca': 600, u'\xcb': 600, u'\xcc': 600, u'\xcd': 600, u'\xce': 600, u'\xcf': 600, u'\xd0': 600, u'\xd1': 600, u'\xd2': 600, u'\xd3': 600, u'\xd4': 600, u'\xd5': 600, u'\xd6': 600, u'\xd7': 600, u'\xd8': 600, u'\xd9': 600, u'\xda': 600, u'\xdb': 600, u'\xdc': 600, u'\xdd': 600, u'\xde': 600, u'\xdf': 600, u'\xe0': 600, u'\xe1': 600, u'\xe2': 600, u'\xe3': 600, u'\xe4': 600, u'\xe5': 600, u'\xe6': 600, u'\xe7': 600, u'\xe8': 600, u'\xe9': 600, u'\xea': 600, u'\xeb': 600, u'\xec': 600, u'\xed': 600, u'\xee': 600, u'\xef': 600, u'\xf0': 600, u'\xf1': 600, u'\xf2': 600, u'\xf3': 600, u'\xf4': 600, u'\xf5': 600, u'\xf6': 600, u'\xf7': 600, u'\xf8': 600, u'\xf9': 600, u'\xfa': 600, u'\xfb': 600, u'\xfc': 600, u'\xfd': 600, u'\xfe': 600, u'\xff': 600, u'\u0100': 600, u'\u0101': 600, u'\u0102': 600, u'\u0103': 600, u'\u0104': 600, u'\u0105': 600, u'\u0106': 600, u'\u0107': 600, u'\u010c': 600, u'\u010d': 600, u'\u010e': 600, u'\u010f': 600, u'\u0110': 600, u'\u0111': 600, u'\u0112': 600, u'\u0113': 600, u'\u0116': 600, u'\u0117': 600, u'\u0118': 600, u'\u0119': 600, u'\u011a': 600, u'\u011b': 600, u'\u011e': 600, u'\u011f': 600, u'\u0122': 600, u'\u0123': 600, u'\u012a': 600, u'\u012b': 600, u'\u012e': 600, u'\u012f': 600, u'\u0130': 600, u'\u0131': 600, u'\u0136': 600, u'\u0137': 600, u'\u0139': 600, u'\u013a': 600, u'\u013b': 600, u'\u013c': 600, u'\u013d': 600, u'\u013e': 600, u'\u0141': 600, u'\u0142': 600, u'\u0143': 600, u'\u0144': 600, u'\u0145': 600, u'\u0146': 600, u'\u0147': 600, u'\u0148': 600, u'\u014c': 600, u'\u014d': 600, u'\u0150': 600, u'\u0151': 600, u'\u0152': 600, u'\u0153': 600, u'\u0154': 600, u'\u0155': 600, u'\u0156': 600, u'\u0157': 600, u'\u0158': 600, u'\u0159': 600, u'\u015a': 600, u'\u015b': 600, u'\u015e': 600, u'\u015f': 600, u'\u0160': 600, u'\u0161': 600, u'\u0162': 600, u'\u0163': 600, u'\u0164': 600, u'\u0165': 600, u'\u016a': 600, u'\u016b': 600, u'\u016e': 600, u'\u016f': 600, u'\u0170': 600, u'\u0171': 600, u'\u0172': 600, u'\u0173': 600, u'\u0178': 600, u'\u0179': 600, u'\u017a': 600, u'\u017b': 600, u'\u017c': 600, u'\u017d': 600, u'\u017e': 600, u'\u0192': 600, u'\u0218': 600, u'\u0219': 600, u'\u02c6': 600, u'\u02c7': 600, u'\u02d8': 600, u'\u02d9': 600, u'\u02da': 600, u'\u02db': 600, u'\u02dc': 600, u'\u02dd': 600, u'\u2013': 600, u'\u2014': 600, u'\u2018': 600, u'\u2019': 600, u'\u201a': 600, u'\u201c': 600, u'\u201d': 600, u'\u201e': 600, u'\u2020': 600, u'\u2021': 600, u'\u2022': 600, u'\u2026': 600, u'\u2030': 600, u'\u2039': 600, u'\u203a': 600, u'\u2044': 600, u'\u2122': 600, u'\u2202': 600, u'\u2206': 600, u'\u2211': 600, u'\u2212': 600, u'\u221a': 600, u'\u2260': 600, u'\u2264': 600, u'\u2265': 600, u'\u25ca': 600, u'\uf6c3': 600, u'\ufb01': 600, u'\ufb02': 600}),
- 'Helvetica': ({'FontName': 'Helvetica', 'Descent': -207.0, 'FontBBox': (-166.0, -225.0, 1000.0, 931.0), 'FontWeight': 'Medium', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 523.0, 'ItalicAngle': 0.0, 'Ascent': 718.0}, {u' ': 278, u'!': 278, u'"': 355, u'#': 556, u'$': 556, u'%': 889, u'&': 667, u"'": 191, u'(': 333, u')': 333, u'*': 389, u'+': 584, u',': 278, u'-': 333, u'.': 278, u'/': 278, u'0': 556, u'1': 556, u'2': 556, u'3': 556, u'4': 556, u'5': 556, u'6': 556, u'7': 556, u'8': 556, u'9': 556, u':': 278, u';': 278, u'<': 584, u'=': 584, u'>': 584, u'?': 556, u'@': 1015, u'A': 667, u'B': 667, u'C': 722, u'D': 722, u'E': 667, u'F': 611, u'G': 778, u'H': 722, u'I': 278, u'J': 500, u'K': 667, u'L': 556, u'M': 833, u'N': 722, u'O': 778, u'P': 667, u'Q': 778, u'R': 722, u'S': 667, u'T': 611, u'U': 722, u'V': 667, u'W': 944, u'X': 667, u'Y': 667, u'Z': 611, u'[': 278, u'\\': 278, u']': 278, u'^': 469, u'_': 556, u'`': 333, u'a': 556, u'b': 556, u'c': 500, u'd': 556, u'e': 556, u'f': 278, u'g': 556, u'h': 556, u'i': 222, u'j': 222, u'k': 500, u'l': 222, u'm': 833, u'n': 556, u'o': 556, u'p': 556, u'q': 556, u'r': 333, u's': 500, u't': 278, u'u': 556, u'v': 500, u'w': 722, u'x': 500, u'y': 500, u'z': 500, u'{': 334, u'|': 260, u'}': 334, u'~': 584, u'\xa1': 333, u'\xa2': 556, u'\xa3': 556, u'\xa4': 556, u'\xa5': 556, u'\xa6': 260, u'\xa7': 556, u'\xa8': 333, u'\xa9': 737, u'\xaa': 370, u'\xab': 556, u'\xac': 584, u'\xae': 737, u'\xaf': 333, u'\xb0': 400, u'\xb1': 584, u'\xb2': 333, u'\xb3': 333, u'\xb4': 333, u'\xb5': 556, u'\xb6': 537, u'\xb7': 278, u'\xb8': 333, u'\xb9': 333, u'\xba': 365, u'\xbb': 556, u'\xbc': 834, u'\xbd': 834, u'\xbe': 834, u'\xbf': 611, u'\xc0': 667, u'\xc1': 667, u'\xc2': 667, u'\xc3': 667, u'\xc4': 667, u'\xc5': 667, u'\xc6': 1000, u'\xc7': 722, u'\xc8': 667, u'\xc9': 667, u'\xca': 667, u'\xcb': 667, u'\xcc': 278, u'\xcd': 278, u'\xce': 278, u'\xcf': 278, u'\xd0': 722, u'\xd1': 722, u'\xd2': 778, u'\xd3': 778, u'\xd4': 778, u'\xd5': 778, u'\xd6': 778, u'\xd7': 584, u'\xd8': 778, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 667, u'\xde': 667, u'\xdf': 611, u'\xe0': 556, u'\xe1': 556, u'\xe2': 556, u'\xe3': 556, u'\xe4': 556, u'\xe5': 556, u'\xe6': 889, u'\xe7': 500, u'\xe8': 556, u'\xe9': 556, u'\xea': 556, u'\xeb': 556, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 556, u'\xf1': 556, u'\xf2': 556, u'\xf3': 556, u'\xf4': 556, u'\xf5': 556, u'\xf6': 556, u'\xf7': 584, u'\xf8': 611, u'\xf9': 556, u'\xfa': 556, u'\xfb': 556, u'\xfc': 556, u'\xfd': 500, u'\xfe': 556, u'\xff': 500, u'\u0100': 667, u'\u0101': 556, u'\u0102': 667, u'\u0103': 556, u'\u0104': 667, u'\u0105': 556, u'\u0106': 722, u'\u0107': 500, u'\u010c': 722, u'\u010d': 500, u'\u010e': 722, u'\u010f': 643, u'\u0110': 722, u'\u0111': 556, u'\u0112': 667, u'\u0113': 556, u'\u0116': 667, u'\u0117': 556, u'\u0118': 667, u'\u0119': 556, u'\u011a': 667, u'\u011b': 556, u'\u011e': 778, u'\u011f': 556, u'\u0122': 778, u'\u0123': 556, u'\u012a': 278, u'\u012b': 278, u'\u012e': 278, u'\u012f': 222, u'\u0130': 278, u'\u0131': 278, u'\u0136': 667, u'\u0137': 500, u'\u0139': 556, u'\u013a': 222, u'\u013b': 556, u'\u013c': 222, u'\u013d': 556, u'\u013e': 299, u'\u0141': 556, u'\u0142': 222, u'\u0143': 722, u'\u0144': 556, u'\u0145': 722, u'\u0146': 556, u'\u0147': 722, u'\u0148': 556, u'\u014c': 778, u'\u014d': 556, u'\u0150': 778, u'\u0151': 556, u'\u0152': 1000, u'\u0153': 944, u'\u0154': 722, u'\u0155': 333, u'\u0156': 722, u'\u0157': 333, u'\u0158': 722, u'\u0159': 333, u'\u015a': 667, u'\u015b': 500, u'\u015e': 667, u'\u015f': 500, u'\u0160': 667, u'\u0161': 500, u'\u0162': 611, u'\u0163': 278, u'\u0164': 611, u'\u0165': 317, u'\u016a': 722, u'\u016b': 556, u'\u016e': 722, u'\u016f': 556, u'\u0170': 722, u'\u0171': 556, u'\u0172': 722, u'\u0173': 556, u'\u0178': 667, u'\u0179': 611, u'\u017a': 500, u'\u017b': 611, u'\u017c': 500, u'\u017d': 611, u'\u017e': 500, u'\u0192': 556, u'\u0218': 667, u'\u0219': 500, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 556, u'\u2014': 1000, u'\u2018': 222, u'\u2019': 222, u'\u201a': 222, u'\u201c': 333, u'\u201d': 333, u'\u201e': 333, u'\u2020': 556, u'\u2021': 556, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 1000, u'\u2202': 476, u'\u2206': 612, u'\u2211': 600, u'\u2212': 584, u'\u221a': 453, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 471, u'\uf6c3': 250, u'\ufb01': 500, u'\ufb02': 500}),
- 'Helvetica-Bold': ({'FontName': 'Helvetica-Bold', 'Descent': -207.0, 'FontBBox': (-170.0, -228.0, 1003.0, 962.0), 'FontWeight': 'Bold', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 532.0, 'ItalicAngle': 0.0, 'Ascent': 718.0}, {u' ': 278, u'!': 333, u'"': 474, u'#': 556, u'$': 556, u'%': 889, u'&': 722, u"'": 238, u'(': 333, u')': 333, u'*': 389, u'+': 584, u',': 278, u'-': 333, u'.': 278, u'/': 278, u'0': 556, u'1': 556, u'2': 556, u'3': 556, u'4': 556, u'5': 556, u'6': 556, u'7': 556, u'8': 556, u'9': 556, u':': 333, u';': 333, u'<': 584, u'=': 584, u'>': 584, u'?': 611, u'@': 975, u'A': 722, u'B': 722, u'C': 722, u'D': 722, u'E': 667, u'F': 611, u'G': 778, u'H': 722, u'I': 278, u'J': 556, u'K': 722, u'L': 611, u'M': 833, u'N': 722, u'O': 778, u'P': 667, u'Q': 778, u'R': 722, u'S': 667, u'T': 611, u'U': 722, u'V': 667, u'W': 944, u'X': 667, u'Y': 667, u'Z': 611, u'[': 333, u'\\': 278, u']': 333, u'^': 584, u'_': 556, u'`': 333, u'a': 556, u'b': 611, u'c': 556, u'd': 611, u'e': 556, u'f': 333, u'g': 611, u'h': 611, u'i': 278, u'j': 278, u'k': 556, u'l': 278, u'm': 889, u'n': 611, u'o': 611, u'p': 611, u'q': 611, u'r': 389, u's': 556, u't': 333, u'u': 611, u'v': 556, u'w': 778, u'x': 556, u'y': 556, u'z': 500, u'{': 389, u'|': 280, u'}': 389, u'~': 584, u'\xa1': 333, u'\xa2': 556, u'\xa3': 556, u'\xa4': 556, u'\xa5': 556, u'\xa6': 280, u'\xa7': 556, u'\xa8': 333, u'\xa9': 737, u'\xaa': 370, u'\xab': 556, u'\xac': 584, u'\xae': 737, u'\xaf': 333, u'\xb0': 400, u'\xb1': 584, u'\xb2': 333, u'\xb3': 333, u'\xb4': 333, u'\xb5': 611, u'\xb6': 556, u'\xb7': 278, u'\xb8': 333, u'\xb9': 333, u'\xba': 365, u'\xbb': 556, u'\xbc': 834, u'\xbd': 834, u'\xbe': 834, u'\xbf': 611, u'\xc0': 722, u'\xc1': 722, u'\xc2': 722, u'\xc3': 722, u'\xc4': 722, u'\xc5': 722, u'\xc6': 1000, u'\xc7': 722, u'\xc8': 667, u'\xc9': 667, u'\xca': 667, u'\xcb': 667, u'\xcc': 278, u'\xcd': 278, u'\xce': 278, u'\xcf': 278, u'\xd0': 722, u'\xd1': 722, u'\xd2': 778, u'\xd3': 778, u'\xd4': 778, u'\xd5': 778, u'\xd6': 778, u'\xd7': 584, u'\xd8': 778, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 667, u'\xde': 667, u'\xdf': 611, u'\xe0': 556, u'\xe1': 556, u'\xe2': 556, u'\xe3': 556, u'\xe4': 556, u'\xe5': 556, u'\xe6': 889, u'\xe7': 556, u'\xe8': 556, u'\xe9': 556, u'\xea': 556, u'\xeb': 556, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 611, u'\xf1': 611, u'\xf2': 611, u'\xf3': 611, u'\xf4': 611, u'\xf5': 611, u'\xf6': 611, u'\xf7': 584, u'\xf8': 611, u'\xf9': 611, u'\xfa': 611, u'\xfb': 611, u'\xfc': 611, u'\xfd': 556, u'\xfe': 611, u'\xff': 556, u'\u0100': 722, u'\u0101': 556, u'\u0102': 722, u'\u0103': 556, u'\u0104': 722, u'\u0105': 556, u'\u0106': 722, u'\u0107': 556, u'\u010c': 722, u'\u010d': 556, u'\u010e': 722, u'\u010f': 743, u'\u0110': 722, u'\u0111': 611, u'\u0112': 667, u'\u0113': 556, u'\u0116': 667, u'\u0117': 556, u'\u0118': 667, u'\u0119': 556, u'\u011a': 667, u'\u011b': 556, u'\u011e': 778, u'\u011f': 611, u'\u0122': 778, u'\u0123': 611, u'\u012a': 278, u'\u012b': 278, u'\u012e': 278, u'\u012f': 278, u'\u0130': 278, u'\u0131': 278, u'\u0136': 722, u'\u0137': 556, u'\u0139': 611, u'\u013a': 278, u'\u013b': 611, u'\u013c': 278, u'\u013d': 611, u'\u013e': 400, u'\u0141': 611, u'\u0142': 278, u'\u0143': 722, u'\u0144': 611, u'\u0145': 722, u'\u0146': 611, u'\u0147': 722, u'\u0148': 611, u'\u014c': 778, u'\u014d': 611, u'\u0150': 778, u'\u0151': 611, u'\u0152': 1000, u'\u0153': 944, u'\u0154': 722, u'\u0155': 389, u'\u0156': 722, u'\u0157': 389, u'\u0158': 722, u'\u0159': 389, u'\u015a': 667, u'\u015b': 556, u'\u015e': 667, u'\u015f': 556, u'\u0160': 667, u'\u0161': 556, u'\u0162': 611, u'\u0163': 333, u'\u0164': 611, u'\u0165': 389, u'\u016a': 722, u'\u016b': 611, u'\u016e': 722, u'\u016f': 611, u'\u0170': 722, u'\u0171': 611, u'\u0172': 722, u'\u0173': 611, u'\u0178': 667, u'\u0179': 611, u'\u017a': 500, u'\u017b': 611, u'\u017c': 500, u'\u017d': 611, u'\u017e': 500, u'\u0192': 556, u'\u0218': 667, u'\u0219': 556, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 556, u'\u2014': 1000, u'\u2018': 278, u'\u2019': 278, u'\u201a': 278, u'\u201c': 500, u'\u201d': 500, u'\u201e': 500, u'\u2020': 556, u'\u2021': 556, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 1000, u'\u2202': 494, u'\u2206': 612, u'\u2211': 600, u'\u2212': 584, u'\u221a': 549, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 494, u'\uf6c3': 250, u'\ufb01': 611, u'\ufb02': 611}),
- 'Helvetica-BoldOblique': ({'FontName': 'Helvetica-BoldOblique', 'Descent': -207.0, 'FontBBox': (-175.0, -228.0, 1114.0, 962.0), 'FontWeight': 'Bold', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 532.0, 'ItalicAngle': -12.0, 'Ascent': 718.0}, {u' ': 278, u'!': 333, u'"': 474, u'#': 556, u'$': 556, u'%': 889, u'&': 722, u"'": 238, u'(': 333, u')': 333, u'*': 389, u'+': 584, u',': 278, u'-': 333, u'.': 278, u'/': 278, u'0': 556, u'1': 556, u'2': 556, u'3': 556, u'4': 556, u'5': 556, u'6': 556, u'7': 556, u'8': 556, u'9': 556, u':': 333, u';': 333, u'<': 584, u'=': 584, u'>': 584, u'?': 611, u'@': 975, u'A': 722, u'B': 722, u'C': 722, u'D': 722, u'E': 667, u'F': 611, u'G': 778, u'H': 722, u'I': 278, u'J': 556, u'K': 722, u'L': 611, u'M': 833, u'N': 722, u'O': 778, u'P': 667, u'Q': 778, u'R': 722, u'S': 667, u'T': 611, u'U': 722, u'V': 667, u'W': 944, u'X': 667, u'Y': 667, u'Z': 611, u'[': 333, u'\\': 278, u']': 333, u'^': 584, u'_': 556, u'`': 333, u'a': 556, u'b': 611, u'c': 556, u'd': 611, u'e': 556, u'f': 333, u'g': 611, u'h': 611, u'i': 278, u'j': 278, u'k': 556, u'l': 278, u'm': 889, u'n': 611, u'o': 611, u'p': 611, u'q': 611, u'r': 389, u's': 556, u't': 333, u'u': 611, u'v': 556, u'w': 778, u'x': 556, u'y': 556, u'z': 500, u'{': 389, u'|': 280, u'}': 389, u'~': 584, u'\xa1': 333, u'\xa2': 556, u'\xa3': 556, u'\xa4': 556, u'\xa5': 556, u'\xa6': 280, u'\xa7': 556, u'\xa8': 333, u'\xa9': 737, u'\xaa': 370, u'\xab': 556, u'\xac': 584, u'\xae': 737, u'\xaf': 333, u'\xb0': 400, u'\xb1': 584, u'\xb2': 333, u'\xb3': 333, u'\xb4': 333, u'\xb5': 611, u'\xb6': 556, u'\xb7': 278, u'\xb8': 333, u'\xb9': 333, u'\xba': 365, u'\xbb': 556, u'\xbc': 834, u'\xbd': 834, u'\xbe': 834, u'\xbf': 611, u'\xc0': 722, u'\xc1': 722, u'\xc2': 722, u'\xc3': 722, u'\xc4': 722, u'\xc5': 722, u'\xc6': 1000, u'\xc7': 722, u'\xc8': 667, u'\xc9': 667, u'\xca': 667, u'\xcb': 667, u'\xcc': 278, u'\xcd': 278, u'\xce': 278, u'\xcf': 278, u'\xd0': 722, u'\xd1': 722, u'\xd2': 778, u'\xd3': 778, u'\xd4': 778, u'\xd5': 778, u'\xd6': 778, u'\xd7': 584, u'\xd8': 778, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 667, u'\xde': 667, u'\xdf': 611, u'\xe0': 556, u'\xe1': 556, u'\xe2': 556, u'\xe3': 556, u'\xe4': 556, u'\xe5': 556, u'\xe6': 889, u'\xe7': 556, u'\xe8': 556, u'\xe9': 556, u'\xea': 556, u'\xeb': 556, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 611, u'\xf1': 611, u'\xf2': 611, u'\xf3': 611, u'\xf4': 611, u'\xf5': 611, u'\xf6': 611, u'\xf7': 584, u'\xf8': 611, u'\xf9': 611, u'\xfa': 611, u'\xfb': 611, u'\xfc': 611, u'\xfd': 556, u'\xfe': 611, u'\xff': 556, u'\u0100': 722, u'\u0101': 556, u'\u0102': 722, u'\u0103': 556, u'\u0104': 722, u'\u0105': 556, u'\u0106': 722, u'\u0107': 556, u'\u010c': 722, u'\u010d': 556, u'\u010e': 722, u'\u010f': 743, u'\u0110': 722, u'\u0111': 611, u'\u0112': 667, u'\u0113': 556, u'\u0116': 667, u'\u0117': 556, u'\u0118': 667, u'\u0119': 556, u'\u011a': 667, u'\u011b': 556, u'\u011e': 778, u'\u011f': 611, u'\u0122': 778, u'\u0123': 611, u'\u012a': 278, u'\u012b': 278, u'\u012e': 278, u'\u012f': 278, u'\u0130': 278, u'\u0131': 278, u'\u0136': 722, u'\u0137': 556, u'\u0139': 611, u'\u013a': 278, u'\u013b': 611, u'\u013c': 278, u'\u013d': 611, u'\u013e': 400, u'\u0141': 611, u'\u0142': 278, u'\u0143': 722, u'\u0144': 611, u'\u0145': 722, u'\u0146': 611, u'\u0147': 722, u'\u0148': 611, u'\u014c': 778, u'\u014d': 611, u'\u0150': 778, u'\u0151': 611, u'\u0152': 1000, u'\u0153': 944, u'\u0154': 722, u'\u0155': 389, u'\u0156': 722, u'\u0157': 389, u'\u0158': 722, u'\u0159': 389, u'\u015a': 667, u'\u015b': 556, u'\u015e': 667, u'\u015f': 556, u'\u0160': 667, u'\u0161': 556, u'\u0162': 611, u'\u0163': 333, u'\u0164': 611, u'\u0165': 389, u'\u016a': 722, u'\u016b': 611, u'\u016e': 722, u'\u016f': 611, u'\u0170': 722, u'\u0171': 611, u'\u0172': 722, u'\u0173': 611, u'\u0178': 667, u'\u0179': 611, u'\u017a': 500, u'\u017b': 611, u'\u017c': 500, u'\u017d': 611, u'\u017e': 500, u'\u0192': 556, u'\u0218': 667, u'\u0219': 556, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 556, u'\u2014': 1000, u'\u2018': 278, u'\u2019': 278, u'\u201a': 278, u'\u201c': 500, u'\u201d': 500, u'\u201e': 500, u'\u2020': 556, u'\u2021': 556, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 1000, u'\u2202': 494, u'\u2206': 612, u'\u2211': 600, u'\u2212': 584, u'\u221a': 549, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 494, u'\uf6c3': 250, u'\ufb01': 611, u'\ufb02': 611}),
- 'Helvetica-Oblique': ({'FontName': 'Helvetica-Oblique', 'Descent': -207.0, 'FontBBox': (-171.0, -225.0, 1116.0, 931.0), 'FontWeight': 'Medium', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 523.0, 'ItalicAngle': -12.0, 'Ascent': 718.0}, {u' ': 278, u'!': 278, u'"': 355, u'#': 556, u'$': 556, u'%': 889, u'&': 667, u"'": 191, u'(': 333, u')': 333, u'*': 389, u'+': 584, u',': 278, u'-': 333, u'.': 278, u'/': 278, u'0': 556, u'1': 556, u'2': 556, u'3': 556, u'4': 556, u'5': 556, u'6': 556, u'7': 556, u'8': 556, u'9': 556, u':': 278, u';': 278, u'<': 584, u'=': 584, u'>': 584, u'?': 556, u'@': 1015, u'A': 667, u'B': 667, u'C': 722, u'D': 722, u'E': 667, u'F': 611, u'G': 778, u'H': 722, u'I': 278, u'J': 500, u'K': 667, u'L': 556, u'M': 833, u'N': 722, u'O': 778, u'P': 667, u'Q': 778, u'R': 722, u'S': 667, u'T': 611, u'U': 722, u'V': 667, u'W': 944, u'X': 667, u'Y': 667, u'Z': 611, u'[': 278, u'\\': 278, u']': 278, u'^': 469, u'_': 556, u'`': 333, u'a': 556, u'b': 556, u'c': 500, u'd': 556, u'e': 556, u'f': 278, u'g': 556, u'h': 556, u'i': 222, u'j': 222, u'k': 500, u'l': 222, u'm': 833, u'n': 556, u'o': 556, u'p': 556, u'q': 556, u'r': 333, u's': 500, u't': 278, u'u': 556, u'v': 500, u'w': 722, u'x': 500, u'y': 500, u'z': 500, u'{': 334, u'|': 260, u'}': 334, u'~': 584, u'\xa1': 333, u'\xa2': 556, u'\xa3': 556, u'\xa4': 556, u'\xa5': 556, u'\xa6': 260, u'\xa7': 556, u'\xa8': 333, u'\xa9': 737, u'\xaa': 370, u'\xab': 556, u'\xac': 584, u'\xae': 737, u'\xaf': 333, u'\xb0': 400, u'\xb1': 584, u'\xb2': 333, u'\xb3': 333, u'\xb4': 333, u'\xb5': 556, u'\xb6': 537, u'\xb7': 278, u'\xb8': 333, u'\xb9': 333, u'\xba': 365, u'\xbb': 556, u'\xbc': 834, u'\xbd': 834, u'\xbe': 834, u'\xbf': 611, u'\xc0': 667, u'\xc1': 667, u'\xc2': 667, u'\xc3': 667, u'\xc4': 667, u'\xc5': 667, u'\xc6': 1000, u'\xc7': 722, u'\xc8': 667, u'\xc9': 667, u'\xca': 667, u'\xcb': 667, u'\xcc': 278, u'\xcd': 278, u'\xce': 278, u'\xcf': 278, u'\xd0': 722, u'\xd1': 722, u'\xd2': 778, u'\xd3': 778, u'\xd4': 778, u'\xd5': 778, u'\xd6': 778, u'\xd7': 584, u'\xd8': 778, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 667, u'\xde': 667, u'\xdf': 611, u'\xe0': 556, u'\xe1': 556, u'\xe2': 556, u'\xe3': 556, u'\xe4': 556, u'\xe5': 556, u'\xe6': 889, u'\xe7': 500, u'\xe8': 556, u'\xe9': 556, u'\xea': 556, u'\xeb': 556, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 556, u'\xf1': 556, u'\xf2': 556, u'\xf3': 556, u'\xf4': 556, u'\xf5': 556, u'\xf6': 556, u'\xf7': 584, u'\xf8': 611, u'\xf9': 556, u'\xfa': 556, u'\xfb': 556, u'\xfc': 556, u'\xfd': 500, u'\xfe': 556, u'\xff': 500, u'\u0100': 667, u'\u0101': 556, u'\u0102': 667, u'\u0103': 556, u'\u0104': 667, u'\u0105': 556, u'\u0106': 722, u'\u0107': 500, u'\u010c': 722, u'\u010d': 500, u'\u010e': 722, u'\u010f': 643, u'\u0110': 722, u'\u0111': 556, u'\u0112': 667, u'\u0113': 556, u'\u0116': 667, u'\u0117': 556, u'\u0118': 667, u'\u0119': 556, u'\u011a': 667, u'\u011b': 556, u'\u011e': 778, u'\u011f': 556, u'\u0122': 778, u'\u0123': 556, u'\u012a': 278, u'\u012b': 278, u'\u012e': 278, u'\u012f': 222, u'\u0130': 278, u'\u0131': 278, u'\u0136': 667, u'\u0137': 500, u'\u0139': 556, u'\u013a': 222, u'\u013b': 556, u'\u013c': 222, u'\u013d': 556, u'\u013e': 299, u'\u0141': 556, u'\u0142': 222, u'\u0143': 722, u'\u0144': 556, u'\u0145': 722, u'\u0146': 556, u'\u0147': 722, u'\u0148': 556, u'\u014c': 778, u'\u014d': 556, u'\u0150': 778, u'\u0151': 556, u'\u0152': 1000, u'\u0153': 944, u'\u0154': 722, u'\u0155': 333, u'\u0156': 722, u'\u0157': 333, u'\u0158': 722, u'\u0159': 333, u'\u015a': 667, u'\u015b': 500, u'\u015e': 667, u'\u015f': 500, u'\u0160': 667, u'\u0161': 500, u'\u0162': 611, u'\u0163': 278, u'\u0164': 611, u'\u0165': 317, u'\u016a': 722, u'\u016b': 556, u'\u016e': 722, u'\u016f': 556, u'\u0170': 722, u'\u0171': 556, u'\u0172': 722, u'\u0173': 556, u'\u0178': 667, u'\u0179': 611, u'\u017a': 500, u'\u017b': 611, u'\u017c': 500, u'\u017d': 611, u'\u017e': 500, u'\u0192': 556, u'\u0218': 667, u'\u0219': 500, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 556, u'\u2014': 1000, u'\u2018': 222, u'\u2019': 222, u'\u201a': 222, u'\u201c': 333, u'\u201d': 333, u'\u201e': 333, u'\u2020': 556, u'\u2021': 556, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 1000, u'\u2202': 476, u'\u2206': 612, u'\u2211': 600, u'\u2212': 584, u'\u221a': 453, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 471, u'\uf6c3': 250, u'\ufb01': 500, u'\ufb02': 500}),
- 'Symbol': ({'FontName': 'Symbol', 'FontBBox': (-180.0, -293.0, 1090.0, 1010.0), 'FontWeight': 'Medium', 'FontFamily': 'Symbol', 'Flags': 0, 'ItalicAngle': 0.0}, {u' ': 250, u'!': 333, u'#': 500, u'%': 833, u'&': 778, u'(': 333, u')': 333, u'+': 549, u',': 250, u'.': 250, u'/': 278, u'0': 500, u'1': 500, u'2': 500, u'3': 500, u'4': 500, u'5': 500, u'6': 500, u'7': 500, u'8': 500, u'9': 500, u':': 278, u';': 278, u'<': 549, u'=': 549, u'>': 549, u'?': 444, u'[': 333, u']': 333, u'_': 500, u'{': 480, u'|': 200, u'}': 480, u'\xac': 713, u'\xb0': 400, u'\xb1': 549, u'\xb5': 576, u'\xd7': 549, u'\xf7': 549, u'\u0192': 500, u'\u0391': 722, u'\u0392': 667, u'\u0393': 603, u'\u0395': 611, u'\u0396': 611, u'\u0397': 722, u'\u0398': 741, u'\u0399': 333, u'\u039a': 722, u'\u039b': 686, u'\u039c': 889, u'\u039d': 722, u'\u039e': 645, u'\u039f': 722, u'\u03a0': 768, u'\u03a1': 556, u'\u03a3': 592, u'\u03a4': 611, u'\u03a5': 690, u'\u03a6': 763, u'\u03a7': 722, u'\u03a8': 795, u'\u03b1': 631, u'\u03b2': 549, u'\u03b3': 411, u'\u03b4': 494, u'\u03b5': 439, u'\u03b6': 494, u'\u03b7': 603, u'\u03b8': 521, u'\u03b9': 329, u'\u03ba': 549, u'\u03bb': 549, u'\u03bd': 521, u'\u03be': 493, u'\u03bf': 549, u'\u03c0': 549, u'\u03c1': 549, u'\u03c2': 439, u'\u03c3': 603, u'\u03c4': 439, u'\u03c5': 576, u'\u03c6': 521, u'\u03c7': 549, u'\u03c8': 686, u'\u03c9': 686, u'\u03d1': 631, u'\u03d2': 620, u'\u03d5': 603, u'\u03d6': 713, u'\u2022': 460, u'\u2026': 1000, u'\u2032': 247, u'\u2033': 411, u'\u2044': 167, u'\u20ac': 750, u'\u2111': 686, u'\u2118': 987, u'\u211c': 795, u'\u2126': 768, u'\u2135': 823, u'\u2190': 987, u'\u2191': 603, u'\u2192': 987, u'\u2193': 603, u'\u2194': 1042, u'\u21b5': 658, u'\u21d0': 987, u'\u21d1': 603, u'\u21d2': 987, u'\u21d3': 603, u'\u21d4': 1042, u'\u2200': 713, u'\u2202': 494, u'\u2203': 549, u'\u2205': 823, u'\u2206': 612, u'\u2207': 713, u'\u2208': 713, u'\u2209': 713, u'\u220b': 439, u'\u220f': 823, u'\u2211': 713, u'\u2212': 549, u'\u2217': 500, u'\u221a': 549, u'\u221d': 713, u'\u221e': 713, u'\u2220': 768, u'\u2227': 603, u'\u2228': 603, u'\u2229': 768, u'\u222a': 768, u'\u222b': 274, u'\u2234': 863, u'\u223c': 549, u'\u2245': 549, u'\u2248': 549, u'\u2260': 549, u'\u2261': 549, u'\u2264': 549, u'\u2265': 549, u'\u2282': 713, u'\u2283': 713, u'\u2284': 713, u'\u2286': 713, u'\u2287': 713, u'\u2295': 768, u'\u2297': 768, u'\u22a5': 658, u'\u22c5': 250, u'\u2320': 686, u'\u2321': 686, u'\u2329': 329, u'\u232a': 329, u'\u25ca': 494, u'\u2660': 753, u'\u2663': 753, u'\u2665': 753, u'\u2666': 753, u'\uf6d9': 790, u'\uf6da': 790, u'\uf6db': 890, u'\uf8e5': 500, u'\uf8e6': 603, u'\uf8e7': 1000, u'\uf8e8': 790, u'\uf8e9': 790, u'\uf8ea': 786, u'\uf8eb': 384, u'\uf8ec': 384, u'\uf8ed': 384, u'\uf8ee': 384, u'\uf8ef': 384, u'\uf8f0': 384, u'\uf8f1': 494, u'\uf8f2': 494, u'\uf8f3': 494, u'\uf8f4': 494, u'\uf8f5': 686, u'\uf8f6': 384, u'\uf8f7': 384, u'\uf8f8': 384, u'\uf8f9': 384, u'\uf8fa': 384, u'\uf8fb': 384, u'\uf8fc': 494, u'\uf8fd': 494, u'\uf8fe': 494, u'\uf8ff': 790}),
- 'Times-Bold': ({'FontName': 'Times-Bold', 'Descent': -217.0, 'FontBBox': (-168.0, -218.0, 1000.0, 935.0), 'FontWeight': 'Bold', 'CapHeight': 676.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 461.0, 'ItalicAngle': 0.0, 'Ascent': 683.0}, {u' ': 250, u'!': 333, u'"': 555, u'#': 500, u'$': 500, u'%': 1000, u'&': 833, u"'": 278, u'(': 333, u')': 333, u'*': 500, u'+': 570, u',': 250, u'-': 333, u'.': 250, u'/': 278, u'0': 500, u'1': 500, u'2': 500, u'3': 500, u'4': 500, u'5': 500, u'6': 500, u'7': 500, u'8': 500, u'9': 500, u':': 333, u';': 333, u'<': 570, u'=': 570, u'>': 570, u'?': 500, u'@': 930, u'A': 722, u'B': 667, u'C': 722, u'D': 722, u'E': 667, u'F': 611, u'G': 778, u'H': 778, u'I': 389, u'J': 500, u'K': 778, u'L': 667, u'M': 944, u'N': 722, u'O': 778, u'P': 611, u'Q': 778, u'R': 722, u'S': 556, u'T': 667, u'U': 722, u'V': 722, u'W': 1000, u'X': 722, u'Y': 722, u'Z': 667, u'[': 333, u'\\': 278, u']': 333, u'^': 581, u'_': 500, u'`': 333, u'a': 500, u'b': 556, u'c': 444, u'd': 556, u'e': 444, u'f': 333, u'g': 500, u'h': 556, u'i': 278, u'j': 333, u'k': 556, u'l': 278, u'm': 833, u'n': 556, u'o': 500, u'p': 556, u'q': 556, u'r': 444, u's': 389, u't': 333, u'u': 556, u'v': 500, u'w': 722, u'x': 500, u'y': 500, u'z': 444, u'{': 394, u'|': 220, u'}': 394, u'~': 520, u'\xa1': 333, u'\xa2': 500, u'\xa3': 500, u'\xa4': 500, u'\xa5': 500, u'\xa6': 220, u'\xa7': 500, u'\xa8': 333, u'\xa9': 747, u'\xaa': 300, u'\xab': 500, u'\xac': 570, u'\xae': 747, u'\xaf': 333, u'\xb0': 400, u'\xb1': 570, u'\xb2': 300, u'\xb3': 300, u'\xb4': 333, u'\xb5': 556, u'\xb6': 540, u'\xb7': 250, u'\xb8': 333, u'\xb9': 300, u'\xba': 330, u'\xbb': 500, u'\xbc': 750, u'\xbd': 750, u'\xbe': 750, u'\xbf': 500, u'\xc0': 722, u'\xc1': 722, u'\xc2': 722, u'\xc3': 722, u'\xc4': 722, u'\xc5': 722, u'\xc6': 1000, u'\xc7': 722, u'\xc8': 667, u'\xc9': 667, u'\xca': 667, u'\xcb': 667, u'\xcc': 389, u'\xcd': 389, u'\xce': 389, u'\xcf': 389, u'\xd0': 722, u'\xd1': 722, u'\xd2': 778, u'\xd3': 778, u'\xd4': 778, u'\xd5': 778, u'\xd6': 778, u'\xd7': 570, u'\xd8': 778, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 722, u'\xde': 611, u'\xdf': 556, u'\xe0': 500, u'\xe1': 500, u'\xe2': 500, u'\xe3': 500, u'\xe4': 500, u'\xe5': 500, u'\xe6': 722, u'\xe7': 444, u'\xe8': 444, u'\xe9': 444, u'\xea': 444, u'\xeb': 444, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 500, u'\xf1': 556, u'\xf2': 500, u'\xf3': 500, u'\xf4': 500, u'\xf5': 500, u'\xf6': 500, u'\xf7': 570, u'\xf8': 500, u'\xf9': 556, u'\xfa': 556, u'\xfb': 556, u'\xfc': 556, u'\xfd': 500, u'\xfe': 556, u'\xff': 500, u'\u0100': 722, u'\u0101': 500, u'\u0102': 722, u'\u0103': 500, u'\u0104': 722, u'\u0105': 500, u'\u0106': 722, u'\u0107': 444, u'\u010c': 722, u'\u010d': 444, u'\u010e': 722, u'\u010f': 672, u'\u0110': 722, u'\u0111': 556, u'\u0112': 667, u'\u0113': 444, u'\u0116': 667, u'\u0117': 444, u'\u0118': 667, u'\u0119': 444, u'\u011a': 667, u'\u011b': 444, u'\u011e': 778, u'\u011f': 500, u'\u0122': 778, u'\u0123': 500, u'\u012a': 389, u'\u012b': 278, u'\u012e': 389, u'\u012f': 278, u'\u0130': 389, u'\u0131': 278, u'\u0136': 778, u'\u0137': 556, u'\u0139': 667, u'\u013a': 278, u'\u013b': 667, u'\u013c': 278, u'\u013d': 667, u'\u013e': 394, u'\u0141': 667, u'\u0142': 278, u'\u0143': 722, u'\u0144': 556, u'\u0145': 722, u'\u0146': 556, u'\u0147': 722, u'\u0148': 556, u'\u014c': 778, u'\u014d': 500, u'\u0150': 778, u'\u0151': 500, u'\u0152': 1000, u'\u0153': 722, u'\u0154': 722, u'\u0155': 444, u'\u0156': 722, u'\u0157': 444, u'\u0158': 722, u'\u0159': 444, u'\u015a': 556, u'\u015b': 389, u'\u015e': 556, u'\u015f': 389, u'\u0160': 556, u'\u0161': 389, u'\u0162': 667, u'\u0163': 333, u'\u0164': 667, u'\u0165': 416, u'\u016a': 722, u'\u016b': 556, u'\u016e': 722, u'\u016f': 556, u'\u0170': 722, u'\u0171': 556, u'\u0172': 722, u'\u0173': 556, u'\u0178': 722, u'\u0179': 667, u'\u017a': 444, u'\u017b': 667, u'\u017c': 444, u'\u017d': 667, u'\u017e': 444, u'\u0192': 500, u'\u0218': 556, u'\u0219': 389, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 500, u'\u2014': 1000, u'\u2018': 333, u'\u2019': 333, u'\u201a': 333, u'\u201c': 500, u'\u201d': 500, u'\u201e': 500, u'\u2020': 500, u'\u2021': 500, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 1000, u'\u2202': 494, u'\u2206': 612, u'\u2211': 600, u'\u2212': 570, u'\u221a': 549, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 494, u'\uf6c3': 250, u'\ufb01': 556, u'\ufb02': 556}),
- 'Times-BoldItalic': ({'FontName': 'Times-BoldItalic', 'Descent': -217.0, 'FontBBox': (-200.0, -218.0, 996.0, 921.0), 'FontWeight': 'Bold', 'CapHeight': 669.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 462.0, 'ItalicAngle': -15.0, 'Ascent': 683.0}, {u' ': 250, u'!': 389, u'"': 555, u'#': 500, u'$': 500, u'%': 833, u'&': 778, u"'": 278, u'(': 333, u')': 333, u'*': 500, u'+': 570, u',': 250, u'-': 333, u'.': 250, u'/': 278, u'0': 500, u'1': 500, u'2': 500, u'3': 500, u'4': 500, u'5': 500, u'6': 500, u'7': 500, u'8': 500, u'9': 500, u':': 333, u';': 333, u'<': 570, u'=': 570, u'>': 570, u'?': 500, u'@': 832, u'A': 667, u'B': 667, u'C': 667, u'D': 722, u'E': 667, u'F': 667, u'G': 722, u'H': 778, u'I': 389, u'J': 500, u'K': 667, u'L': 611, u'M': 889, u'N': 722, u'O': 722, u'P': 611, u'Q': 722, u'R': 667, u'S': 556, u'T': 611, u'U': 722, u'V': 667, u'W': 889, u'X': 667, u'Y': 611, u'Z': 611, u'[': 333, u'\\': 278, u']': 333, u'^': 570, u'_': 500, u'`': 333, u'a': 500, u'b': 500, u'c': 444, u'd': 500, u'e': 444, u'f': 333, u'g': 500, u'h': 556, u'i': 278, u'j': 278, u'k': 500, u'l': 278, u'm': 778, u'n': 556, u'o': 500, u'p': 500, u'q': 500, u'r': 389, u's': 389, u't': 278, u'u': 556, u'v': 444, u'w': 667, u'x': 500, u'y': 444, u'z': 389, u'{': 348, u'|': 220, u'}': 348, u'~': 570, u'\xa1': 389, u'\xa2': 500, u'\xa3': 500, u'\xa4': 500, u'\xa5': 500, u'\xa6': 220, u'\xa7': 500, u'\xa8': 333, u'\xa9': 747, u'\xaa': 266, u'\xab': 500, u'\xac': 606, u'\xae': 747, u'\xaf': 333, u'\xb0': 400, u'\xb1': 570, u'\xb2': 300, u'\xb3': 300, u'\xb4': 333, u'\xb5': 576, u'\xb6': 500, u'\xb7': 250, u'\xb8': 333, u'\xb9': 300, u'\xba': 300, u'\xbb': 500, u'\xbc': 750, u'\xbd': 750, u'\xbe': 750, u'\xbf': 500, u'\xc0': 667, u'\xc1': 667, u'\xc2': 667, u'\xc3': 667, u'\xc4': 667, u'\xc5': 667, u'\xc6': 944, u'\xc7': 667, u'\xc8': 667, u'\xc9': 667, u'\xca': 667, u'\xcb': 667, u'\xcc': 389, u'\xcd': 389, u'\xce': 389, u'\xcf': 389, u'\xd0': 722, u'\xd1': 722, u'\xd2': 722, u'\xd3': 722, u'\xd4': 722, u'\xd5': 722, u'\xd6': 722, u'\xd7': 570, u'\xd8': 722, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 611, u'\xde': 611, u'\xdf': 500, u'\xe0': 500, u'\xe1': 500, u'\xe2': 500, u'\xe3': 500, u'\xe4': 500, u'\xe5': 500, u'\xe6': 722, u'\xe7': 444, u'\xe8': 444, u'\xe9': 444, u'\xea': 444, u'\xeb': 444, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 500, u'\xf1': 556, u'\xf2': 500, u'\xf3': 500, u'\xf4': 500, u'\xf5': 500, u'\xf6': 500, u'\xf7': 570, u'\xf8': 500, u'\xf9': 556, u'\xfa': 556, u'\xfb': 556, u'\xfc': 556, u'\xfd': 444, u'\xfe': 500, u'\xff': 444, u'\u0100': 667, u'\u0101': 500, u'\u0102': 667, u'\u0103': 500, u'\u0104': 667, u'\u0105': 500, u'\u0106': 667, u'\u0107': 444, u'\u010c': 667, u'\u010d': 444, u'\u010e': 722, u'\u010f': 608, u'\u0110': 722, u'\u0111': 500, u'\u0112': 667, u'\u0113': 444, u'\u0116': 667, u'\u0117': 444, u'\u0118': 667, u'\u0119': 444, u'\u011a': 667, u'\u011b': 444, u'\u011e': 722, u'\u011f': 500, u'\u0122': 722, u'\u0123': 500, u'\u012a': 389, u'\u012b': 278, u'\u012e': 389, u'\u012f': 278, u'\u0130': 389, u'\u0131': 278, u'\u0136': 667, u'\u0137': 500, u'\u0139': 611, u'\u013a': 278, u'\u013b': 611, u'\u013c': 278, u'\u013d': 611, u'\u013e': 382, u'\u0141': 611, u'\u0142': 278, u'\u0143': 722, u'\u0144': 556, u'\u0145': 722, u'\u0146': 556, u'\u0147': 722, u'\u0148': 556, u'\u014c': 722, u'\u014d': 500, u'\u0150': 722, u'\u0151': 500, u'\u0152': 944, u'\u0153': 722, u'\u0154': 667, u'\u0155': 389, u'\u0156': 667, u'\u0157': 389, u'\u0158': 667, u'\u0159': 389, u'\u015a': 556, u'\u015b': 389, u'\u015e': 556, u'\u015f': 389, u'\u0160': 556, u'\u0161': 389, u'\u0162': 611, u'\u0163': 278, u'\u0164': 611, u'\u0165': 366, u'\u016a': 722, u'\u016b': 556, u'\u016e': 722, u'\u016f': 556, u'\u0170': 722, u'\u0171': 556, u'\u0172': 722, u'\u0173': 556, u'\u0178': 611, u'\u0179': 611, u'\u017a': 389, u'\u017b': 611, u'\u017c': 389, u'\u017d': 611, u'\u017e': 389, u'\u0192': 500, u'\u0218': 556, u'\u0219': 389, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 500, u'\u2014': 1000, u'\u2018': 333, u'\u2019': 333, u'\u201a': 333, u'\u201c': 500, u'\u201d': 500, u'\u201e': 500, u'\u2020': 500, u'\u2021': 500, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 1000, u'\u2202': 494, u'\u2206': 612, u'\u2211': 600, u'\u2212': 606, u'\u221a': 549, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 494, u'\uf6c3': 250, u'\ufb01': 556, u'\ufb02': 556}),
- 'Times-Italic': ({'FontName': 'Times-Italic', 'Descent': -217.0, 'FontBBox': (-169.0, -217.0, 1010.0, 883.0), 'FontWeight': 'Medium', 'CapHeight': 653.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 441.0, 'ItalicAngle': -15.5, 'Ascent': 683.0}, {u' ': 250, u'!': 333, u'"': 420, u'#': 500, u'$': 500, u'%': 833, u'&': 778, u"'": 214, u'(': 333, u')': 333, u'*': 500, u'+': 675, u',': 250, u'-': 333, u'.': 250, u'/': 278, u'0': 500, u'1': 500, u'2': 500, u'3': 500, u'4': 500, u'5': 500, u'6': 500, u'7': 500, u'8': 500, u'9': 500, u':': 333, u';': 333, u'<': 675, u'=': 675, u'>': 675, u'?': 500, u'@': 920, u'A': 611, u'B': 611, u'C': 667, u'D': 722, u'E': 611, u'F': 611, u'G': 722, u'H': 722, u'I': 333, u'J': 444, u'K': 667, u'L': 556, u'M': 833, u'N': 667, u'O': 722, u'P': 611, u'Q': 722, u'R': 611, u'S': 500, u'T': 556, u'U': 722, u'V': 611, u'W': 833, u'X': 611, u'Y': 556, u'Z': 556, u'[': 389, u'\\': 278, u']': 389, u'^': 422, u'_': 500, u'`': 333, u'a': 500, u'b': 500, u'c': 444, u'd': 500, u'e': 444, u'f': 278, u'g': 500, u'h': 500, u'i': 278, u'j': 278, u'k': 444, u'l': 278, u'm': 722, u'n': 500, u'o': 500, u'p': 500, u'q': 500, u'r': 389, u's': 389, u't': 278, u'u': 500, u'v': 444, u'w': 667, u'x': 444, u'y': 444, u'z': 389, u'{': 400, u'|': 275, u'}': 400, u'~': 541, u'\xa1': 389, u'\xa2': 500, u'\xa3': 500, u'\xa4': 500, u'\xa5': 500, u'\xa6': 275, u'\xa7': 500, u'\xa8': 333, u'\xa9': 760, u'\xaa': 276, u'\xab': 500, u'\xac': 675, u'\xae': 760, u'\xaf': 333, u'\xb0': 400, u'\xb1': 675, u'\xb2': 300, u'\xb3': 300, u'\xb4': 333, u'\xb5': 500, u'\xb6': 523, u'\xb7': 250, u'\xb8': 333, u'\xb9': 300, u'\xba': 310, u'\xbb': 500, u'\xbc': 750, u'\xbd': 750, u'\xbe': 750, u'\xbf': 500, u'\xc0': 611, u'\xc1': 611, u'\xc2': 611, u'\xc3': 611, u'\xc4': 611, u'\xc5': 611, u'\xc6': 889, u'\xc7': 667, u'\xc8': 611, u'\xc9': 611, u'\xca': 611, u'\xcb': 611, u'\xcc': 333, u'\xcd': 333, u'\xce': 333, u'\xcf': 333, u'\xd0': 722, u'\xd1': 667, u'\xd2': 722, u'\xd3': 722, u'\xd4': 722, u'\xd5': 722, u'\xd6': 722, u'\xd7': 675, u'\xd8': 722, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 556, u'\xde': 611, u'\xdf': 500, u'\xe0': 500, u'\xe1': 500, u'\xe2': 500, u'\xe3': 500, u'\xe4': 500, u'\xe5': 500, u'\xe6': 667, u'\xe7': 444, u'\xe8': 444, u'\xe9': 444, u'\xea': 444, u'\xeb': 444, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 500, u'\xf1': 500, u'\xf2': 500, u'\xf3': 500, u'\xf4': 500, u'\xf5': 500, u'\xf6': 500, u'\xf7': 675, u'\xf8': 500, u'\xf9': 500, u'\xfa': 500, u'\xfb': 500, u'\xfc': 500, u'\xfd': 444, u'\xfe': 500, u'\xff': 444, u'\u0100': 611, u'\u0101': 500, u'\u0102': 611, u'\u0103': 500, u'\u0104': 611, u'\u0105': 500, u'\u0106': 667, u'\u0107': 444, u'\u010c': 667, u'\u010d': 444, u'\u010e': 722, u'\u010f': 544, u'\u0110': 722, u'\u0111': 500, u'\u0112': 611, u'\u0113': 444, u'\u0116': 611, u'\u0117': 444, u'\u0118': 611, u'\u0119': 444, u'\u011a': 611, u'\u011b': 444, u'\u011e': 722, u'\u011f': 500, u'\u0122': 722, u'\u0123': 500, u'\u012a': 333, u'\u012b': 278, u'\u012e': 333, u'\u012f': 278, u'\u0130': 333, u'\u0131': 278, u'\u0136': 667, u'\u0137': 444, u'\u0139': 556, u'\u013a': 278, u'\u013b': 556, u'\u013c': 278, u'\u013d': 611, u'\u013e': 300, u'\u0141': 556, u'\u0142': 278, u'\u0143': 667, u'\u0144': 500, u'\u0145': 667, u'\u0146': 500, u'\u0147': 667, u'\u0148': 500, u'\u014c': 722, u'\u014d': 500, u'\u0150': 722, u'\u0151': 500, u'\u0152': 944, u'\u0153': 667, u'\u0154': 611, u'\u0155': 389, u'\u0156': 611, u'\u0157': 389, u'\u0158': 611, u'\u0159': 389, u'\u015a': 500, u'\u015b': 389, u'\u015e': 500, u'\u015f': 389, u'\u0160': 500, u'\u0161': 389, u'\u0162': 556, u'\u0163': 278, u'\u0164': 556, u'\u0165': 300, u'\u016a': 722, u'\u016b': 500, u'\u016e': 722, u'\u016f': 500, u'\u0170': 722, u'\u0171': 500, u'\u0172': 722, u'\u0173': 500, u'\u0178': 556, u'\u0179': 556, u'\u017a': 389, u'\u017b': 556, u'\u017c': 389, u'\u017d': 556, u'\u017e': 389, u'\u0192': 500, u'\u0218': 500, u'\u0219': 389, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 500, u'\u2014': 889, u'\u2018': 333, u'\u2019': 333, u'\u201a': 333, u'\u201c': 556, u'\u201d': 556, u'\u201e': 556, u'\u2020': 500, u'\u2021': 500, u'\u2022': 350, u'\u2026': 889, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 980, u'\u2202': 476, u'\u2206': 612, u'\u2211': 600, u'\u2212': 675, u'\u221a': 453, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 471, u'\uf6c3': 250, u'\ufb01': 500, u'\ufb02': 500}),
- 'Times-Roman': ({'FontName': 'Times-Roman', 'Descent': -217.0, 'FontBBox': (-168.0, -218.0, 1000.0, 898.0), 'FontWeight': 'Roman', 'CapHeight': 662.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 450.0, 'ItalicAngle': 0.0, 'Ascent': 683.0}, {u' ': 250, u'!': 333, u'"': 408, u'#': 500, u'$': 500, u'%': 833, u'&': 778, u"'": 180, u'(': 333, u')': 333, u'*': 500, u'+': 564, u',': 250, u'-': 333, u'.': 250, u'/': 278, u'0': 500, u'1': 500, u'2': 500, u'3': 500, u'4': 500, u'5': 500, u'6': 500, u'7': 500, u'8': 500, u'9': 500, u':': 278, u';': 278, u'<': 564, u'=': 564, u'>': 564, u'?': 444, u'@': 921, u'A': 722, u'B': 667, u'C': 667, u'D': 722, u'E': 611, u'F': 556, u'G': 722, u'H': 722, u'I': 333, u'J': 389, u'K': 722, u'L': 611, u'M': 889, u'N': 722, u'O': 722, u'P': 556, u'Q': 722, u'R': 667, u'S': 556, u'T': 611, u'U': 722, u'V': 722, u'W': 944, u'X': 722, u'Y': 722, u'Z': 611, u'[': 333, u'\\': 278, u']': 333, u'^': 469, u'_': 500, u'`': 333, u'a': 444, u'b': 500, u'c': 444, u'd': 500, u'e': 444, u'f': 333, u'g': 500, u'h': 500, u'i': 278, u'j': 278, u'k': 500, u'l': 278, u'm': 778, u'n': 500, u'o': 500, u'p': 500, u'q': 500, u'r': 333, u's': 389, u't': 278, u'u': 500, u'v': 500, u'w': 722, u'x': 500, u'y': 500, u'z': 444, u'{': 480, u'|': 200, u'}': 480, u'~': 541, u'\xa1': 333, u'\xa2': 500, u'\xa3': 500, u'\xa4': 500, u'\xa5': 500, u'\xa6': 200, u'\xa7': 500, u'\xa8': 333, u'\xa9': 760, u'\xaa': 276, u'\xab': 500, u'\xac': 564, u'\xae': 760, u'\xaf': 333, u'\xb0': 400, u'\xb1': 564, u'\xb2': 300, u'\xb3': 300, u'\xb4': 333, u'\xb5': 500, u'\xb6': 453, u'\xb7': 250, u'\xb8': 333, u'\xb9': 300, u'\xba': 310, u'\xbb': 500, u'\xbc': 750, u'\xbd': 750, u'\xbe': 750, u'\xbf': 444, u'\xc0': 722, u'\xc1': 722, u'\xc2': 722, u'\xc3': 722, u'\xc4': 722, u'\xc5': 722, u'\xc6': 889, u'\xc7': 667, u'\xc8': 611, u'\xc9': 611, u'\xca': 611, u'\xcb': 611, u'\xcc': 333, u'\xcd': 333, u'\xce': 333, u'\xcf': 333, u'\xd0': 722, u'\xd1': 722, u'\xd2': 722, u'\xd3': 722, u'\xd4': 722, u'\xd5': 722, u'\xd6': 722, u'\xd7': 564, u'\xd8': 722, u'\xd9': 722, u'\xda': 722, u'\xdb': 722, u'\xdc': 722, u'\xdd': 722, u'\xde': 556, u'\xdf': 500, u'\xe0': 444, u'\xe1': 444, u'\xe2': 444, u'\xe3': 444, u'\xe4': 444, u'\xe5': 444, u'\xe6': 667, u'\xe7': 444, u'\xe8': 444, u'\xe9': 444, u'\xea': 444, u'\xeb': 444, u'\xec': 278, u'\xed': 278, u'\xee': 278, u'\xef': 278, u'\xf0': 500, u'\xf1': 500, u'\xf2': 500, u'\xf3': 500, u'\xf4': 500, u'\xf5': 500, u'\xf6': 500, u'\xf7': 564, u'\xf8': 500, u'\xf9': 500, u'\xfa': 500, u'\xfb': 500, u'\xfc': 500, u'\xfd': 500, u'\xfe': 500, u'\xff': 500, u'\u0100': 722, u'\u0101': 444, u'\u0102': 722, u'\u0103': 444, u'\u0104': 722, u'\u0105': 444, u'\u0106': 667, u'\u0107': 444, u'\u010c': 667, u'\u010d': 444, u'\u010e': 722, u'\u010f': 588, u'\u0110': 722, u'\u0111': 500, u'\u0112': 611, u'\u0113': 444, u'\u0116': 611, u'\u0117': 444, u'\u0118': 611, u'\u0119': 444, u'\u011a': 611, u'\u011b': 444, u'\u011e': 722, u'\u011f': 500, u'\u0122': 722, u'\u0123': 500, u'\u012a': 333, u'\u012b': 278, u'\u012e': 333, u'\u012f': 278, u'\u0130': 333, u'\u0131': 278, u'\u0136': 722, u'\u0137': 500, u'\u0139': 611, u'\u013a': 278, u'\u013b': 611, u'\u013c': 278, u'\u013d': 611, u'\u013e': 344, u'\u0141': 611, u'\u0142': 278, u'\u0143': 722, u'\u0144': 500, u'\u0145': 722, u'\u0146': 500, u'\u0147': 722, u'\u0148': 500, u'\u014c': 722, u'\u014d': 500, u'\u0150': 722, u'\u0151': 500, u'\u0152': 889, u'\u0153': 722, u'\u0154': 667, u'\u0155': 333, u'\u0156': 667, u'\u0157': 333, u'\u0158': 667, u'\u0159': 333, u'\u015a': 556, u'\u015b': 389, u'\u015e': 556, u'\u015f': 389, u'\u0160': 556, u'\u0161': 389, u'\u0162': 611, u'\u0163': 278, u'\u0164': 611, u'\u0165': 326, u'\u016a': 722, u'\u016b': 500, u'\u016e': 722, u'\u016f': 500, u'\u0170': 722, u'\u0171': 500, u'\u0172': 722, u'\u0173': 500, u'\u0178': 722, u'\u0179': 611, u'\u017a': 444, u'\u017b': 611, u'\u017c': 444, u'\u017d': 611, u'\u017e': 444, u'\u0192': 500, u'\u0218': 556, u'\u0219': 389, u'\u02c6': 333, u'\u02c7': 333, u'\u02d8': 333, u'\u02d9': 333, u'\u02da': 333, u'\u02db': 333, u'\u02dc': 333, u'\u02dd': 333, u'\u2013': 500, u'\u2014': 1000, u'\u2018': 333, u'\u2019': 333, u'\u201a': 333, u'\u201c': 444, u'\u201d': 444, u'\u201e': 444, u'\u2020': 500, u'\u2021': 500, u'\u2022': 350, u'\u2026': 1000, u'\u2030': 1000, u'\u2039': 333, u'\u203a': 333, u'\u2044': 167, u'\u2122': 980, u'\u2202': 476, u'\u2206': 612, u'\u2211': 600, u'\u2212': 564, u'\u221a': 453, u'\u2260': 549, u'\u2264': 549, u'\u2265': 549, u'\u25ca': 471, u'\uf6c3': 250, u'\ufb01': 556, u'\ufb02': 556}),
- 'ZapfDingbats': ({'FontName': 'ZapfDingbats', 'FontBBox': (-1.0, -143.0, 981.0, 820.0), 'FontWeight': 'Medium', 'FontFamily': 'ITC', 'Flags': 0, 'ItalicAngle': 0.0}, {u'\x01': 974, u'\x02': 961, u'\x03': 980, u'\x04': 719, u'\x05': 789, u'\x06': 494, u'\x07': 552, u'\x08': 537, u'\t': 577, u'\n': 692, u'\x0b': 960, u'\x0c': 939, u'\r': 549, u'\x0e': 855, u'\x0f': 911, u'\x10': 933, u'\x11': 945, u'\x12': 974, u'\x13': 755, u'\x14': 846, u'\x15': 762, u'\x16': 761, u'\x17': 571, u'\x18': 677, u'\x19': 763, u'\x1a': 760, u'\x1b': 759, u'\x1c': 754, u'\x1d': 786, u'\x1e': 788, u'\x1f': 788, u' ': 790, u'!': 793, u'"': 794, u'#': 816, u'$': 823, u'%': 789, u'&': 841, u"'": 823, u'(': 833, u')': 816, u'*': 831, u'+': 923, u',': 744, u'-': 723, u'.': 749, u'/': 790, u'0': 792, u'1': 695, u'2': 776, u'3': 768, u'4': 792, u'5': 759, u'6': 707, u'7': 708, u'8': 682, u'9': 701, u':': 826, u';': 815, u'<': 789, u'=': 789, u'>': 707, u'?': 687, u'@': 696, u'A': 689, u'B': 786, u'C': 787, u'D': 713, u'E': 791, u'F': 785, u'G': 791, u'H': 873, u'I': 761, u'J': 762, u'K': 759, u'L': 892, u'M': 892, u'N': 788, u'O': 784, u'Q': 438, u'R': 138, u'S': 277, u'T': 415, u'U': 509, u'V': 410, u'W': 234, u'X': 234, u'Y': 390, u'Z': 390, u'[': 276, u'\\': 276, u']': 317, u'^': 317, u'_': 334, u'`': 334, u'a': 392, u'b': 392, u'c': 668, u'd': 668, u'e': 732, u'f': 544, u'g': 544, u'h': 910, u'i': 911, u'j': 667, u'k': 760, u'l': 760, u'm': 626, u'n': 694, u'o': 595, u'p': 776, u'u': 690, u'v': 791, u'w': 790, u'x': 788, u'y': 788, u'z': 788, u'{': 788, u'|': 788, u'}': 788, u'~': 788, u'\x7f': 788, u'\x80': 788, u'\x81': 788, u'\x82': 788, u'\x83': 788, u'\x84': 788, u'\x85': 788, u'\x86': 788, u'\x87': 788, u'\x88': 788, u'\x89': 788, u'\x8a': 788, u'\x8b': 788, u'\x8c': 788, u'\x8d': 788, u'\x8e': 788, u'\x8f': 788, u'\x90': 788, u'\x91': 788, u'\x92': 788, u'\x93': 788, u'\x94': 788, u'\x95': 788, u'\x96': 788, u'\x97': 788, u'\x98': 788, u'\x99': 788, u'\x9a': 788, u'\x9b': 788, u'\x9c': 788, u'\x9d': 788, u'\x9e': 788, u'\x9f': 788, u'\xa0': 894, u'\xa1': 838, u'\xa2': 924, u'\xa3': 1016, u'\xa4': 458, u'\xa5': 924, u'\xa6': 918, u'\xa7': 927, u'\xa8': 928, u'\xa9': 928, u'\xaa': 834, u'\xab': 873, u'\xac': 828, u'\xad': 924, u'\xae': 917, u'\xaf': 930, u'\xb0': 931, u'\xb1': 463, u'\xb2': 883, u'\xb3': 836, u'\xb4': 867, u'\xb5': 696, u'\xb6': 874, u'\xb7': 760, u'\xb8': 946, u'\xb9': 865, u'\xba': 967, u'\xbb': 831, u'\xbc': 873, u'\xbd': 927, u'\xbe': 970, u'\xbf': 918, u'\xc0': 748, u'\xc1': 836, u'\xc2': 771, u'\xc3': 888, u'\xc4': 748, u'\xc5': 771, u'\xc6': 888, u'\xc7': 867, u'\xc8': 696, u'\xc9': 874, u'\xca': 974, u'\xcb': 762, u'\xcc': 759, u'\xcd': 509, u'\xce': 410}),
+import struct
+
+PACKED_FONT_METRICS = {
+ 'Courier': ({'FontName': 'Courier', 'Descent': -194.0, 'FontBBox': (-6.0, -249.0, 639.0, 803.0), 'FontWeight': 'Medium', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': 0.0, 'Ascent': 627.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02'),
+ 'Courier-Bold': ({'FontName': 'Courier-Bold', 'Descent': -194.0, 'FontBBox': (-88.0, -249.0, 697.0, 811.0), 'FontWeight': 'Bold', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': 0.0, 'Ascent': 627.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02'),
+ 'Courier-BoldOblique': ({'FontName': 'Courier-BoldOblique', 'Descent': -194.0, 'FontBBox': (-49.0, -249.0, 758.0, 811.0), 'FontWeight': 'Bold', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': -11.0, 'Ascent': 627.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02'),
+ 'Courier-Oblique': ({'FontName': 'Courier-Oblique', 'Descent': -194.0, 'FontBBox': (-49.0, -249.0, 749.0, 803.0), 'FontWeight': 'Medium', 'CapHeight': 572.0, 'FontFamily': 'Courier', 'Flags': 64, 'XHeight': 434.0, 'ItalicAngle': -11.0, 'Ascent': 627.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02X\x02'),
+ 'Helvetica': ({'FontName': 'Helvetica', 'Descent': -207.0, 'FontBBox': (-166.0, -225.0, 1000.0, 931.0), 'FontWeight': 'Medium', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 523.0, 'ItalicAngle': 0.0, 'Ascent': 718.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\x16\x01\x16\x01c\x01,\x02,\x02y\x03\x9b\x02\xbf\x00M\x01M\x01\x85\x01H\x02\x16\x01M\x01\x16\x01\x16\x01,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02\x16\x01\x16\x01H\x02H\x02H\x02,\x02\xf7\x03\x9b\x02\x9b\x02\xd2\x02\xd2\x02\x9b\x02c\x02\n\x03\xd2\x02\x16\x01\xf4\x01\x9b\x02,\x02A\x03\xd2\x02\n\x03\x9b\x02\n\x03\xd2\x02\x9b\x02c\x02\xd2\x02\x9b\x02\xb0\x03\x9b\x02\x9b\x02c\x02\x16\x01\x16\x01\x16\x01\xd5\x01,\x02M\x01,\x02,\x02\xf4\x01,\x02,\x02\x16\x01,\x02,\x02\xde\x00\xde\x00\xf4\x01\xde\x00A\x03,\x02,\x02,\x02,\x02M\x01\xf4\x01\x16\x01,\x02\xf4\x01\xd2\x02\xf4\x01\xf4\x01\xf4\x01N\x01\x04\x01N\x01H\x02M\x01,\x02,\x02,\x02,\x02\x04\x01,\x02M\x01\xe1\x02r\x01,\x02H\x02\xe1\x02M\x01\x90\x01H\x02M\x01M\x01M\x01,\x02\x19\x02\x16\x01M\x01M\x01m\x01,\x02B\x03B\x03B\x03c\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\xe8\x03\xd2\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x16\x01\x16\x01\x16\x01\x16\x01\xd2\x02\xd2\x02\n\x03\n\x03\n\x03\n\x03\n\x03H\x02\n\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\x9b\x02\x9b\x02c\x02,\x02,\x02,\x02,\x02,\x02,\x02y\x03\xf4\x01,\x02,\x02,\x02,\x02\x16\x01\x16\x01\x16\x01\x16\x01,\x02,\x02,\x02,\x02,\x02,\x02,\x02H\x02c\x02,\x02,\x02,\x02,\x02\xf4\x01,\x02\xf4\x01\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\x83\x02\xd2\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\n\x03,\x02\n\x03,\x02\x16\x01\x16\x01\x16\x01\xde\x00\x16\x01\x16\x01\x9b\x02\xf4\x01,\x02\xde\x00,\x02\xde\x00,\x02+\x01,\x02\xde\x00\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\n\x03,\x02\n\x03,\x02\xe8\x03\xb0\x03\xd2\x02M\x01\xd2\x02M\x01\xd2\x02M\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01c\x02\x16\x01c\x02=\x01\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\x9b\x02c\x02\xf4\x01c\x02\xf4\x01c\x02\xf4\x01,\x02\x9b\x02\xf4\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01,\x02\xe8\x03\xde\x00\xde\x00\xde\x00M\x01M\x01M\x01,\x02,\x02^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xe8\x03\xdc\x01d\x02X\x02H\x02\xc5\x01%\x02%\x02%\x02\xd7\x01\xfa\x00\xf4\x01\xf4\x01'),
+ 'Helvetica-Bold': ({'FontName': 'Helvetica-Bold', 'Descent': -207.0, 'FontBBox': (-170.0, -228.0, 1003.0, 962.0), 'FontWeight': 'Bold', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 532.0, 'ItalicAngle': 0.0, 'Ascent': 718.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\x16\x01M\x01\xda\x01,\x02,\x02y\x03\xd2\x02\xee\x00M\x01M\x01\x85\x01H\x02\x16\x01M\x01\x16\x01\x16\x01,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02M\x01M\x01H\x02H\x02H\x02c\x02\xcf\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\x9b\x02c\x02\n\x03\xd2\x02\x16\x01,\x02\xd2\x02c\x02A\x03\xd2\x02\n\x03\x9b\x02\n\x03\xd2\x02\x9b\x02c\x02\xd2\x02\x9b\x02\xb0\x03\x9b\x02\x9b\x02c\x02M\x01\x16\x01M\x01H\x02,\x02M\x01,\x02c\x02,\x02c\x02,\x02M\x01c\x02c\x02\x16\x01\x16\x01,\x02\x16\x01y\x03c\x02c\x02c\x02c\x02\x85\x01,\x02M\x01c\x02,\x02\n\x03,\x02,\x02\xf4\x01\x85\x01\x18\x01\x85\x01H\x02M\x01,\x02,\x02,\x02,\x02\x18\x01,\x02M\x01\xe1\x02r\x01,\x02H\x02\xe1\x02M\x01\x90\x01H\x02M\x01M\x01M\x01c\x02,\x02\x16\x01M\x01M\x01m\x01,\x02B\x03B\x03B\x03c\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xe8\x03\xd2\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x16\x01\x16\x01\x16\x01\x16\x01\xd2\x02\xd2\x02\n\x03\n\x03\n\x03\n\x03\n\x03H\x02\n\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\x9b\x02\x9b\x02c\x02,\x02,\x02,\x02,\x02,\x02,\x02y\x03,\x02,\x02,\x02,\x02,\x02\x16\x01\x16\x01\x16\x01\x16\x01c\x02c\x02c\x02c\x02c\x02c\x02c\x02H\x02c\x02c\x02c\x02c\x02c\x02,\x02c\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02\xe7\x02\xd2\x02c\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\n\x03c\x02\n\x03c\x02\x16\x01\x16\x01\x16\x01\x16\x01\x16\x01\x16\x01\xd2\x02,\x02c\x02\x16\x01c\x02\x16\x01c\x02\x90\x01c\x02\x16\x01\xd2\x02c\x02\xd2\x02c\x02\xd2\x02c\x02\n\x03c\x02\n\x03c\x02\xe8\x03\xb0\x03\xd2\x02\x85\x01\xd2\x02\x85\x01\xd2\x02\x85\x01\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02c\x02M\x01c\x02\x85\x01\xd2\x02c\x02\xd2\x02c\x02\xd2\x02c\x02\xd2\x02c\x02\x9b\x02c\x02\xf4\x01c\x02\xf4\x01c\x02\xf4\x01,\x02\x9b\x02,\x02M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01,\x02\xe8\x03\x16\x01\x16\x01\x16\x01\xf4\x01\xf4\x01\xf4\x01,\x02,\x02^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xe8\x03\xee\x01d\x02X\x02H\x02%\x02%\x02%\x02%\x02\xee\x01\xfa\x00c\x02c\x02'),
+ 'Helvetica-BoldOblique': ({'FontName': 'Helvetica-BoldOblique', 'Descent': -207.0, 'FontBBox': (-175.0, -228.0, 1114.0, 962.0), 'FontWeight': 'Bold', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 532.0, 'ItalicAngle': -12.0, 'Ascent': 718.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\x16\x01M\x01\xda\x01,\x02,\x02y\x03\xd2\x02\xee\x00M\x01M\x01\x85\x01H\x02\x16\x01M\x01\x16\x01\x16\x01,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02M\x01M\x01H\x02H\x02H\x02c\x02\xcf\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\x9b\x02c\x02\n\x03\xd2\x02\x16\x01,\x02\xd2\x02c\x02A\x03\xd2\x02\n\x03\x9b\x02\n\x03\xd2\x02\x9b\x02c\x02\xd2\x02\x9b\x02\xb0\x03\x9b\x02\x9b\x02c\x02M\x01\x16\x01M\x01H\x02,\x02M\x01,\x02c\x02,\x02c\x02,\x02M\x01c\x02c\x02\x16\x01\x16\x01,\x02\x16\x01y\x03c\x02c\x02c\x02c\x02\x85\x01,\x02M\x01c\x02,\x02\n\x03,\x02,\x02\xf4\x01\x85\x01\x18\x01\x85\x01H\x02M\x01,\x02,\x02,\x02,\x02\x18\x01,\x02M\x01\xe1\x02r\x01,\x02H\x02\xe1\x02M\x01\x90\x01H\x02M\x01M\x01M\x01c\x02,\x02\x16\x01M\x01M\x01m\x01,\x02B\x03B\x03B\x03c\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xe8\x03\xd2\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x16\x01\x16\x01\x16\x01\x16\x01\xd2\x02\xd2\x02\n\x03\n\x03\n\x03\n\x03\n\x03H\x02\n\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\x9b\x02\x9b\x02c\x02,\x02,\x02,\x02,\x02,\x02,\x02y\x03,\x02,\x02,\x02,\x02,\x02\x16\x01\x16\x01\x16\x01\x16\x01c\x02c\x02c\x02c\x02c\x02c\x02c\x02H\x02c\x02c\x02c\x02c\x02c\x02,\x02c\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02\xe7\x02\xd2\x02c\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\n\x03c\x02\n\x03c\x02\x16\x01\x16\x01\x16\x01\x16\x01\x16\x01\x16\x01\xd2\x02,\x02c\x02\x16\x01c\x02\x16\x01c\x02\x90\x01c\x02\x16\x01\xd2\x02c\x02\xd2\x02c\x02\xd2\x02c\x02\n\x03c\x02\n\x03c\x02\xe8\x03\xb0\x03\xd2\x02\x85\x01\xd2\x02\x85\x01\xd2\x02\x85\x01\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02c\x02M\x01c\x02\x85\x01\xd2\x02c\x02\xd2\x02c\x02\xd2\x02c\x02\xd2\x02c\x02\x9b\x02c\x02\xf4\x01c\x02\xf4\x01c\x02\xf4\x01,\x02\x9b\x02,\x02M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01,\x02\xe8\x03\x16\x01\x16\x01\x16\x01\xf4\x01\xf4\x01\xf4\x01,\x02,\x02^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xe8\x03\xee\x01d\x02X\x02H\x02%\x02%\x02%\x02%\x02\xee\x01\xfa\x00c\x02c\x02'),
+ 'Helvetica-Oblique': ({'FontName': 'Helvetica-Oblique', 'Descent': -207.0, 'FontBBox': (-171.0, -225.0, 1116.0, 931.0), 'FontWeight': 'Medium', 'CapHeight': 718.0, 'FontFamily': 'Helvetica', 'Flags': 0, 'XHeight': 523.0, 'ItalicAngle': -12.0, 'Ascent': 718.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\x16\x01\x16\x01c\x01,\x02,\x02y\x03\x9b\x02\xbf\x00M\x01M\x01\x85\x01H\x02\x16\x01M\x01\x16\x01\x16\x01,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02,\x02\x16\x01\x16\x01H\x02H\x02H\x02,\x02\xf7\x03\x9b\x02\x9b\x02\xd2\x02\xd2\x02\x9b\x02c\x02\n\x03\xd2\x02\x16\x01\xf4\x01\x9b\x02,\x02A\x03\xd2\x02\n\x03\x9b\x02\n\x03\xd2\x02\x9b\x02c\x02\xd2\x02\x9b\x02\xb0\x03\x9b\x02\x9b\x02c\x02\x16\x01\x16\x01\x16\x01\xd5\x01,\x02M\x01,\x02,\x02\xf4\x01,\x02,\x02\x16\x01,\x02,\x02\xde\x00\xde\x00\xf4\x01\xde\x00A\x03,\x02,\x02,\x02,\x02M\x01\xf4\x01\x16\x01,\x02\xf4\x01\xd2\x02\xf4\x01\xf4\x01\xf4\x01N\x01\x04\x01N\x01H\x02M\x01,\x02,\x02,\x02,\x02\x04\x01,\x02M\x01\xe1\x02r\x01,\x02H\x02\xe1\x02M\x01\x90\x01H\x02M\x01M\x01M\x01,\x02\x19\x02\x16\x01M\x01M\x01m\x01,\x02B\x03B\x03B\x03c\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\xe8\x03\xd2\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x16\x01\x16\x01\x16\x01\x16\x01\xd2\x02\xd2\x02\n\x03\n\x03\n\x03\n\x03\n\x03H\x02\n\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\x9b\x02\x9b\x02c\x02,\x02,\x02,\x02,\x02,\x02,\x02y\x03\xf4\x01,\x02,\x02,\x02,\x02\x16\x01\x16\x01\x16\x01\x16\x01,\x02,\x02,\x02,\x02,\x02,\x02,\x02H\x02c\x02,\x02,\x02,\x02,\x02\xf4\x01,\x02\xf4\x01\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\x83\x02\xd2\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\x9b\x02,\x02\n\x03,\x02\n\x03,\x02\x16\x01\x16\x01\x16\x01\xde\x00\x16\x01\x16\x01\x9b\x02\xf4\x01,\x02\xde\x00,\x02\xde\x00,\x02+\x01,\x02\xde\x00\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\n\x03,\x02\n\x03,\x02\xe8\x03\xb0\x03\xd2\x02M\x01\xd2\x02M\x01\xd2\x02M\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01c\x02\x16\x01c\x02=\x01\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\x9b\x02c\x02\xf4\x01c\x02\xf4\x01c\x02\xf4\x01,\x02\x9b\x02\xf4\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01,\x02\xe8\x03\xde\x00\xde\x00\xde\x00M\x01M\x01M\x01,\x02,\x02^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xe8\x03\xdc\x01d\x02X\x02H\x02\xc5\x01%\x02%\x02%\x02\xd7\x01\xfa\x00\xf4\x01\xf4\x01'),
+ 'Symbol': ({'FontName': 'Symbol', 'FontBBox': (-180.0, -293.0, 1090.0, 1010.0), 'FontWeight': 'Medium', 'FontFamily': 'Symbol', 'Flags': 0, 'ItalicAngle': 0.0},
+  ' !#%&()+,./0123456789:;<=>?[]_{|}¬°±µ×÷ƒΑΒΓΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨαβγδεζηθικλνξοπρςστυφχψωϑϒϕϖ•…′″⁄€ℑ℘ℜΩℵ←↑→↓↔↵⇐⇑⇒⇓⇔∀∂∃∅∆∇∈∉∋∏∑−∗√∝∞∠∧∨∩∪∫∴∼≅≈≠≡≤≥⊂⊃⊄⊆⊇⊕⊗⊥⋅⌠⌡〈〉◊♠♣♥♦\uf6d9\uf6da\uf6db\uf8e5\uf8e6\uf8e7\uf8e8\uf8e9\uf8ea\uf8eb\uf8ec\uf8ed\uf8ee\uf8ef\uf8f0\uf8f1\uf8f2\uf8f3\uf8f4\uf8f5\uf8f6\uf8f7\uf8f8\uf8f9\uf8fa\uf8fb\uf8fc\uf8fd\uf8fe\uf8ff',
+  b'\xfa\x00M\x01\xf4\x01A\x03\n\x03M\x01M\x01%\x02\xfa\x00\xfa\x00\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\x16\x01\x16\x01%\x02%\x02%\x02\xbc\x01M\x01M\x01\xf4\x01\xe0\x01\xc8\x00\xe0\x01\xc9\x02\x90\x01%\x02@\x02%\x02%\x02\xf4\x01\xd2\x02\x9b\x02[\x02c\x02c\x02\xd2\x02\xe5\x02M\x01\xd2\x02\xae\x02y\x03\xd2\x02\x85\x02\xd2\x02\x00\x03,\x02P\x02c\x02\xb2\x02\xfb\x02\xd2\x02\x1b\x03w\x02%\x02\x9b\x01\xee\x01\xb7\x01\xee\x01[\x02\t\x02I\x01%\x02%\x02\t\x02\xed\x01%\x02%\x02%\x02\xb7\x01[\x02\xb7\x01@\x02\t\x02%\x02\xae\x02\xae\x02w\x02l\x02[\x02\xc9\x02\xcc\x01\xe8\x03\xf7\x00\x9b\x01\xa7\x00\xee\x02\xae\x02\xdb\x03\x1b\x03\x00\x037\x03\xdb\x03[\x02\xdb\x03[\x02\x12\x04\x92\x02\xdb\x03[\x02\xdb\x03[\x02\x12\x04\xc9\x02\xee\x01%\x027\x03d\x02\xc9\x02\xc9\x02\xc9\x02\xb7\x017\x03\xc9\x02%\x02\xf4\x01%\x02\xc9\x02\xc9\x02\x00\x03[\x02[\x02\x00\x03\x00\x03\x12\x01_\x03%\x02%\x02%\x02%\x02%\x02%\x02%\x02\xc9\x02\xc9\x02\xc9\x02\xc9\x02\xc9\x02\x00\x03\x00\x03\x92\x02\xfa\x00\xae\x02\xae\x02I\x01I\x01\xee\x01\xf1\x02\xf1\x02\xf1\x02\xf1\x02\x16\x03\x16\x03z\x03\xf4\x01[\x02\xe8\x03\x16\x03\x16\x03\x12\x03\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\xee\x01\xee\x01\xee\x01\xee\x01\xae\x02\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\xee\x01\xee\x01\xee\x01\x16\x03'),
+ 'Times-Bold': ({'FontName': 'Times-Bold', 'Descent': -217.0, 'FontBBox': (-168.0, -218.0, 1000.0, 935.0), 'FontWeight': 'Bold', 'CapHeight': 676.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 461.0, 'ItalicAngle': 0.0, 'Ascent': 683.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\xfa\x00M\x01+\x02\xf4\x01\xf4\x01\xe8\x03A\x03\x16\x01M\x01M\x01\xf4\x01:\x02\xfa\x00M\x01\xfa\x00\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01M\x01M\x01:\x02:\x02:\x02\xf4\x01\xa2\x03\xd2\x02\x9b\x02\xd2\x02\xd2\x02\x9b\x02c\x02\n\x03\n\x03\x85\x01\xf4\x01\n\x03\x9b\x02\xb0\x03\xd2\x02\n\x03c\x02\n\x03\xd2\x02,\x02\x9b\x02\xd2\x02\xd2\x02\xe8\x03\xd2\x02\xd2\x02\x9b\x02M\x01\x16\x01M\x01E\x02\xf4\x01M\x01\xf4\x01,\x02\xbc\x01,\x02\xbc\x01M\x01\xf4\x01,\x02\x16\x01M\x01,\x02\x16\x01A\x03,\x02\xf4\x01,\x02,\x02\xbc\x01\x85\x01M\x01,\x02\xf4\x01\xd2\x02\xf4\x01\xf4\x01\xbc\x01\x8a\x01\xdc\x00\x8a\x01\x08\x02M\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xdc\x00\xf4\x01M\x01\xeb\x02,\x01\xf4\x01:\x02\xeb\x02M\x01\x90\x01:\x02,\x01,\x01M\x01,\x02\x1c\x02\xfa\x00M\x01,\x01J\x01\xf4\x01\xee\x02\xee\x02\xee\x02\xf4\x01\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xe8\x03\xd2\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x85\x01\x85\x01\x85\x01\x85\x01\xd2\x02\xd2\x02\n\x03\n\x03\n\x03\n\x03\n\x03:\x02\n\x03\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02c\x02,\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xd2\x02\xbc\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\x16\x01\x16\x01\x16\x01\x16\x01\xf4\x01,\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01:\x02\xf4\x01,\x02,\x02,\x02,\x02\xf4\x01,\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xbc\x01\xd2\x02\xbc\x01\xd2\x02\xa0\x02\xd2\x02,\x02\x9b\x02\xbc\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\n\x03\xf4\x01\n\x03\xf4\x01\x85\x01\x16\x01\x85\x01\x16\x01\x85\x01\x16\x01\n\x03,\x02\x9b\x02\x16\x01\x9b\x02\x16\x01\x9b\x02\x8a\x01\x9b\x02\x16\x01\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\n\x03\xf4\x01\n\x03\xf4\x01\xe8\x03\xd2\x02\xd2\x02\xbc\x01\xd2\x02\xbc\x01\xd2\x02\xbc\x01,\x02\x85\x01,\x02\x85\x01,\x02\x85\x01\x9b\x02M\x01\x9b\x02\xa0\x01\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02\x9b\x02\xbc\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\xf4\x01,\x02\x85\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01\xf4\x01\xe8\x03M\x01M\x01M\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xe8\x03\xee\x01d\x02X\x02:\x02%\x02%\x02%\x02%\x02\xee\x01\xfa\x00,\x02,\x02'),
+ 'Times-BoldItalic': ({'FontName': 'Times-BoldItalic', 'Descent': -217.0, 'FontBBox': (-200.0, -218.0, 996.0, 921.0), 'FontWeight': 'Bold', 'CapHeight': 669.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 462.0, 'ItalicAngle': -15.0, 'Ascent': 683.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\xfa\x00\x85\x01+\x02\xf4\x01\xf4\x01A\x03\n\x03\x16\x01M\x01M\x01\xf4\x01:\x02\xfa\x00M\x01\xfa\x00\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01M\x01M\x01:\x02:\x02:\x02\xf4\x01@\x03\x9b\x02\x9b\x02\x9b\x02\xd2\x02\x9b\x02\x9b\x02\xd2\x02\n\x03\x85\x01\xf4\x01\x9b\x02c\x02y\x03\xd2\x02\xd2\x02c\x02\xd2\x02\x9b\x02,\x02c\x02\xd2\x02\x9b\x02y\x03\x9b\x02c\x02c\x02M\x01\x16\x01M\x01:\x02\xf4\x01M\x01\xf4\x01\xf4\x01\xbc\x01\xf4\x01\xbc\x01M\x01\xf4\x01,\x02\x16\x01\x16\x01\xf4\x01\x16\x01\n\x03,\x02\xf4\x01\xf4\x01\xf4\x01\x85\x01\x85\x01\x16\x01,\x02\xbc\x01\x9b\x02\xf4\x01\xbc\x01\x85\x01\\\x01\xdc\x00\\\x01:\x02\x85\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xdc\x00\xf4\x01M\x01\xeb\x02\n\x01\xf4\x01^\x02\xeb\x02M\x01\x90\x01:\x02,\x01,\x01M\x01@\x02\xf4\x01\xfa\x00M\x01,\x01,\x01\xf4\x01\xee\x02\xee\x02\xee\x02\xf4\x01\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\xb0\x03\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x9b\x02\x85\x01\x85\x01\x85\x01\x85\x01\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02:\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02c\x02c\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xd2\x02\xbc\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\x16\x01\x16\x01\x16\x01\x16\x01\xf4\x01,\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01:\x02\xf4\x01,\x02,\x02,\x02,\x02\xbc\x01\xf4\x01\xbc\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\xd2\x02`\x02\xd2\x02\xf4\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\x85\x01\x16\x01\x85\x01\x16\x01\x85\x01\x16\x01\x9b\x02\xf4\x01c\x02\x16\x01c\x02\x16\x01c\x02~\x01c\x02\x16\x01\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xb0\x03\xd2\x02\x9b\x02\x85\x01\x9b\x02\x85\x01\x9b\x02\x85\x01,\x02\x85\x01,\x02\x85\x01,\x02\x85\x01c\x02\x16\x01c\x02n\x01\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02\xd2\x02,\x02c\x02c\x02\x85\x01c\x02\x85\x01c\x02\x85\x01\xf4\x01,\x02\x85\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01\xf4\x01\xe8\x03M\x01M\x01M\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xe8\x03\xee\x01d\x02X\x02^\x02%\x02%\x02%\x02%\x02\xee\x01\xfa\x00,\x02,\x02'),
+ 'Times-Italic': ({'FontName': 'Times-Italic', 'Descent': -217.0, 'FontBBox': (-169.0, -217.0, 1010.0, 883.0), 'FontWeight': 'Medium', 'CapHeight': 653.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 441.0, 'ItalicAngle': -15.5, 'Ascent': 683.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\xfa\x00M\x01\xa4\x01\xf4\x01\xf4\x01A\x03\n\x03\xd6\x00M\x01M\x01\xf4\x01\xa3\x02\xfa\x00M\x01\xfa\x00\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01M\x01M\x01\xa3\x02\xa3\x02\xa3\x02\xf4\x01\x98\x03c\x02c\x02\x9b\x02\xd2\x02c\x02c\x02\xd2\x02\xd2\x02M\x01\xbc\x01\x9b\x02,\x02A\x03\x9b\x02\xd2\x02c\x02\xd2\x02c\x02\xf4\x01,\x02\xd2\x02c\x02A\x03c\x02,\x02,\x02\x85\x01\x16\x01\x85\x01\xa6\x01\xf4\x01M\x01\xf4\x01\xf4\x01\xbc\x01\xf4\x01\xbc\x01\x16\x01\xf4\x01\xf4\x01\x16\x01\x16\x01\xbc\x01\x16\x01\xd2\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\x85\x01\x85\x01\x16\x01\xf4\x01\xbc\x01\x9b\x02\xbc\x01\xbc\x01\x85\x01\x90\x01\x13\x01\x90\x01\x1d\x02\x85\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\x13\x01\xf4\x01M\x01\xf8\x02\x14\x01\xf4\x01\xa3\x02\xf8\x02M\x01\x90\x01\xa3\x02,\x01,\x01M\x01\xf4\x01\x0b\x02\xfa\x00M\x01,\x016\x01\xf4\x01\xee\x02\xee\x02\xee\x02\xf4\x01c\x02c\x02c\x02c\x02c\x02c\x02y\x03\x9b\x02c\x02c\x02c\x02c\x02M\x01M\x01M\x01M\x01\xd2\x02\x9b\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xa3\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02,\x02c\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\x9b\x02\xbc\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\x16\x01\x16\x01\x16\x01\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xa3\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xbc\x01\xf4\x01\xbc\x01c\x02\xf4\x01c\x02\xf4\x01c\x02\xf4\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\xd2\x02 \x02\xd2\x02\xf4\x01c\x02\xbc\x01c\x02\xbc\x01c\x02\xbc\x01c\x02\xbc\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01M\x01\x16\x01M\x01\x16\x01M\x01\x16\x01\x9b\x02\xbc\x01,\x02\x16\x01,\x02\x16\x01c\x02,\x01,\x02\x16\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01\x9b\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xb0\x03\x9b\x02c\x02\x85\x01c\x02\x85\x01c\x02\x85\x01\xf4\x01\x85\x01\xf4\x01\x85\x01\xf4\x01\x85\x01,\x02\x16\x01,\x02,\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01,\x02,\x02\x85\x01,\x02\x85\x01,\x02\x85\x01\xf4\x01\xf4\x01\x85\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01\xf4\x01y\x03M\x01M\x01M\x01,\x02,\x02,\x02\xf4\x01\xf4\x01^\x01y\x03\xe8\x03M\x01M\x01\xa7\x00\xd4\x03\xdc\x01d\x02X\x02\xa3\x02\xc5\x01%\x02%\x02%\x02\xd7\x01\xfa\x00\xf4\x01\xf4\x01'),
+ 'Times-Roman': ({'FontName': 'Times-Roman', 'Descent': -217.0, 'FontBBox': (-168.0, -218.0, 1000.0, 898.0), 'FontWeight': 'Roman', 'CapHeight': 662.0, 'FontFamily': 'Times', 'Flags': 0, 'XHeight': 450.0, 'ItalicAngle': 0.0, 'Ascent': 683.0},
+  ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¡¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿĀāĂăĄąĆćČčĎďĐđĒēĖėĘęĚěĞğĢģĪīĮįİıĶķĹĺĻļĽľŁłŃńŅņŇňŌōŐőŒœŔŕŖŗŘřŚśŞşŠšŢţŤťŪūŮůŰűŲųŸŹźŻżŽžƒȘșˆˇ˘˙˚˛˜˝–—‘’‚“”„†‡•…‰‹›⁄™∂∆∑−√≠≤≥◊\uf6c3ﬁﬂ',
+  b'\xfa\x00M\x01\x98\x01\xf4\x01\xf4\x01A\x03\n\x03\xb4\x00M\x01M\x01\xf4\x014\x02\xfa\x00M\x01\xfa\x00\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\x16\x01\x16\x014\x024\x024\x02\xbc\x01\x99\x03\xd2\x02\x9b\x02\x9b\x02\xd2\x02c\x02,\x02\xd2\x02\xd2\x02M\x01\x85\x01\xd2\x02c\x02y\x03\xd2\x02\xd2\x02,\x02\xd2\x02\x9b\x02,\x02c\x02\xd2\x02\xd2\x02\xb0\x03\xd2\x02\xd2\x02c\x02M\x01\x16\x01M\x01\xd5\x01\xf4\x01M\x01\xbc\x01\xf4\x01\xbc\x01\xf4\x01\xbc\x01M\x01\xf4\x01\xf4\x01\x16\x01\x16\x01\xf4\x01\x16\x01\n\x03\xf4\x01\xf4\x01\xf4\x01\xf4\x01M\x01\x85\x01\x16\x01\xf4\x01\xf4\x01\xd2\x02\xf4\x01\xf4\x01\xbc\x01\xe0\x01\xc8\x00\xe0\x01\x1d\x02M\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xc8\x00\xf4\x01M\x01\xf8\x02\x14\x01\xf4\x014\x02\xf8\x02M\x01\x90\x014\x02,\x01,\x01M\x01\xf4\x01\xc5\x01\xfa\x00M\x01,\x016\x01\xf4\x01\xee\x02\xee\x02\xee\x02\xbc\x01\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02y\x03\x9b\x02c\x02c\x02c\x02c\x02M\x01M\x01M\x01M\x01\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x024\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02\xd2\x02,\x02\xf4\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\x9b\x02\xbc\x01\xbc\x01\xbc\x01\xbc\x01\xbc\x01\x16\x01\x16\x01\x16\x01\x16\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x014\x02\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xf4\x01\xd2\x02\xbc\x01\xd2\x02\xbc\x01\xd2\x02\xbc\x01\x9b\x02\xbc\x01\x9b\x02\xbc\x01\xd2\x02L\x02\xd2\x02\xf4\x01c\x02\xbc\x01c\x02\xbc\x01c\x02\xbc\x01c\x02\xbc\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01M\x01\x16\x01M\x01\x16\x01M\x01\x16\x01\xd2\x02\xf4\x01c\x02\x16\x01c\x02\x16\x01c\x02X\x01c\x02\x16\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01y\x03\xd2\x02\x9b\x02M\x01\x9b\x02M\x01\x9b\x02M\x01,\x02\x85\x01,\x02\x85\x01,\x02\x85\x01c\x02\x16\x01c\x02F\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02\xf4\x01\xd2\x02c\x02\xbc\x01c\x02\xbc\x01c\x02\xbc\x01\xf4\x01,\x02\x85\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01M\x01\xf4\x01\xe8\x03M\x01M\x01M\x01\xbc\x01\xbc\x01\xbc\x01\xf4\x01\xf4\x01^\x01\xe8\x03\xe8\x03M\x01M\x01\xa7\x00\xd4\x03\xdc\x01d\x02X\x024\x02\xc5\x01%\x02%\x02%\x02\xd7\x01\xfa\x00,\x02,\x02'),
+ 'ZapfDingbats': ({'FontName': 'ZapfDingbats', 'FontBBox': (-1.0, -143.0, 981.0, 820.0), 'FontWeight': 'Medium', 'FontFamily': 'ITC', 'Flags': 0, 'ItalicAngle': 0.0},
+  '\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOQRSTUVWXYZ[\\]^_`abcdefghijklmnopuvwxyz{|}~\x7f\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0¡¢£¤¥¦§¨©ª«¬\xad®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎ',
+  b'\xce\x03\xc1\x03\xd4\x03\xcf\x02\x15\x03\xee\x01(\x02\x19\x02A\x02\xb4\x02\xc0\x03\xab\x03%\x02W\x03\x8f\x03\xa5\x03\xb1\x03\xce\x03\xf3\x02N\x03\xfa\x02\xf9\x02;\x02\xa5\x02\xfb\x02\xf8\x02\xf7\x02\xf2\x02\x12\x03\x14\x03\x14\x03\x16\x03\x19\x03\x1a\x030\x037\x03\x15\x03I\x037\x03A\x030\x03?\x03\x9b\x03\xe8\x02\xd3\x02\xed\x02\x16\x03\x18\x03\xb7\x02\x08\x03\x00\x03\x18\x03\xf7\x02\xc3\x02\xc4\x02\xaa\x02\xbd\x02:\x03/\x03\x15\x03\x15\x03\xc3\x02\xaf\x02\xb8\x02\xb1\x02\x12\x03\x13\x03\xc9\x02\x17\x03\x11\x03\x17\x03i\x03\xf9\x02\xfa\x02\xf7\x02|\x03|\x03\x14\x03\x10\x03\xb6\x01\x8a\x00\x15\x01\x9f\x01\xfd\x01\x9a\x01\xea\x00\xea\x00\x86\x01\x86\x01\x14\x01\x14\x01=\x01=\x01N\x01N\x01\x88\x01\x88\x01\x9c\x02\x9c\x02\xdc\x02 \x02 \x02\x8e\x03\x8f\x03\x9b\x02\xf8\x02\xf8\x02r\x02\xb6\x02S\x02\x08\x03\xb2\x02\x17\x03\x16\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03\x14\x03~\x03F\x03\x9c\x03\xf8\x03\xca\x01\x9c\x03\x96\x03\x9f\x03\xa0\x03\xa0\x03B\x03i\x03<\x03\x9c\x03\x95\x03\xa2\x03\xa3\x03\xcf\x01s\x03D\x03c\x03\xb8\x02j\x03\xf8\x02\xb2\x03a\x03\xc7\x03?\x03i\x03\x9f\x03\xca\x03\x96\x03\xec\x02D\x03\x03\x03x\x03\xec\x02\x03\x03x\x03c\x03\xb8\x02j\x03\xce\x03\xfa\x02\xf7\x02\xfd\x01\x9a\x01'),
 }
+
+
+# get_font_metrics: returns the descriptor and the widths of a core font.
+def get_font_metrics(fontname):
+    (props, chars, data) = PACKED_FONT_METRICS[fontname]
+    widths = struct.unpack('<%dH' % len(chars), data)
+    return (props, dict(zip(chars, widths)))
+
+
+# FONT_METRICS: unpacks all the fonts, for compatibility.
+# Module __getattr__ (PEP 562) needs Python 3.7.
+def __getattr__(name):
+    if name == 'FONT_METRICS':
+        return dict((fontname, get_font_metrics(fontname))
+                    for fontname in PACKED_FONT_METRICS)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -1,4 +1,8 @@
 #!/usr/bin/env python
+import copy
+import heapq
+from array import array
+from collections import deque
 from .utils import INF
 from .utils import Plane
 from .utils import get_bound
@@ -10,6 +14,25 @@ from .utils import matrix2str
 from .utils import apply_matrix_pt
 
 
+# The number of steps between two checks of the budget deadline.
+BUDGET_CHECK_INTERVAL = 1000
+
+# NumPy is optional and only imported when text is grouped.
+# False means the import has not been attempted yet.
+numpy = False
+
+# get_numpy: import NumPy once; returns None if it is not available.
+def get_numpy():
+    global numpy
+    if numpy is False:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy = module
+    return numpy
+
+
 ##  IndexAssigner
 ##
 class IndexAssigner:
@@ -39,7 +62,8 @@ class LAParams:
                  word_margin=0.1,
                  boxes_flow=0.5,
                  detect_vertical=False,
-                 all_texts=False):
+                 all_texts=False,
+                 max_textboxes=None):
         self.line_overlap = line_overlap
         self.char_margin = char_margin
         self.line_margin = line_margin
@@ -47,6 +71,9 @@ class LAParams:
         self.boxes_flow = boxes_flow
         self.detect_vertical = detect_vertical
         self.all_texts = all_texts
+        # max_textboxes: skip the hierarchical grouping of textboxes
+        # when a page has more textboxes than this.
+        self.max_textboxes = max_textboxes
         return
 
     def __repr__(self):
@@ -58,8 +85,14 @@ class LAParams:
 ##
 class LTItem:
 
-    def analyze(self, laparams):
-        """Perform the layout analysis."""
+    __slots__ = ()
+
+    def analyze(self, laparams, budget=None):
+        """Perform the layout analysis.
+
+        budget is a PDFBudget whose deadline is checked while
+        grouping the objects, or None.
+        """
         return
 
 
@@ -67,6 +100,8 @@ class LTItem:
 ##
 class LTText:
 
+    __slots__ = ()
+
     def __repr__(self):
         return ('<%s %r>' %
                 (self.__class__.__name__, self.get_text()))
@@ -79,6 +114,8 @@ class LTText:
 ##
 class LTComponent(LTItem):
 
+    __slots__ = ('x0', 'y0', 'x1', 'y1', 'width', 'height', 'bbox')
+
     def __init__(self, bbox):
         LTItem.__init__(self)
         self.set_bbox(bbox)
@@ -109,6 +146,13 @@ class LTComponent(LTItem):
         self.bbox = bbox
         return
 
+    def moved(self, dx, dy):
+        """Returns a copy of the item moved by (dx, dy)."""
+        obj = copy.copy(self)
+        (x0, y0, x1, y1) = self.bbox
+        obj.set_bbox((x0+dx, y0+dy, x1+dx, y1+dy))
+        return obj
+
     def is_empty(self):
         return self.width <= 0 or self.height <= 0
 
@@ -162,6 +206,11 @@ class LTCurve(LTComponent):
     def get_pts(self):
         return ','.join('%.3f,%.3f' % p for p in self.pts)
 
+    def moved(self, dx, dy):
+        obj = LTComponent.moved(self, dx, dy)
+        obj.pts = [(x+dx, y+dy) for (x, y) in self.pts]
+        return obj
+
 
 ##  LTLine
 ##
@@ -209,6 +258,8 @@ class LTImage(LTComponent):
 ##
 class LTAnno(LTItem, LTText):
 
+    __slots__ = ('_text',)
+
     def __init__(self, text):
         self._text = text
         return
@@ -217,53 +268,109 @@ class LTAnno(LTItem, LTText):
         return self._text
 
 
+# get_char_geometry
+def get_char_geometry(matrix, font, fontsize, scaling, rise, textwidth, textdisp):
+    """Returns (adv, upright, bbox, size) of a character."""
+    adv = textwidth * fontsize * scaling
+    # compute the boundary rectangle.
+    if font.is_vertical():
+        # vertical
+        width = font.get_width() * fontsize
+        (vx, vy) = textdisp
+        if vx is None:
+            vx = width * 0.5
+        else:
+            vx = vx * fontsize * .001
+        vy = (1000 - vy) * fontsize * .001
+        tx = -vx
+        ty = vy + rise
+        bll = (tx, ty+adv)
+        bur = (tx+width, ty)
+    else:
+        # horizontal
+        height = font.get_height() * fontsize
+        descent = font.get_descent() * fontsize
+        ty = descent + rise
+        bll = (0, ty)
+        bur = (adv, ty+height)
+    (a, b, c, d, e, f) = matrix
+    upright = (0 < a*d*scaling and b*c <= 0)
+    (x0, y0) = apply_matrix_pt(matrix, bll)
+    (x1, y1) = apply_matrix_pt(matrix, bur)
+    if x1 < x0:
+        (x0, x1) = (x1, x0)
+    if y1 < y0:
+        (y0, y1) = (y1, y0)
+    if font.is_vertical():
+        size = x1-x0
+    else:
+        size = y1-y0
+    return (adv, upright, (x0, y0, x1, y1), size)
+
+
+def get_run_geometry(matrices, font, fontsize, scaling, rise, textwidths, textdisps):
+    """Returns a list of (adv, upright, bbox, size) of a run of characters.
+
+    The font values are looked up once for the run.
+    The results are the same as get_char_geometry() for each character.
+    """
+    if font.is_vertical():
+        return [get_char_geometry(matrix, font, fontsize, scaling, rise, textwidth, textdisp)
+                for (matrix, textwidth, textdisp) in zip(matrices, textwidths, textdisps)]
+    height = font.get_height() * fontsize
+    descent = font.get_descent() * fontsize
+    ty = descent + rise
+    ty1 = ty+height
+    geometries = []
+    for (matrix, textwidth) in zip(matrices, textwidths):
+        adv = textwidth * fontsize * scaling
+        (a, b, c, d, e, f) = matrix
+        upright = (0 < a*d*scaling and b*c <= 0)
+        (x0, y0) = (a*0+c*ty+e, b*0+d*ty+f)
+        (x1, y1) = (a*adv+c*ty1+e, b*adv+d*ty1+f)
+        if x1 < x0:
+            (x0, x1) = (x1, x0)
+        if y1 < y0:
+            (y0, y1) = (y1, y0)
+        geometries.append((adv, upright, (x0, y0, x1, y1), y1-y0))
+    return geometries
+
+
 ##  LTChar
 ##
 class LTChar(LTComponent, LTText):
 
+    __slots__ = ('_text', 'matrix', 'fontname', 'adv', 'upright', 'size')
+
     def __init__(self, matrix, font, fontsize, scaling, rise,
                  text, textwidth, textdisp):
         LTText.__init__(self)
         self._text = text
         self.matrix = matrix
         self.fontname = font.fontname
-        self.adv = textwidth * fontsize * scaling
-        # compute the boundary rectangle.
-        if font.is_vertical():
-            # vertical
-            width = font.get_width() * fontsize
-            (vx, vy) = textdisp
-            if vx is None:
-                vx = width * 0.5
-            else:
-                vx = vx * fontsize * .001
-            vy = (1000 - vy) * fontsize * .001
-            tx = -vx
-            ty = vy + rise
-            bll = (tx, ty+self.adv)
-            bur = (tx+width, ty)
-        else:
-            # horizontal
-            height = font.get_height() * fontsize
-            descent = font.get_descent() * fontsize
-            ty = descent + rise
-            bll = (0, ty)
-            bur = (self.adv, ty+height)
-        (a, b, c, d, e, f) = self.matrix
-        self.upright = (0 < a*d*scaling and b*c <= 0)
-        (x0, y0) = apply_matrix_pt(self.matrix, bll)
-        (x1, y1) = apply_matrix_pt(self.matrix, bur)
-        if x1 < x0:
-            (x0, x1) = (x1, x0)
-        if y1 < y0:
-            (y0, y1) = (y1, y0)
-        LTComponent.__init__(self, (x0, y0, x1, y1))
-        if font.is_vertical():
-            self.size = self.width
-        else:
-            self.size = self.height
+        (self.adv, self.upright, bbox, self.size) = get_char_geometry(
+            matrix, font, fontsize, scaling, rise, textwidth, textdisp)
+        LTComponent.__init__(self, bbox)
         return
 
+    @classmethod
+    def from_geometry(klass, matrix, fontname, text, geometry):
+        """Creates a character from (adv, upright, bbox, size)."""
+        obj = klass.__new__(klass)
+        obj._text = text
+        obj.matrix = matrix
+        obj.fontname = fontname
+        (obj.adv, obj.upright, bbox, obj.size) = geometry
+        # same as set_bbox(), which is too slow here.
+        (x0, y0, x1, y1) = obj.bbox = bbox
+        obj.x0 = x0
+        obj.y0 = y0
+        obj.x1 = x1
+        obj.y1 = y1
+        obj.width = x1-x0
+        obj.height = y1-y0
+        return obj
+
     def __repr__(self):
         return ('<%s %s matrix=%s font=%r adv=%s text=%r>' %
                 (self.__class__.__name__, bbox2str(self.bbox),
@@ -273,15 +380,169 @@ class LTChar(LTComponent, LTText):
     def get_text(self):
         return self._text
 
+    def moved(self, dx, dy):
+        # An LTCharView becomes an LTChar here.
+        (a, b, c, d, e, f) = self.matrix
+        (x0, y0, x1, y1) = self.bbox
+        return LTChar.from_geometry(
+            (a, b, c, d, e+dx, f+dy), self.fontname, self._text,
+            (self.adv, self.upright, (x0+dx, y0+dy, x1+dx, y1+dy), self.size))
+
     def is_compatible(self, obj):
         """Returns True if two characters can coexist in the same line."""
         return True
 
 
+##  LTCharStore
+##
+##  A columnar storage of the characters in a page.
+##  Coordinates are kept in arrays and font names are interned.
+##  Each character is represented by an LTCharView object.
+##
+class LTCharStore:
+
+    def __init__(self):
+        self.texts = []
+        self.fontnames = []
+        self.fontids = array('I')
+        self.matrices = array('d')  # 6 values per char.
+        self.bboxes = array('d')    # 4 values per char.
+        self.advs = array('d')
+        self.sizes = array('d')
+        self.uprights = array('b')
+        self._fontids = {}
+        return
+
+    def __repr__(self):
+        return ('<%s chars=%d fonts=%d>' %
+                (self.__class__.__name__, len(self), len(self.fontnames)))
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __getitem__(self, i):
+        return LTCharView(self, i)
+
+    def add(self, matrix, font, fontsize, scaling, rise,
+            text, textwidth, textdisp):
+        """Stores a character and returns its view."""
+        (adv, upright, bbox, size) = get_char_geometry(
+            matrix, font, fontsize, scaling, rise, textwidth, textdisp)
+        fontid = self.get_fontid(font.fontname)
+        i = len(self.texts)
+        self.texts.append(text)
+        self.fontids.append(fontid)
+        self.matrices.extend(matrix)
+        self.bboxes.extend(bbox)
+        self.advs.append(adv)
+        self.sizes.append(size)
+        self.uprights.append(upright)
+        return LTCharView(self, i)
+
+    def add_run(self, matrices, fontname, texts, geometries):
+        """Stores a run of characters and returns their views."""
+        i = len(self.texts)
+        self.extend(matrices, fontname, texts, geometries)
+        return [LTCharView(self, j) for j in range(i, len(self.texts))]
+
+    def extend(self, matrices, fontname, texts, geometries):
+        """Stores a run of characters without making views."""
+        fontid = self.get_fontid(fontname)
+        self.texts.extend(texts)
+        self.fontids.extend([fontid]*len(texts))
+        for (matrix, (adv, upright, bbox, size)) in zip(matrices, geometries):
+            self.matrices.extend(matrix)
+            self.bboxes.extend(bbox)
+            self.advs.append(adv)
+            self.sizes.append(size)
+            self.uprights.append(upright)
+        return
+
+    def get_fontid(self, fontname):
+        if fontname in self._fontids:
+            return self._fontids[fontname]
+        fontid = len(self.fontnames)
+        self._fontids[fontname] = fontid
+        self.fontnames.append(fontname)
+        return fontid
+
+
+##  LTCharView
+##
+##  An LTChar whose attributes are read from an LTCharStore.
+##
+class LTCharView(LTChar):
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+        return
+
+    @property
+    def _text(self):
+        return self._store.texts[self._index]
+
+    @property
+    def fontname(self):
+        return self._store.fontnames[self._store.fontids[self._index]]
+
+    @property
+    def matrix(self):
+        i = self._index*6
+        return tuple(self._store.matrices[i:i+6])
+
+    @property
+    def adv(self):
+        return self._store.advs[self._index]
+
+    @property
+    def size(self):
+        return self._store.sizes[self._index]
+
+    @property
+    def upright(self):
+        return bool(self._store.uprights[self._index])
+
+    @property
+    def x0(self):
+        return self._store.bboxes[self._index*4]
+
+    @property
+    def y0(self):
+        return self._store.bboxes[self._index*4+1]
+
+    @property
+    def x1(self):
+        return self._store.bboxes[self._index*4+2]
+
+    @property
+    def y1(self):
+        return self._store.bboxes[self._index*4+3]
+
+    @property
+    def width(self):
+        i = self._index*4
+        return self._store.bboxes[i+2]-self._store.bboxes[i]
+
+    @property
+    def height(self):
+        i = self._index*4
+        return self._store.bboxes[i+3]-self._store.bboxes[i+1]
+
+    @property
+    def bbox(self):
+        i = self._index*4
+        return tuple(self._store.bboxes[i:i+4])
+
+
 ##  LTContainer
 ##
 class LTContainer(LTComponent):
 
+    __slots__ = ('_objs',)
+
     def __init__(self, bbox):
         LTComponent.__init__(self, bbox)
         self._objs = []
@@ -302,9 +563,14 @@ class LTContainer(LTComponent):
             self.add(obj)
         return
 
-    def analyze(self, laparams):
+    def moved(self, dx, dy):
+        obj = LTComponent.moved(self, dx, dy)
+        obj._objs = [child.moved(dx, dy) for child in self._objs]
+        return obj
+
+    def analyze(self, laparams, budget=None):
         for obj in self._objs:
-            obj.analyze(laparams)
+            obj.analyze(laparams, budget)
         return
 
 
@@ -312,6 +578,8 @@ class LTContainer(LTComponent):
 ##
 class LTExpandableContainer(LTContainer):
 
+    __slots__ = ()
+
     def __init__(self):
         LTContainer.__init__(self, (+INF, +INF, -INF, -INF))
         return
@@ -327,6 +595,8 @@ class LTExpandableContainer(LTContainer):
 ##
 class LTTextContainer(LTExpandableContainer, LTText):
 
+    __slots__ = ()
+
     def __init__(self):
         LTText.__init__(self)
         LTExpandableContainer.__init__(self)
@@ -340,6 +610,8 @@ class LTTextContainer(LTExpandableContainer, LTText):
 ##
 class LTTextLine(LTTextContainer):
 
+    __slots__ = ('word_margin',)
+
     def __init__(self, word_margin):
         LTTextContainer.__init__(self)
         self.word_margin = word_margin
@@ -350,8 +622,8 @@ class LTTextLine(LTTextContainer):
                 (self.__class__.__name__, bbox2str(self.bbox),
                  self.get_text()))
 
-    def analyze(self, laparams):
-        LTTextContainer.analyze(self, laparams)
+    def analyze(self, laparams, budget=None):
+        LTTextContainer.analyze(self, laparams, budget)
         LTContainer.add(self, LTAnno('\n'))
         return
 
@@ -361,6 +633,8 @@ class LTTextLine(LTTextContainer):
 
 class LTTextLineHorizontal(LTTextLine):
 
+    __slots__ = ('_x1',)
+
     def __init__(self, word_margin):
         LTTextLine.__init__(self, word_margin)
         self._x1 = +INF
@@ -387,6 +661,8 @@ class LTTextLineHorizontal(LTTextLine):
 
 class LTTextLineVertical(LTTextLine):
 
+    __slots__ = ('_y0',)
+
     def __init__(self, word_margin):
         LTTextLine.__init__(self, word_margin)
         self._y0 = -INF
@@ -431,8 +707,8 @@ class LTTextBox(LTTextContainer):
 
 class LTTextBoxHorizontal(LTTextBox):
 
-    def analyze(self, laparams):
-        LTTextBox.analyze(self, laparams)
+    def analyze(self, laparams, budget=None):
+        LTTextBox.analyze(self, laparams, budget)
         self._objs = csort(self._objs, key=lambda obj: -obj.y1)
         return
 
@@ -442,8 +718,8 @@ class LTTextBoxHorizontal(LTTextBox):
 
 class LTTextBoxVertical(LTTextBox):
 
-    def analyze(self, laparams):
-        LTTextBox.analyze(self, laparams)
+    def analyze(self, laparams, budget=None):
+        LTTextBox.analyze(self, laparams, budget)
         self._objs = csort(self._objs, key=lambda obj: -obj.x1)
         return
 
@@ -463,8 +739,8 @@ class LTTextGroup(LTTextContainer):
 
 class LTTextGroupLRTB(LTTextGroup):
 
-    def analyze(self, laparams):
-        LTTextGroup.analyze(self, laparams)
+    def analyze(self, laparams, budget=None):
+        LTTextGroup.analyze(self, laparams, budget)
         # reorder the objects from top-left to bottom-right.
         self._objs = csort(self._objs, key=lambda obj:
                            (1-laparams.boxes_flow)*(obj.x0) -
@@ -474,8 +750,8 @@ class LTTextGroupLRTB(LTTextGroup):
 
 class LTTextGroupTBRL(LTTextGroup):
 
-    def analyze(self, laparams):
-        LTTextGroup.analyze(self, laparams)
+    def analyze(self, laparams, budget=None):
+        LTTextGroup.analyze(self, laparams, budget)
         # reorder the objects from top-right to bottom-left.
         self._objs = csort(self._objs, key=lambda obj:
                            -(1+laparams.boxes_flow)*(obj.x0+obj.x1)
@@ -492,10 +768,9 @@ class LTLayoutContainer(LTContainer):
         self.groups = None
         return
 
-    # group_objects: group text object to textlines.
-    def group_objects(self, laparams, objs):
+    # get_alignments: compute (halign, valign) of each consecutive pair.
+    def get_alignments(self, laparams, objs):
         obj0 = None
-        line = None
         for obj1 in objs:
             if obj0 is not None:
                 # halign: obj0 and obj1 is horizontally aligned.
@@ -537,39 +812,89 @@ class LTLayoutContainer(LTContainer):
                           (obj0.vdistance(obj1) <
                            max(obj0.height, obj1.height) * laparams.char_margin))
 
-                if ((halign and isinstance(line, LTTextLineHorizontal)) or
-                    (valign and isinstance(line, LTTextLineVertical))):
+                yield (halign, valign)
+            obj0 = obj1
+        return
+
+    # get_alignments_numpy: compute the same predicates with NumPy.
+    def get_alignments_numpy(self, laparams, objs):
+        n = len(objs)
+        if n < 2:
+            return []
+        numpy = get_numpy()
+        a = numpy.array([obj.bbox for obj in objs], dtype=float)
+        (x0, y0, x1, y1) = (a[:, 0], a[:, 1], a[:, 2], a[:, 3])
+        (w, h) = (x1-x0, y1-y0)
+        (ax0, ay0, ax1, ay1, aw, ah) = (x0[:-1], y0[:-1], x1[:-1], y1[:-1], w[:-1], h[:-1])
+        (bx0, by0, bx1, by1, bw, bh) = (x0[1:], y0[1:], x1[1:], y1[1:], w[1:], h[1:])
+        if all(klass.is_compatible is LTChar.is_compatible
+               for klass in set(map(type, objs))):
+            compat = numpy.ones(n-1, dtype=bool)
+        else:
+            compat = numpy.array([objs[i].is_compatible(objs[i+1])
+                                  for i in range(n-1)], dtype=bool)
+        # halign
+        hov = (bx0 <= ax1) & (ax0 <= bx1)
+        vov = (by0 <= ay1) & (ay0 <= by1)
+        dx = numpy.minimum(numpy.abs(ax0-bx1), numpy.abs(ax1-bx0))
+        dy = numpy.minimum(numpy.abs(ay0-by1), numpy.abs(ay1-by0))
+        halign = (compat & vov &
+                  (numpy.minimum(ah, bh) * laparams.line_overlap < numpy.where(vov, dy, 0)) &
+                  (numpy.where(hov, 0, dx) < numpy.maximum(aw, bw) * laparams.char_margin))
+        # valign
+        if laparams.detect_vertical:
+            valign = (compat & hov &
+                      (numpy.minimum(aw, bw) * laparams.line_overlap < numpy.where(hov, dx, 0)) &
+                      (numpy.where(vov, 0, dy) < numpy.maximum(ah, bh) * laparams.char_margin))
+        else:
+            valign = numpy.zeros(n-1, dtype=bool)
+        return zip(halign.tolist(), valign.tolist())
+
+    # group_objects: group text object to textlines.
+    def group_objects(self, laparams, objs, budget=None):
+        objs = list(objs)
+        if get_numpy() is not None:
+            alignments = self.get_alignments_numpy(laparams, objs)
+        else:
+            alignments = self.get_alignments(laparams, objs)
+        line = None
+        for (i, (obj0, obj1, (halign, valign))) in enumerate(zip(objs, objs[1:], alignments)):
+            if budget is not None and i % BUDGET_CHECK_INTERVAL == 0:
+                budget.check_deadline()
+            if ((halign and isinstance(line, LTTextLineHorizontal)) or
+                (valign and isinstance(line, LTTextLineVertical))):
+                line.add(obj1)
+            elif line is not None:
+                yield line
+                line = None
+            else:
+                if valign and not halign:
+                    line = LTTextLineVertical(laparams.word_margin)
+                    line.add(obj0)
                     line.add(obj1)
-                elif line is not None:
+                elif halign and not valign:
+                    line = LTTextLineHorizontal(laparams.word_margin)
+                    line.add(obj0)
+                    line.add(obj1)
+                else:
+                    line = LTTextLineHorizontal(laparams.word_margin)
+                    line.add(obj0)
                     yield line
                     line = None
-                else:
-                    if valign and not halign:
-                        line = LTTextLineVertical(laparams.word_margin)
-                        line.add(obj0)
-                        line.add(obj1)
-                    elif halign and not valign:
-                        line = LTTextLineHorizontal(laparams.word_margin)
-                        line.add(obj0)
-                        line.add(obj1)
-                    else:
-                        line = LTTextLineHorizontal(laparams.word_margin)
-                        line.add(obj0)
-                        yield line
-                        line = None
-            obj0 = obj1
         if line is None:
             line = LTTextLineHorizontal(laparams.word_margin)
-            line.add(obj0)
+            line.add(objs[-1])
         yield line
         return
 
     # group_textlines: group neighboring lines to textboxes.
-    def group_textlines(self, laparams, lines):
+    def group_textlines(self, laparams, lines, budget=None):
         plane = Plane(self.bbox)
         plane.extend(lines)
         boxes = {}
-        for line in lines:
+        for (i, line) in enumerate(lines):
+            if budget is not None and i % BUDGET_CHECK_INTERVAL == 0:
+                budget.check_deadline()
             neighbors = line.find_neighbors(plane, laparams.line_margin)
             if line not in neighbors: continue
             members = []
@@ -596,7 +921,7 @@ class LTLayoutContainer(LTContainer):
         return
 
     # group_textboxes: group textboxes hierarchically.
-    def group_textboxes(self, laparams, boxes):
+    def group_textboxes(self, laparams, boxes, budget=None):
         assert boxes
 
         def dist(obj1, obj2):
@@ -627,25 +952,41 @@ class LTLayoutContainer(LTContainer):
             objs = set(plane.find((x0, y0, x1, y1)))
             return objs.difference((obj1, obj2))
 
-        def key_obj(t):
-            (c,d,_,_) = t
-            return (c,d)
-
-        # XXX this still takes O(n^2)  :(
+        # dists: a heap of pairs ordered by (c, d, seq).
+        # seq is the creation order of each pair, which keeps
+        # the result stable when two pairs have the same distance.
+        # Pairs that contain an already merged box are discarded
+        # when they come up.
         dists = []
+        seq = 0
         for i in range(len(boxes)):
+            if budget is not None:
+                budget.check_deadline()
             obj1 = boxes[i]
             for j in range(i+1, len(boxes)):
                 obj2 = boxes[j]
-                dists.append((0, dist(obj1, obj2), obj1, obj2))
-        # We could use dists.sort(), but it would randomize the test result.
-        dists = csort(dists, key=key_obj)
+                dists.append((0, dist(obj1, obj2), seq, obj1, obj2))
+                seq += 1
+        heapq.heapify(dists)
+        # pending: pairs postponed since the last merge.
+        # They are tried only after all the other pairs.
+        pending = deque()
         plane = Plane(self.bbox)
         plane.extend(boxes)
-        while dists:
-            (c, d, obj1, obj2) = dists.pop(0)
+        n = 0
+        while dists or pending:
+            n += 1
+            if budget is not None and n % BUDGET_CHECK_INTERVAL == 0:
+                budget.check_deadline()
+            if dists:
+                (c, d, _, obj1, obj2) = heapq.heappop(dists)
+            else:
+                (c, d, _, obj1, obj2) = pending.popleft()
+            if obj1 not in plane or obj2 not in plane:
+                continue
             if c == 0 and isany(obj1, obj2):
-                dists.append((1, d, obj1, obj2))
+                pending.append((1, d, seq, obj1, obj2))
+                seq += 1
                 continue
             if (isinstance(obj1, (LTTextBoxVertical, LTTextGroupTBRL)) or
                 isinstance(obj2, (LTTextBoxVertical, LTTextGroupTBRL))):
@@ -654,33 +995,40 @@ class LTLayoutContainer(LTContainer):
                 group = LTTextGroupLRTB([obj1, obj2])
             plane.remove(obj1)
             plane.remove(obj2)
-            dists = [ (c,d,obj1,obj2) for (c,d,obj1,obj2) in dists
-                      if (obj1 in plane and obj2 in plane) ]
+            for t in pending:
+                heapq.heappush(dists, t)
+            pending.clear()
             for other in plane:
-                dists.append((0, dist(group, other), group, other))
-            dists = csort(dists, key=key_obj)
+                heapq.heappush(dists, (0, dist(group, other), seq, group, other))
+                seq += 1
             plane.add(group)
         assert len(plane) == 1
         return list(plane)
 
-    def analyze(self, laparams):
+    def analyze(self, laparams, budget=None):
         # textobjs is a list of LTChar objects, i.e.
         # it has all the individual characters in the page.
         (textobjs, otherobjs) = fsplit(lambda obj: isinstance(obj, LTChar), self)
         for obj in otherobjs:
-            obj.analyze(laparams)
+            obj.analyze(laparams, budget)
         if not textobjs:
             return
-        textlines = list(self.group_objects(laparams, textobjs))
+        textlines = list(self.group_objects(laparams, textobjs, budget))
         (empties, textlines) = fsplit(lambda obj: obj.is_empty(), textlines)
         for obj in empties:
-            obj.analyze(laparams)
-        textboxes = list(self.group_textlines(laparams, textlines))
-        if -1 <= laparams.boxes_flow and laparams.boxes_flow <= +1 and textboxes:
-            self.groups = self.group_textboxes(laparams, textboxes)
+            obj.analyze(laparams, budget)
+        textboxes = list(self.group_textlines(laparams, textlines, budget))
+        if (laparams.max_textboxes is not None and
+            laparams.max_textboxes < len(textboxes)):
+            # too many textboxes: fall back to the simple ordering.
+            grouping = False
+        else:
+            grouping = (-1 <= laparams.boxes_flow and laparams.boxes_flow <= +1)
+        if grouping and textboxes:
+            self.groups = self.group_textboxes(laparams, textboxes, budget)
             assigner = IndexAssigner()
             for group in self.groups:
-                group.analyze(laparams)
+                group.analyze(laparams, budget)
                 assigner.run(group)
             textboxes.sort(key=lambda box: box.index)
         else:
@@ -712,10 +1060,16 @@ class LTFigure(LTLayoutContainer):
                 (self.__class__.__name__, self.name,
                  bbox2str(self.bbox), matrix2str(self.matrix)))
 
-    def analyze(self, laparams):
+    def moved(self, dx, dy):
+        obj = LTLayoutContainer.moved(self, dx, dy)
+        (a, b, c, d, e, f) = self.matrix
+        obj.matrix = (a, b, c, d, e+dx, f+dy)
+        return obj
+
+    def analyze(self, laparams, budget=None):
         if not laparams.all_texts:
             return
-        LTLayoutContainer.analyze(self, laparams)
+        LTLayoutContainer.analyze(self, laparams, budget)
         return
 
 
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import logging
 from .utils import mult_matrix
 from .utils import translate_matrix
 from .utils import q
@@ -11,9 +12,17 @@ from .pdffont import PDFUnicodeNotDefined
 ##
 class PDFDevice:
 
+    # capabilities: the kinds of content the device receives.
+    #   The interpreter skips the operators for the other kinds.
+    #   'text': text objects, 'paths': path construction and painting,
+    #   'colors': color operators, 'images': inline and image XObjects,
+    #   'tags': marked content.
+    capabilities = ('text', 'paths', 'colors', 'images', 'tags')
+
     def __init__(self, rsrcmgr):
         self.rsrcmgr = rsrcmgr
         self.ctm = None
+        self.budget = None
         return
 
     def __repr__(self):
@@ -26,6 +35,13 @@ class PDFDevice:
         self.ctm = ctm
         return
 
+    # set_budget(budget)
+    #   Called with the PDFBudget (or None) of the interpreter
+    #   before each page, so the device can check it too.
+    def set_budget(self, budget):
+        self.budget = budget
+        return
+
     def begin_tag(self, tag, props=None):
         return
 
@@ -47,6 +63,18 @@ class PDFDevice:
     def end_figure(self, name):
         return
 
+    # save_figure()
+    #   Returns (figure, nitems) for the figure that has just ended,
+    #   or None if the device cannot redraw figures.
+    #   nitems is the size of the figure used for the form cache.
+    def save_figure(self):
+        return None
+
+    # replay_figure(figure, dx, dy)
+    #   Draws a figure from save_figure() again, moved by (dx, dy).
+    def replay_figure(self, figure, dx, dy):
+        return
+
     def paint_path(self, graphicstate, stroke, fill, evenodd, path):
         return
 
@@ -61,7 +89,14 @@ class PDFDevice:
 ##
 class PDFTextDevice(PDFDevice):
 
+    _glyph_runs_cache = {}
+
     def render_string(self, textstate, seq):
+        if self.use_glyph_runs():
+            (cids, positions) = self.get_glyph_run(textstate, seq)
+            if cids:
+                self.render_glyph_run(textstate, cids, positions)
+            return
         matrix = mult_matrix(textstate.matrix, self.ctm)
         font = textstate.font
         fontsize = textstate.fontsize
@@ -123,6 +158,84 @@ class PDFTextDevice(PDFDevice):
     def render_char(self, matrix, font, fontsize, scaling, rise, cid):
         return 0
 
+    # use_glyph_runs(): returns True if render_glyph_run() is implemented
+    #   by the same or a more derived class than render_char().
+    @classmethod
+    def use_glyph_runs(klass):
+        try:
+            return klass._glyph_runs_cache[klass]
+        except KeyError:
+            pass
+        result = False
+        for k in klass.__mro__:
+            if 'render_glyph_run' in vars(k):
+                result = (k is not PDFTextDevice)
+                break
+            if 'render_char' in vars(k):
+                break
+        klass._glyph_runs_cache[klass] = result
+        return result
+
+    # get_glyph_run(textstate, seq):
+    #   Decodes the operand of TJ and returns the CIDs and their
+    #   positions in text space. The advances are computed from
+    #   the glyph widths, as render_char() of a layout analyzer does.
+    def get_glyph_run(self, textstate, seq):
+        font = textstate.font
+        fontsize = textstate.fontsize
+        scaling = textstate.scaling * .01
+        charspace = textstate.charspace * scaling
+        wordspace = textstate.wordspace * scaling
+        if font.is_multibyte():
+            wordspace = 0
+        dxscale = .001 * fontsize * scaling
+        vertical = font.is_vertical()
+        (x, y) = textstate.linematrix
+        p = y if vertical else x
+        cids = []
+        offsets = []
+        char_width = font.char_width
+        needcharspace = False
+        for obj in seq:
+            if isnumber(obj):
+                p -= obj*dxscale
+                needcharspace = True
+            else:
+                for cid in font.decode(obj):
+                    if needcharspace:
+                        p += charspace
+                    cids.append(cid)
+                    offsets.append(p)
+                    p += char_width(cid) * fontsize * scaling
+                    if cid == 32 and wordspace:
+                        p += wordspace
+                    needcharspace = True
+        if vertical:
+            textstate.linematrix = (x, p)
+            positions = [(x, v) for v in offsets]
+        else:
+            textstate.linematrix = (p, y)
+            positions = [(v, y) for v in offsets]
+        return (cids, positions)
+
+    # render_glyph_run(textstate, cids, positions):
+    #   Renders the glyphs of a text string at once.
+    #   Devices that do not implement this get render_char() calls.
+    def render_glyph_run(self, textstate, cids, positions):
+        return
+
+    def get_char_text(self, font, cid):
+        try:
+            text = font.to_unichr(cid)
+            assert isinstance(text, str), text
+        except PDFUnicodeNotDefined:
+            text = self.handle_undefined_char(font, cid)
+        return text
+
+    def handle_undefined_char(self, font, cid):
+        logging.info('undefined: %r, %r' % (font, cid))
+        return f'(cid:{cid})'
+
 
 ##  TagExtractor
 ##
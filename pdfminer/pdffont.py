@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 import sys
 import struct
+import hashlib
+import threading
 from io import BytesIO
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
 from .cmapdb import CMapDB
-from .cmapdb import CMapParser
 from .cmapdb import FileUnicodeMap
 from .cmapdb import CMap
 from .encodingdb import EncodingDB
@@ -23,7 +27,6 @@ from .pdftypes import bytes_value
 from .pdftypes import list_value
 from .pdftypes import dict_value
 from .pdftypes import stream_value
-from .fontmetrics import FONT_METRICS
 from .utils import apply_matrix_norm
 from .utils import nunpack
 from .utils import choplist
@@ -76,13 +79,132 @@ def get_widths2(seq):
 #assert get_widths2([1,[2,3,4,5],6,[7,8,9]]) == {1:(2, (3,4)), 6:(7, (8,9))}
 
 
+##  WidthRanges
+##
+##  Widths of a CID font kept as the ranges of its W or W2 array.
+##  Each range is (char1, char2, value) or (char1, char2, [values]).
+##  Looked up values are cached in a dict.
+##
+class WidthRanges:
+
+    def __init__(self, default=None):
+        self.default = default
+        self.starts = []
+        self.ranges = []
+        self.widths = None
+        self.cache = {}
+        return
+
+    def __repr__(self):
+        return '<WidthRanges: ranges=%d>' % len(self.ranges)
+
+    def __len__(self):
+        if self.widths is not None:
+            return len(self.widths)
+        return sum(char2-char1+1 for (char1, char2, _) in self.ranges)
+
+    def add_range(self, char1, char2, value):
+        self.ranges.append((char1, char2, value))
+        return
+
+    def add_list(self, char1, values):
+        if values:
+            self.ranges.append((char1, char1+len(values)-1, values))
+        return
+
+    def fix(self):
+        ranges = sorted(self.ranges, key=lambda r: r[0])
+        for (r0, r1) in zip(ranges, ranges[1:]):
+            if r1[0] <= r0[1]:
+                # overlapping ranges: later ones take precedence.
+                self.widths = {}
+                for (char1, char2, value) in self.ranges:
+                    for cid in range(char1, char2+1):
+                        if isinstance(value, list):
+                            self.widths[cid] = value[cid-char1]
+                        else:
+                            self.widths[cid] = value
+                self.cache.update(self.widths)
+                ranges = []
+                break
+        self.ranges = ranges
+        self.starts = [char1 for (char1, _, _) in ranges]
+        return self
+
+    def get(self, cid, default=None):
+        try:
+            return self.cache[cid]
+        except KeyError:
+            pass
+        value = default
+        i = bisect_right(self.starts, cid)-1
+        if 0 <= i:
+            (char1, char2, v) = self.ranges[i]
+            if cid <= char2:
+                if isinstance(v, list):
+                    value = v[cid-char1]
+                else:
+                    value = v
+        self.cache[cid] = value
+        return value
+
+
+def get_width_ranges(seq):
+    widths = WidthRanges()
+    r = []
+    for v in seq:
+        if isinstance(v, list):
+            if r:
+                char1 = r[-1]
+                widths.add_list(char1, v)
+                r = []
+        elif isnumber(v):
+            r.append(v)
+            if len(r) == 3:
+                (char1, char2, w) = r
+                widths.add_range(char1, char2, w)
+                r = []
+    return widths.fix()
+#assert get_width_ranges([1,2,3]).get(2) == 3
+#assert get_width_ranges([1,[2,3],6,[7,8]]).get(7) == 8
+
+
+def get_width_ranges2(seq):
+    widths = WidthRanges()
+    r = []
+    for v in seq:
+        if isinstance(v, list):
+            if r:
+                char1 = r[-1]
+                widths.add_list(char1, [(w, (vx, vy)) for (w, vx, vy) in choplist(3, v)])
+                r = []
+        elif isnumber(v):
+            r.append(v)
+            if len(r) == 5:
+                (char1, char2, w, vx, vy) = r
+                widths.add_range(char1, char2, (w, (vx, vy)))
+                r = []
+    return widths.fix()
+#assert get_width_ranges2([1,[2,3,4,5],6,[7,8,9]]).get(1) == (2, (3,4))
+
+
 ##  FontMetricsDB
 ##
 class FontMetricsDB:
 
+    _metrics_cache = {}
+
     @classmethod
     def get_metrics(klass, fontname):
-        return FONT_METRICS[fontname]
+        # the metrics of each standard 14 font are unpacked on the first use.
+        try:
+            return klass._metrics_cache[fontname]
+        except KeyError:
+            pass
+        from .fontmetrics import get_font_metrics
+        metrics = get_font_metrics(fontname)
+        klass._metrics_cache[fontname] = metrics
+        return metrics
 
 
 ##  Type1FontHeaderParser
@@ -377,6 +499,12 @@ class TrueTypeFont:
     class CMapNotFound(Exception):
         pass
 
+    _unicode_map_cache = OrderedDict()
+    _unicode_map_lock = threading.Lock()
+
+    # The number of unicode maps kept by get_unicode_map().
+    unicode_map_cache_size = 100
+
     def __init__(self, name, fp):
         self.name = name
         self.fp = fp
@@ -388,68 +516,159 @@ class TrueTypeFont:
             self.tables[name] = (offset, length)
         return
 
+    @classmethod
+    def get_unicode_map(klass, name, data):
+        """Returns a FileUnicodeMap made from the cmap table of a font file.
+
+        Maps are cached by the hash of the font data and shared
+        by all fonts (and threads) with the same data, so they must
+        not be modified.
+        """
+        key = hashlib.sha1(data).digest()
+        cache = klass._unicode_map_cache
+        with klass._unicode_map_lock:
+            found = key in cache
+            if found:
+                cache.move_to_end(key)
+                umap = cache[key]
+        if not found:
+            # Parse without the lock; another thread may store the same map.
+            try:
+                umap = klass(name, BytesIO(data)).create_unicode_map()
+            except (struct.error, IndexError, ValueError):
+                umap = None
+            if 0 < klass.unicode_map_cache_size:
+                with klass._unicode_map_lock:
+                    cache[key] = umap
+                    while klass.unicode_map_cache_size < len(cache):
+                        cache.popitem(last=False)
+        if umap is None:
+            raise TrueTypeFont.CMapNotFound(name)
+        return umap
+
     def create_unicode_map(self):
-        if 'cmap' not in self.tables:
-            raise TrueTypeFont.CMapNotFound
-        (base_offset, length) = self.tables['cmap']
-        fp = self.fp
-        fp.seek(base_offset)
-        (version, nsubtables) = struct.unpack('>HH', fp.read(4))
-        subtables = []
-        for i in range(nsubtables):
-            subtables.append(struct.unpack('>HHL', fp.read(8)))
-        char2gid = {}
-        # Only supports subtable type 0, 2 and 4.
-        for (_1, _2, st_offset) in subtables:
-            fp.seek(base_offset+st_offset)
-            (fmttype, fmtlen, fmtlang) = struct.unpack('>HHH', fp.read(6))
-            if fmttype == 0:
-                char2gid.update(enumerate(struct.unpack('>256B', fp.read(256))))
-            elif fmttype == 2:
-                subheaderkeys = struct.unpack('>256H', fp.read(512))
-                firstbytes = [0]*8192
-                for (i, k) in enumerate(subheaderkeys):
-                    firstbytes[k//8] = i
-                nhdrs = max(subheaderkeys)//8 + 1
-                hdrs = []
-                for i in range(nhdrs):
-                    (firstcode, entcount, delta, offset) = struct.unpack('>HHhH', fp.read(8))
-                    hdrs.append((i, firstcode, entcount, delta, fp.tell()-2+offset))
-                for (i, firstcode, entcount, delta, pos) in hdrs:
-                    if not entcount:
-                        continue
-                    first = firstcode + (firstbytes[i] << 8)
-                    fp.seek(pos)
-                    for c in range(entcount):
-                        gid = struct.unpack('>H', fp.read(2))
-                        if gid:
-                            gid += delta
-                        char2gid[first+c] = gid
-            elif fmttype == 4:
-                (segcount, _1, _2, _3) = struct.unpack('>HHHH', fp.read(8))
-                segcount //= 2
-                ecs = struct.unpack('>%dH' % segcount, fp.read(2*segcount))
-                fp.read(2)
-                scs = struct.unpack('>%dH' % segcount, fp.read(2*segcount))
-                idds = struct.unpack('>%dh' % segcount, fp.read(2*segcount))
-                pos = fp.tell()
-                idrs = struct.unpack('>%dH' % segcount, fp.read(2*segcount))
-                for (ec, sc, idd, idr) in zip(ecs, scs, idds, idrs):
-                    if idr:
-                        fp.seek(pos+idr)
-                        for c in range(sc, ec+1):
-                            char2gid[c] = (struct.unpack('>H', fp.read(2))[0] + idd) & 0xffff
-                    else:
-                        for c in range(sc, ec+1):
-                            char2gid[c] = (c + idd) & 0xffff
-            else:
-                assert 0
+        if b'cmap' not in self.tables:
+            raise TrueTypeFont.CMapNotFound(self.name)
+        (base_offset, length) = self.tables[b'cmap']
+        self.fp.seek(base_offset)
+        data = self.fp.read(length)
+        (version, nsubtables) = struct.unpack_from('>HH', data)
+        subtables = [struct.unpack_from('>HHL', data, 4+8*i) for i in range(nsubtables)]
+        # Use the Unicode subtables if there is any.
+        unicode_subtables = [(platform, encoding, offset)
+                             for (platform, encoding, offset) in subtables
+                             if platform == 0 or (platform == 3 and encoding in (1, 10))]
+        offsets = []
+        for (_, _, offset) in (unicode_subtables or subtables):
+            if offset not in offsets:
+                offsets.append(offset)
         # create unicode map
         unicode_map = FileUnicodeMap()
-        for (char, gid) in char2gid.items():
-            unicode_map.add_cid2unichr(gid, char)
+        for offset in offsets:
+            for (gid, char, n) in self.get_cmap_runs(data, offset):
+                if gid == 0:
+                    (gid, char, n) = (1, char+1, n-1)
+                i = 0
+                while i < n:
+                    # split the run where its UTF-16 code cannot be incremented.
+                    c = char+i
+                    if c < 0xd800:
+                        m = min(n-i, 0xd800-c)
+                    elif c < 0xe000:
+                        m = 1
+                    elif c < 0x10000:
+                        m = min(n-i, 0x10000-c)
+                    else:
+                        m = min(n-i, 0x400-(c & 0x3ff))
+                    if m == 1:
+                        unicode_map.add_cid2unichr(gid+i, c)
+                    else:
+                        code = chr(c).encode('utf-16be')
+                        unicode_map.add_cid2unichr_range(gid+i, gid+i+m-1, code)
+                    i += m
         return unicode_map
 
+    # get_cmap_runs: yields (gid, char, n) for a cmap subtable, which maps
+    #   the n glyphs from gid to the n characters from char.
+    @classmethod
+    def get_cmap_runs(klass, data, offset):
+        fmttype = struct.unpack_from('>H', data, offset)[0]
+        if fmttype == 0:
+            glyphs = data[offset+6:offset+6+256]
+            for (char, gid) in enumerate(glyphs):
+                if gid:
+                    yield (gid, char, 1)
+        elif fmttype == 2:
+            keys = get_ushorts(data, offset+6, 256)
+            pos = offset+6+512
+            for hi in range(256):
+                k = keys[hi]//8
+                if k == 0 and hi != 0:
+                    continue
+                (firstcode, entcount, delta, rangeoffset) = struct.unpack_from('>HHhH', data, pos+8*k)
+                glyphs = get_ushorts(data, pos+8*k+6+rangeoffset, entcount)
+                for (i, gid) in enumerate(glyphs):
+                    char = firstcode+i
+                    if k == 0:
+                        # subheader 0 is for one-byte codes.
+                        if 256 <= char or keys[char]:
+                            continue
+                    else:
+                        char |= hi << 8
+                    if gid:
+                        yield ((gid+delta) & 0xffff, char, 1)
+        elif fmttype == 4:
+            segcount = struct.unpack_from('>H', data, offset+6)[0] // 2
+            pos = offset+14
+            ecs = get_ushorts(data, pos, segcount)
+            scs = get_ushorts(data, pos+2+2*segcount, segcount)
+            idds = get_ushorts(data, pos+2+4*segcount, segcount)
+            idrs = get_ushorts(data, pos+2+6*segcount, segcount)
+            for (i, (ec, sc, idd, idr)) in enumerate(zip(ecs, scs, idds, idrs)):
+                if ec < sc:
+                    continue
+                if ec == 0xffff:
+                    ec -= 1
+                if idr:
+                    glyphs = get_ushorts(data, pos+2+6*segcount+2*i+idr, ec-sc+1)
+                    for (char, gid) in enumerate(glyphs, sc):
+                        if gid:
+                            yield ((gid+idd) & 0xffff, char, 1)
+                else:
+                    gid = (sc+idd) & 0xffff
+                    n = min(ec-sc+1, 0x10000-gid)
+                    yield (gid, sc, n)
+                    if n < ec-sc+1:
+                        yield (0, sc+n, ec-sc+1-n)
+        elif fmttype == 6:
+            (firstcode, entcount) = struct.unpack_from('>HH', data, offset+6)
+            glyphs = get_ushorts(data, offset+10, entcount)
+            for (char, gid) in enumerate(glyphs, firstcode):
+                if gid:
+                    yield (gid, char, 1)
+        elif fmttype in (12, 13):
+            ngroups = struct.unpack_from('>L', data, offset+12)[0]
+            for i in range(ngroups):
+                (sc, ec, gid) = struct.unpack_from('>LLL', data, offset+16+12*i)
+                if 0x10ffff < ec or ec < sc:
+                    continue
+                if fmttype == 12:
+                    yield (gid, sc, ec-sc+1)
+                else:
+                    # format 13 maps all the characters to one glyph.
+                    yield (gid, sc, 1)
+        return
+
+
+# get_ushorts: reads an array of big-endian unsigned shorts.
+def get_ushorts(data, offset, n):
+    a = array('H', data[offset:offset+2*n])
+    if len(a) != n:
+        raise ValueError('truncated table')
+    if sys.byteorder == 'little':
+        a.byteswap()
+    return a
+
 
 ##  Fonts
 ##
@@ -467,6 +686,10 @@ LITERAL_TYPE1C = LIT('Type1C')
 # PDFFont
 class PDFFont:
 
+    # Fonts can be shared by threads through PDFFontCache, so the
+    # tables that are made on the first use are filled under this lock.
+    _lazy_lock = threading.RLock()
+
     def __init__(self, descriptor, widths, default_width=None):
         self.descriptor = descriptor
         self.widths = widths
@@ -549,8 +772,8 @@ class PDFSimpleFont(PDFFont):
         self.unicode_map = None
         if 'ToUnicode' in spec:
             strm = stream_value(spec['ToUnicode'])
-            self.unicode_map = FileUnicodeMap()
-            CMapParser(self.unicode_map, BytesIO(strm.get_data())).run()
+            self.unicode_map = CMapDB.get_tounicode_map(strm.get_data())
+        self.width_table = None
         PDFFont.__init__(self, descriptor, widths)
         return
 
@@ -565,10 +788,43 @@ class PDFSimpleFont(PDFFont):
         except KeyError:
             raise PDFUnicodeNotDefined(None, cid)
 
+    def get_width_table(self):
+        """Returns the scaled widths of the 256 codes from /Widths.
+
+        A code that is not in /Widths is None and looked up by
+        char_width() when it is used. An invalid entry only makes
+        its own code have the default width.
+        """
+        table = [None]*256
+        for (cid, w) in self.widths.items():
+            if isinstance(cid, int) and 0 <= cid < 256:
+                w = resolve1(w)
+                if not isnumber(w):
+                    w = self.default_width
+                table[cid] = w * self.hscale
+        return table
+
+    def char_width(self, cid):
+        # the table is made on the first use because
+        # cid2unicode and hscale can be changed by subclasses.
+        if self.width_table is None:
+            with self._lazy_lock:
+                if self.width_table is None:
+                    self.width_table = self.get_width_table()
+        w = self.width_table[cid]
+        if w is None:
+            # not in /Widths: the standard 14 fonts have widths by name.
+            with self._lazy_lock:
+                w = self.width_table[cid] = PDFFont.char_width(self, cid)
+        return w
+
 
 # PDFType1Font
 class PDFType1Font(PDFSimpleFont):
 
+    # True until the encoding in the font file is read.
+    fontfile_pending = False
+
     def __init__(self, rsrcmgr, spec):
         try:
             self.basefont = literal_name(spec['BaseFont'])
@@ -587,13 +843,26 @@ class PDFType1Font(PDFSimpleFont):
         PDFSimpleFont.__init__(self, descriptor, widths, spec)
         if 'Encoding' not in spec and 'FontFile' in descriptor:
             # try to recover the missing encoding info from the font file.
+            # The file is decoded when a character is first looked up.
             self.fontfile = stream_value(descriptor.get('FontFile'))
-            length1 = int_value(self.fontfile['Length1'])
-            data = self.fontfile.get_data()[:length1]
-            parser = Type1FontHeaderParser(BytesIO(data))
-            self.cid2unicode = parser.get_encoding()
+            self.fontfile_pending = True
+        return
+
+    def load_fontfile(self):
+        length1 = int_value(self.fontfile['Length1'])
+        data = self.fontfile.get_data()[:length1]
+        parser = Type1FontHeaderParser(BytesIO(data))
+        self.cid2unicode = parser.get_encoding()
+        self.fontfile_pending = False
         return
 
+    def to_unichr(self, cid):
+        if self.fontfile_pending:
+            with self._lazy_lock:
+                if self.fontfile_pending:
+                    self.load_fontfile()
+        return PDFSimpleFont.to_unichr(self, cid)
+
     def __repr__(self):
         return '<PDFType1Font: basefont=%r>' % self.basefont
 
@@ -631,6 +900,9 @@ class PDFType3Font(PDFSimpleFont):
 # PDFCIDFont
 class PDFCIDFont(PDFFont):
 
+    # True until the cmap in the font file is read.
+    fontfile_pending = False
+
     def __init__(self, rsrcmgr, spec):
         try:
             self.basefont = literal_name(spec['BaseFont'])
@@ -660,22 +932,16 @@ class PDFCIDFont(PDFFont):
             if STRICT:
                 raise PDFFontError('FontDescriptor is missing')
             descriptor = {}
-        ttf = None
         if 'FontFile2' in descriptor:
             self.fontfile = stream_value(descriptor.get('FontFile2'))
-            ttf = TrueTypeFont(self.basefont,
-                               BytesIO(self.fontfile.get_data()))
         self.unicode_map = None
         if 'ToUnicode' in spec:
             strm = stream_value(spec['ToUnicode'])
-            self.unicode_map = FileUnicodeMap()
-            CMapParser(self.unicode_map, BytesIO(strm.get_data())).run()
+            self.unicode_map = CMapDB.get_tounicode_map(strm.get_data())
         elif self.cidcoding in ('Adobe-Identity', 'Adobe-UCS'):
-            if ttf:
-                try:
-                    self.unicode_map = ttf.create_unicode_map()
-                except TrueTypeFont.CMapNotFound:
-                    pass
+            if 'FontFile2' in descriptor:
+                # The file is decoded when a character is first looked up.
+                self.fontfile_pending = True
         else:
             try:
                 self.unicode_map = CMapDB.get_unicode_map(self.cidcoding, self.cmap.is_vertical())
@@ -685,17 +951,14 @@ class PDFCIDFont(PDFFont):
         self.vertical = self.cmap.is_vertical()
         if self.vertical:
             # writing mode: vertical
-            widths = get_widths2(list_value(spec.get('W2', [])))
-            self.disps = dict((cid, (vx, vy)) for (cid, (_, (vx, vy))) in widths.items())
+            widths = get_width_ranges2(list_value(spec.get('W2', [])))
             (vy, w) = spec.get('DW2', [880, -1000])
             self.default_disp = (None, vy)
-            widths = dict((cid, w) for (cid, (w, _)) in widths.items())
             default_width = w
         else:
             # writing mode: horizontal
-            self.disps = {}
             self.default_disp = 0
-            widths = get_widths(list_value(spec.get('W', [])))
+            widths = get_width_ranges(list_value(spec.get('W', [])))
             default_width = spec.get('DW', 1000)
         PDFFont.__init__(self, descriptor, widths, default_width=default_width)
         return
@@ -712,11 +975,35 @@ class PDFCIDFont(PDFFont):
     def decode(self, data):
         return self.cmap.decode(data)
 
+    def char_width(self, cid):
+        w = self.widths.get(cid)
+        if w is None:
+            return self.default_width * self.hscale
+        elif self.vertical:
+            return w[0] * self.hscale
+        return w * self.hscale
+
     def char_disp(self, cid):
         "Returns an integer for horizontal fonts, a tuple for vertical fonts."
-        return self.disps.get(cid, self.default_disp)
+        if self.vertical:
+            w = self.widths.get(cid)
+            if w is not None:
+                return w[1]
+        return self.default_disp
+
+    def load_fontfile(self):
+        try:
+            self.unicode_map = TrueTypeFont.get_unicode_map(self.basefont, self.fontfile.get_data())
+        except TrueTypeFont.CMapNotFound:
+            pass
+        self.fontfile_pending = False
+        return
 
     def to_unichr(self, cid):
+        if self.fontfile_pending:
+            with self._lazy_lock:
+                if self.fontfile_pending:
+                    self.load_fontfile()
         try:
             if not self.unicode_map:
                 raise KeyError(cid)
@@ -1,14 +1,16 @@
 #!/usr/bin/env python
-import re
+import time
 import logging
-from io import BytesIO
+import hashlib
+import threading
+from collections import OrderedDict
 from .cmapdb import CMapDB
 from .cmapdb import CMap
 from .psparser import PSTypeError
 from .psparser import PSEOF
 from .psparser import PSKeyword
+from .psparser import PSLiteral
 from .psparser import literal_name
-from .psparser import keyword_name
 from .psparser import PSStackParser
 from .psparser import LIT
 from .psparser import KWD
@@ -40,6 +42,9 @@ class PDFResourceError(PDFException):
 class PDFInterpreterError(PDFException):
     pass
 
+class PDFBudgetExceeded(PDFInterpreterError):
+    pass
+
 
 ##  Constants
 ##
@@ -54,6 +59,9 @@ LITERAL_IMAGE = LIT('Image')
 ##
 class PDFTextState:
 
+    __slots__ = ('font', 'fontsize', 'charspace', 'wordspace', 'scaling',
+                 'leading', 'render', 'rise', 'matrix', 'linematrix')
+
     def __init__(self):
         self.font = None
         self.fontsize = 0
@@ -100,6 +108,9 @@ class PDFTextState:
 ##
 class PDFGraphicState:
 
+    __slots__ = ('linewidth', 'linecap', 'linejoin', 'miterlimit',
+                 'dash', 'intent', 'flatness')
+
     def __init__(self):
         self.linewidth = 0
         self.linecap = None
@@ -128,8 +139,342 @@ class PDFGraphicState:
                  self.miterlimit, self.dash, self.intent, self.flatness))
 
 
+##  PDFBudget
+##
+class PDFBudget:
+
+    """Limits on the work spent for rendering a single page.
+
+    A limit that is None is not enforced. PDFBudgetExceeded is
+    raised as soon as a page goes over any of the limits.
+
+    max_operators: the number of operators executed.
+    max_chars: the number of characters (CIDs) shown by text operators.
+    max_xobject_depth: the nesting level of Form XObjects.
+    max_decoded_bytes: the size of decoded content streams and inline images.
+    timeout: the wall-clock time in seconds, including the layout
+      analysis of the device (see PDFDevice.set_budget).
+    """
+
+    def __init__(self,
+                 max_operators=None,
+                 max_chars=None,
+                 max_xobject_depth=None,
+                 max_decoded_bytes=None,
+                 timeout=None):
+        self.max_operators = max_operators
+        self.max_chars = max_chars
+        self.max_xobject_depth = max_xobject_depth
+        self.max_decoded_bytes = max_decoded_bytes
+        self.timeout = timeout
+        self.start()
+        return
+
+    def __repr__(self):
+        return ('<PDFBudget: max_operators=%r, max_chars=%r, max_xobject_depth=%r, '
+                'max_decoded_bytes=%r, timeout=%r>' %
+                (self.max_operators, self.max_chars, self.max_xobject_depth,
+                 self.max_decoded_bytes, self.timeout))
+
+    def start(self):
+        """Resets the counters. Called at the beginning of each page."""
+        self.noperators = 0
+        self.nchars = 0
+        self.ndecoded = 0
+        if self.timeout is None:
+            self.deadline = None
+        else:
+            self.deadline = time.time() + self.timeout
+        return
+
+    def add_operator(self):
+        self.noperators += 1
+        if self.max_operators is not None and self.max_operators < self.noperators:
+            raise PDFBudgetExceeded('Too many operators: %d' % self.noperators)
+        self.check_deadline()
+        return
+
+    def check_deadline(self):
+        """Also called by the layout analysis of the page."""
+        if self.deadline is not None and self.deadline < time.time():
+            raise PDFBudgetExceeded('Timeout: %r sec' % self.timeout)
+        return
+
+    def add_chars(self, n):
+        self.nchars += n
+        if self.max_chars is not None and self.max_chars < self.nchars:
+            raise PDFBudgetExceeded('Too many chars: %d' % self.nchars)
+        return
+
+    def add_decoded_bytes(self, n):
+        self.ndecoded += n
+        if self.max_decoded_bytes is not None and self.max_decoded_bytes < self.ndecoded:
+            raise PDFBudgetExceeded('Too many decoded bytes: %d' % self.ndecoded)
+        return
+
+    def check_depth(self, depth):
+        if self.max_xobject_depth is not None and self.max_xobject_depth < depth:
+            raise PDFBudgetExceeded('XObjects nested too deep: %d' % depth)
+        return
+
+    def get_usage(self):
+        return (self.noperators, self.nchars, self.ndecoded)
+
+    def charge(self, usage):
+        """Counts the work of a form again when its cached result is used."""
+        (noperators, nchars, ndecoded) = usage
+        self.noperators += noperators
+        if self.max_operators is not None and self.max_operators < self.noperators:
+            raise PDFBudgetExceeded('Too many operators: %d' % self.noperators)
+        self.add_chars(nchars)
+        self.add_decoded_bytes(ndecoded)
+        return
+
+
+##  PDFProfile
+##
+class PDFProfile:
+
+    """Statistics of the work spent for rendering each page.
+
+    operators: maps an operator name to [count, seconds]. The time of
+      an operator includes reading its operands (for EI, the inline
+      image data) and, for Do, the operators of the nested forms.
+    xobjects: maps an XObject name to [count, seconds], including
+      the nested forms.
+    fonts: maps a font name to the number of characters (CIDs) shown.
+    elapsed: the time spent for the pages, including the device.
+
+    callback(page, profile) is called at the end of each page.
+    Use merge() to add up the statistics of many pages.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.start()
+        self.npages = 0
+        return
+
+    def __repr__(self):
+        return ('<PDFProfile: pages=%d, operators=%d, xobjects=%d, fonts=%d, elapsed=%.3f>' %
+                (self.npages, len(self.operators), len(self.xobjects),
+                 len(self.fonts), self.elapsed))
+
+    def start(self):
+        """Resets the statistics. Called at the beginning of each page."""
+        self.npages = 1
+        self.elapsed = 0
+        self.operators = {}
+        self.xobjects = {}
+        self.fonts = {}
+        self.t0 = time.perf_counter()
+        return
+
+    def end(self, page):
+        """Called at the end of each page."""
+        self.elapsed = time.perf_counter() - self.t0
+        if self.callback is not None:
+            self.callback(page, self)
+        return
+
+    def add_operator(self, name, t):
+        try:
+            stat = self.operators[name]
+        except KeyError:
+            stat = self.operators[name] = [0, 0]
+        stat[0] += 1
+        stat[1] += t
+        return
+
+    def add_xobject(self, name, t):
+        try:
+            stat = self.xobjects[name]
+        except KeyError:
+            stat = self.xobjects[name] = [0, 0]
+        stat[0] += 1
+        stat[1] += t
+        return
+
+    def add_chars(self, fontname, n):
+        self.fonts[fontname] = self.fonts.get(fontname, 0) + n
+        return
+
+    def merge(self, profile):
+        """Adds the statistics of another profile."""
+        self.npages += profile.npages
+        self.elapsed += profile.elapsed
+        for (stats0, stats1) in ((self.operators, profile.operators),
+                                 (self.xobjects, profile.xobjects)):
+            for (name, (count, t)) in stats1.items():
+                stat = stats0.setdefault(name, [0, 0])
+                stat[0] += count
+                stat[1] += t
+        for (fontname, n) in profile.fonts.items():
+            self.add_chars(fontname, n)
+        return
+
+    def write_report(self, outfp, maxlines=20):
+        """Writes the most expensive operators, XObjects and fonts."""
+        outfp.write('pages: %d, elapsed: %.3f sec\n' % (self.npages, self.elapsed))
+        outfp.write('     count       sec  operator\n')
+        items = sorted(self.operators.items(), key=lambda x: x[1][1], reverse=True)
+        for (name, (count, t)) in items[:maxlines]:
+            outfp.write('%10d %9.3f  %s\n' % (count, t, name.decode('latin-1')))
+        outfp.write('     count       sec  xobject\n')
+        items = sorted(self.xobjects.items(), key=lambda x: x[1][1], reverse=True)
+        for (name, (count, t)) in items[:maxlines]:
+            outfp.write('%10d %9.3f  %s\n' % (count, t, name))
+        outfp.write('     chars            font\n')
+        items = sorted(self.fonts.items(), key=lambda x: x[1], reverse=True)
+        for (fontname, n) in items[:maxlines]:
+            outfp.write('%10d            %s\n' % (n, fontname))
+        return
+
+
+##  PDFFormCache
+##
+class PDFFormCache:
+
+    """Results of Form XObjects, drawn again without interpreting them.
+
+    A form is reused when it is drawn with the same resources and
+    the same scaling and rotation; only the translation may differ.
+    The device stores and redraws the results (see
+    PDFDevice.save_figure), so the output can differ from a fresh
+    rendering in the last digits of the coordinates.
+    maxitems bounds the total number of layout items kept.
+    """
+
+    def __init__(self, maxitems=100000):
+        self.maxitems = maxitems
+        self.nitems = 0
+        self.hits = 0
+        self.misses = 0
+        self._forms = OrderedDict()
+        return
+
+    def __repr__(self):
+        return ('<PDFFormCache: forms=%d, items=%d, hits=%d, misses=%d>' %
+                (len(self._forms), self.nitems, self.hits, self.misses))
+
+    def get(self, key):
+        entry = self._forms.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._forms.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry, nitems):
+        if self.maxitems < nitems:
+            return
+        if key in self._forms:
+            self.nitems -= self._forms.pop(key)[-1]
+        self._forms[key] = entry+(nitems,)
+        self.nitems += nitems
+        while self.maxitems < self.nitems:
+            (_, entry) = self._forms.popitem(last=False)
+            self.nitems -= entry[-1]
+        return
+
+
 ##  Resource Manager
 ##
+# get_font_fingerprint: returns a digest of a font spec and the objects it refers to.
+def get_font_fingerprint(spec, maxdepth=32):
+    h = hashlib.sha1()
+    path = set()
+
+    def feed(x, depth):
+        x = resolve1(x)
+        if depth == 0 or id(x) in path:
+            h.update(b'?')
+            return
+        if isinstance(x, PDFStream):
+            path.add(id(x))
+            h.update(b'S')
+            feed(x.attrs, depth-1)
+            # The raw bytes are hashed so that font files are not decoded
+            # here. A stream that is already decoded has only its data.
+            rawdata = x.get_rawdata()
+            if rawdata is not None:
+                if x.decipher:
+                    rawdata = x.decipher(x.objid, x.genno, rawdata, x.attrs)
+                h.update(b'R')
+                h.update(hashlib.sha1(rawdata).digest())
+            else:
+                h.update(b'D')
+                h.update(hashlib.sha1(x.get_data()).digest())
+            path.discard(id(x))
+        elif isinstance(x, dict):
+            path.add(id(x))
+            h.update(b'D%d;' % len(x))
+            for k in sorted(x, key=str):
+                feed(k, depth-1)
+                feed(x[k], depth-1)
+            path.discard(id(x))
+        elif isinstance(x, list):
+            path.add(id(x))
+            h.update(b'A%d;' % len(x))
+            for v in x:
+                feed(v, depth-1)
+            path.discard(id(x))
+        elif isinstance(x, bytes):
+            h.update(b'B%d;' % len(x))
+            h.update(x)
+        elif isinstance(x, str):
+            x = x.encode('utf-8')
+            h.update(b'U%d;' % len(x))
+            h.update(x)
+        elif isinstance(x, PSLiteral):
+            feed(x.name, depth)
+            h.update(b'L')
+        else:
+            h.update(('%s:%r;' % (type(x).__name__, x)).encode('utf-8'))
+        return
+    feed(spec, maxdepth)
+    return h.digest()
+
+
+##  PDFFontCache
+##
+##  An LRU cache of font objects keyed by get_font_fingerprint().
+##  It can be shared by resource managers of different documents
+##  and threads.
+##
+class PDFFontCache:
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._fonts = OrderedDict()
+        self._lock = threading.Lock()
+        return
+
+    def __repr__(self):
+        return ('<PDFFontCache: fonts=%d, hits=%d, misses=%d>' %
+                (len(self._fonts), self.hits, self.misses))
+
+    def get(self, key):
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                self.misses += 1
+            else:
+                self._fonts.move_to_end(key)
+                self.hits += 1
+            return font
+
+    def put(self, key, font):
+        with self._lock:
+            self._fonts[key] = font
+            while self.maxsize < len(self._fonts):
+                self._fonts.popitem(last=False)
+        return
+
+
 class PDFResourceManager:
 
     """Repository of shared resources.
@@ -137,13 +482,19 @@ class PDFResourceManager:
     ResourceManager facilitates reuse of shared resources
     such as fonts and images so that large objects are not
     allocated multiple times.
+    Fonts can also be shared across documents with a PDFFontCache.
     """
 
     debug = False
 
-    def __init__(self, caching=True):
+    # The number of resource maps kept by get_resources().
+    resources_cache_size = 256
+
+    def __init__(self, caching=True, font_cache=None):
         self.caching = caching
+        self.font_cache = font_cache
         self._cached_fonts = {}
+        self._cached_resources = OrderedDict()
         return
 
     def get_procset(self, procs):
@@ -165,49 +516,119 @@ class PDFResourceManager:
                 raise
             return CMap()
 
+    # get_resources(resources)
+    #   Returns (fontmap, xobjmap, csmap) for a resources dictionary.
+    #   The maps are shared by every page and form that uses
+    #   the same dictionary, so they must not be modified.
+    #   The most recently used ones are kept, as the manager
+    #   can be shared by many documents.
+    def get_resources(self, resources):
+        if not resources:
+            return ({}, {}, PREDEFINED_COLORSPACE.copy())
+        # Resolved dictionaries are kept by the document, so the same
+        # /Resources object always comes back as the same dict.
+        # The entry keeps the dict, so its id is not reused.
+        key = id(resources)
+        cache = self._cached_resources
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key][1]
+        maps = self.create_resources(resources)
+        if self.caching:
+            cache[key] = (resources, maps)
+            while self.resources_cache_size < len(cache):
+                cache.popitem(last=False)
+        return maps
+
+    def create_resources(self, resources):
+        fontmap = {}
+        xobjmap = {}
+        csmap = PREDEFINED_COLORSPACE.copy()
+
+        def get_colorspace(spec):
+            if isinstance(spec, list):
+                name = literal_name(spec[0])
+            else:
+                name = literal_name(spec)
+            if name == 'ICCBased' and isinstance(spec, list) and 2 <= len(spec):
+                return PDFColorSpace(name, stream_value(spec[1])['N'])
+            elif name == 'DeviceN' and isinstance(spec, list) and 2 <= len(spec):
+                return PDFColorSpace(name, len(list_value(spec[1])))
+            else:
+                return PREDEFINED_COLORSPACE.get(name)
+        for (k, v) in dict_value(resources).items():
+            if self.debug:
+                logging.debug('Resource: %r: %r' % (k, v))
+            if k == 'Font':
+                for (fontid, spec) in dict_value(v).items():
+                    objid = None
+                    if isinstance(spec, PDFObjRef):
+                        objid = spec.objid
+                    spec = dict_value(spec)
+                    fontmap[fontid] = self.get_font(objid, spec)
+            elif k == 'ColorSpace':
+                for (csid, spec) in dict_value(v).items():
+                    csmap[csid] = get_colorspace(resolve1(spec))
+            elif k == 'ProcSet':
+                self.get_procset(list_value(v))
+            elif k == 'XObject':
+                for (xobjid, xobjstrm) in dict_value(v).items():
+                    xobjmap[xobjid] = xobjstrm
+        return (fontmap, xobjmap, csmap)
+
     def get_font(self, objid, spec):
         if objid and objid in self._cached_fonts:
-            font = self._cached_fonts[objid]
+            return self._cached_fonts[objid]
+        if self.font_cache is not None:
+            key = get_font_fingerprint(spec)
+            font = self.font_cache.get(key)
+            if font is None:
+                font = self.create_font(spec)
+                self.font_cache.put(key, font)
+        else:
+            font = self.create_font(spec)
+        if objid and self.caching:
+            self._cached_fonts[objid] = font
+        return font
+
+    def create_font(self, spec):
+        if self.debug:
+            logging.info('create_font: spec=%r' % spec)
+        if STRICT:
+            if spec['Type'] is not LITERAL_FONT:
+                raise PDFFontError('Type is not /Font')
+        # Create a Font object.
+        if 'Subtype' in spec:
+            subtype = literal_name(spec['Subtype'])
         else:
-            if self.debug:
-                logging.info('get_font: create: objid=%r, spec=%r' % (objid, spec))
             if STRICT:
-                if spec['Type'] is not LITERAL_FONT:
-                    raise PDFFontError('Type is not /Font')
-            # Create a Font object.
-            if 'Subtype' in spec:
-                subtype = literal_name(spec['Subtype'])
-            else:
-                if STRICT:
-                    raise PDFFontError('Font Subtype is not specified.')
-                subtype = 'Type1'
-            if subtype in ('Type1', 'MMType1'):
-                # Type1 Font
-                font = PDFType1Font(self, spec)
-            elif subtype == 'TrueType':
-                # TrueType Font
-                font = PDFTrueTypeFont(self, spec)
-            elif subtype == 'Type3':
-                # Type3 Font
-                font = PDFType3Font(self, spec)
-            elif subtype in ('CIDFontType0', 'CIDFontType2'):
-                # CID Font
-                font = PDFCIDFont(self, spec)
-            elif subtype == 'Type0':
-                # Type0 Font
-                dfonts = list_value(spec['DescendantFonts'])
-                assert dfonts
-                subspec = dict_value(dfonts[0]).copy()
-                for k in ('Encoding', 'ToUnicode'):
-                    if k in spec:
-                        subspec[k] = resolve1(spec[k])
-                font = self.get_font(None, subspec)
-            else:
-                if STRICT:
-                    raise PDFFontError('Invalid Font spec: %r' % spec)
-                font = PDFType1Font(self, spec)  # this is so wrong!
-            if objid and self.caching:
-                self._cached_fonts[objid] = font
+                raise PDFFontError('Font Subtype is not specified.')
+            subtype = 'Type1'
+        if subtype in ('Type1', 'MMType1'):
+            # Type1 Font
+            font = PDFType1Font(self, spec)
+        elif subtype == 'TrueType':
+            # TrueType Font
+            font = PDFTrueTypeFont(self, spec)
+        elif subtype == 'Type3':
+            # Type3 Font
+            font = PDFType3Font(self, spec)
+        elif subtype in ('CIDFontType0', 'CIDFontType2'):
+            # CID Font
+            font = PDFCIDFont(self, spec)
+        elif subtype == 'Type0':
+            # Type0 Font
+            dfonts = list_value(spec['DescendantFonts'])
+            assert dfonts
+            subspec = dict_value(dfonts[0]).copy()
+            for k in ('Encoding', 'ToUnicode'):
+                if k in spec:
+                    subspec[k] = resolve1(spec[k])
+            font = self.create_font(subspec)
+        else:
+            if STRICT:
+                raise PDFFontError('Invalid Font spec: %r' % spec)
+            font = PDFType1Font(self, spec)  # this is so wrong!
         return font
 
 
@@ -215,69 +636,108 @@ class PDFResourceManager:
 ##
 class PDFContentParser(PSStackParser):
 
-    def __init__(self, streams):
+    def __init__(self, streams, budget=None):
         self.streams = streams
         self.istream = 0
+        self.budget = budget
         PSStackParser.__init__(self, None)
         return
 
-    def fillfp(self):
-        if not self.fp:
-            if self.istream < len(self.streams):
-                strm = stream_value(self.streams[self.istream])
-                self.istream += 1
-            else:
-                raise PSEOF('Unexpected EOF, file truncated?')
-            self.fp = BytesIO(strm.get_data())
+    # nextstream()
+    #   Switches to the next content stream. Its decoded data
+    #   is tokenized as a whole, without being copied or split.
+    #   Tokens that continue across streams are handled by the
+    #   tokenizer like the ones across buffers.
+    #   Each stream is decoded and charged to the budget only
+    #   when it is reached.
+    def nextstream(self):
+        if len(self.streams) <= self.istream:
+            raise PSEOF('Unexpected EOF, file truncated?')
+        strm = stream_value(self.streams[self.istream])
+        self.istream += 1
+        self.bufpos = 0
+        self.buf = strm.get_data() or b''
+        self.charpos = 0
+        if self.budget is not None:
+            self.budget.add_decoded_bytes(len(self.buf))
         return
 
+    # seek(pos)
+    #   Seeks to the given position in the current stream.
     def seek(self, pos):
-        self.fillfp()
-        PSStackParser.seek(self, pos)
+        if self.istream == 0:
+            self.nextstream()
+        if self.debug:
+            logging.debug('seek: %r' % pos)
+        self.bufpos = 0
+        self.charpos = pos
+        # reset the status for nexttoken()
+        self._parse1 = self._parse_main
+        self._curtoken = b''
+        self._curtokenpos = 0
+        self._tokens = []
+        self.reset()
         return
 
     def fillbuf(self):
-        if self.charpos < len(self.buf):
-            return
-        while 1:
-            self.fillfp()
-            self.bufpos = self.fp.tell()
-            self.buf = self.fp.read(self.BUFSIZ)
-            if self.buf:
-                break
-            self.fp = None
-        self.charpos = 0
+        while len(self.buf) <= self.charpos:
+            self.nextstream()
         return
 
-    def get_inline_data(self, pos, target=b'EI'):
+    def nexttoken(self):
+        tokens = self._tokens
+        while not tokens:
+            if len(self.buf) <= self.charpos:
+                self.nextstream()
+            self.charpos = self._parse1(self.buf, self.charpos)
+        token = tokens.pop(0)
+        if self.debug:
+            logging.debug('nexttoken: %r' % (token,))
+        return token
+
+    # get_inline_data(pos, target=b'EI', length=None)
+    #   Returns the inline image data that starts at pos.
+    #   The data ends with target followed by a whitespace or the end
+    #   of the last stream. If length (/L) is given and the target is
+    #   found there, it is used without scanning the data.
+    def get_inline_data(self, pos, target=b'EI', length=None):
         self.seek(pos)
-        i = 0
-        data = b''
-        while i <= len(target):
-            self.fillbuf()
-            if i:
-                c = self.buf[self.charpos:self.charpos+1]
-                data += c
-                self.charpos += 1
-                if len(target) <= i and c.isspace():
-                    i += 1
-                elif i < len(target) and c == target[i:i+1]:
-                    i += 1
-                else:
-                    i = 0
-            else:
-                try:
-                    j = self.buf.index(target[0], self.charpos)
-                    #print('found', (0, self.buf[j:j+10]))
-                    data += self.buf[self.charpos:j+1]
-                    self.charpos = j+1
-                    i = 1
-                except ValueError:
-                    data += self.buf[self.charpos:]
-                    self.charpos = len(self.buf)
-        data = data[:-(len(target)+1)]  # strip the last part
-        data = re.sub(br'(\x0d\x0a|[\x0d\x0a])$', b'', data)
-        return (pos, data)
+        data = self.buf
+        n = len(target)
+        i = -1
+        if isinstance(length, int) and 0 <= length:
+            i = pos+length
+            while data[i:i+1].isspace():
+                i += 1
+            if not (data.startswith(target, i) and
+                    (data[i+n:i+n+1].isspace() or
+                     (i+n == len(data) and len(self.streams) <= self.istream))):
+                i = -1
+        # base: the position of the current stream in data.
+        base = 0
+        if i < 0:
+            i = pos
+            while 1:
+                j = data.find(target, i)
+                if j < 0 or (j+n == len(data) and self.istream < len(self.streams)):
+                    # the image continues in the next stream.
+                    i = j if 0 <= j else max(pos, len(data)-n+1)
+                    self.nextstream()
+                    base = len(data)
+                    data += self.buf
+                    continue
+                i = j
+                if i+n == len(data) or data[i+n:i+n+1].isspace():
+                    break
+                i += 1
+        self.seek(i+n+1-base)
+        end = i
+        # strip the end of line before the target.
+        if data.endswith(b'\r\n', pos, end):
+            end -= 2
+        elif data.endswith((b'\r', b'\n'), pos, end):
+            end -= 1
+        return (pos, data[pos:end])
 
     def flush(self):
         self.add_results(*self.popall())
@@ -297,7 +757,7 @@ class PDFContentParser(PSStackParser):
                 if len(objs) % 2 != 0:
                     raise PSTypeError('Invalid dictionary construct: %r' % objs)
                 d = dict((literal_name(k), v) for (k, v) in choplist(2, objs))
-                (pos, data) = self.get_inline_data(pos+len(b'ID '))
+                (pos, data) = self.get_inline_data(pos+len(b'ID '), length=d.get('L', d.get('Length')))
                 obj = PDFStream(d, data)
                 self.push((pos, obj))
                 self.push((pos, self.KEYWORD_EI))
@@ -315,53 +775,71 @@ class PDFPageInterpreter:
 
     debug = 0
 
-    def __init__(self, rsrcmgr, device):
+    # The operators skipped unless the device has the capability.
+    CAPABILITY_OPERATORS = {
+        'text': ('BT', 'ET', 'Tc', 'Tw', 'Tz', 'TL', 'Tf', 'Tr', 'Ts',
+                 'Td', 'TD', 'Tm', 'T*', 'TJ', 'Tj', "'", '"'),
+        'paths': ('w', 'J', 'j', 'M', 'd', 'ri', 'i',
+                  'm', 'l', 'c', 'v', 'y', 'h', 're',
+                  'S', 's', 'f', 'F', 'f*', 'B', 'B*', 'b', 'b*', 'n',
+                  'W', 'W*', 'sh'),
+        'colors': ('CS', 'cs', 'G', 'g', 'RG', 'rg', 'K', 'k',
+                   'SC', 'SCN', 'sc', 'scn'),
+        'images': ('EI',),
+        'tags': ('MP', 'DP', 'BMC', 'BDC', 'EMC'),
+    }
+
+    _operators_cache = {}
+
+    def __init__(self, rsrcmgr, device, budget=None, form_cache=None, profile=None):
         self.rsrcmgr = rsrcmgr
         self.device = device
-        return
+        self.budget = budget
+        self.form_cache = form_cache
+        self.profile = profile
+        # depth: the nesting level of Form XObjects.
+        self.depth = 0
+        self.capabilities = frozenset(device.capabilities)
+        self.operators = self.get_operators(self.capabilities)
+        return
+
+    # get_operators(capabilities):
+    #   Returns a dict that maps operator names to (func, nargs).
+    #   func is None for the operators skipped with the capabilities.
+    #   The dict is shared and filled with the known operators
+    #   returned by get_operator().
+    @classmethod
+    def get_operators(klass, capabilities):
+        key = (klass, capabilities)
+        if key not in klass._operators_cache:
+            operators = {}
+            for (capability, names) in klass.CAPABILITY_OPERATORS.items():
+                if capability not in capabilities:
+                    for name in names:
+                        operators[name.encode('ascii')] = (None, 0)
+            klass._operators_cache[key] = operators
+        return klass._operators_cache[key]
+
+    # get_operator(name):
+    #   Returns (func, nargs) for an operator, or (None, None) if it is unknown.
+    def get_operator(self, name):
+        method = 'do_%s' % name.decode('latin-1').replace('*', '_a').replace('"', '_w').replace("'", '_q')
+        func = getattr(self.__class__, method, None)
+        if func is None:
+            return (None, None)
+        return (func, func.__code__.co_argcount-1)
 
     def dup(self):
-        return self.__class__(self.rsrcmgr, self.device)
+        interpreter = self.__class__(self.rsrcmgr, self.device, budget=self.budget,
+                                     form_cache=self.form_cache, profile=self.profile)
+        interpreter.depth = self.depth+1
+        return interpreter
 
     # init_resources(resources):
     #   Prepare the fonts and XObjects listed in the Resource attribute.
     def init_resources(self, resources):
         self.resources = resources
-        self.fontmap = {}
-        self.xobjmap = {}
-        self.csmap = PREDEFINED_COLORSPACE.copy()
-        if not resources:
-            return
-
-        def get_colorspace(spec):
-            if isinstance(spec, list):
-                name = literal_name(spec[0])
-            else:
-                name = literal_name(spec)
-            if name == 'ICCBased' and isinstance(spec, list) and 2 <= len(spec):
-                return PDFColorSpace(name, stream_value(spec[1])['N'])
-            elif name == 'DeviceN' and isinstance(spec, list) and 2 <= len(spec):
-                return PDFColorSpace(name, len(list_value(spec[1])))
-            else:
-                return PREDEFINED_COLORSPACE.get(name)
-        for (k, v) in dict_value(resources).items():
-            if self.debug:
-                logging.debug('Resource: %r: %r' % (k, v))
-            if k == 'Font':
-                for (fontid, spec) in dict_value(v).items():
-                    objid = None
-                    if isinstance(spec, PDFObjRef):
-                        objid = spec.objid
-                    spec = dict_value(spec)
-                    self.fontmap[fontid] = self.rsrcmgr.get_font(objid, spec)
-            elif k == 'ColorSpace':
-                for (csid, spec) in dict_value(v).items():
-                    self.csmap[csid] = get_colorspace(resolve1(spec))
-            elif k == 'ProcSet':
-                self.rsrcmgr.get_procset(list_value(v))
-            elif k == 'XObject':
-                for (xobjid, xobjstrm) in dict_value(v).items():
-                    self.xobjmap[xobjid] = xobjstrm
+        (self.fontmap, self.xobjmap, self.csmap) = self.rsrcmgr.get_resources(resources)
         return
 
     # init_state(ctm)
@@ -373,6 +851,9 @@ class PDFPageInterpreter:
         self.device.set_ctm(self.ctm)
         self.textstate = PDFTextState()
         self.graphicstate = PDFGraphicState()
+        # textstate and graphicstate may also be on gstack;
+        # they are copied before they are changed.
+        self.textstate_shared = self.graphicstate_shared = False
         self.curpath = []
         # argstack: stack for command arguments.
         self.argstack = []
@@ -392,17 +873,43 @@ class PDFPageInterpreter:
         if n == 0:
             return []
         x = self.argstack[-n:]
-        self.argstack = self.argstack[:-n]
+        del self.argstack[-n:]
         return x
 
+    # get_current_state()
+    #   Returns a snapshot of the states. The state objects are not
+    #   copied here, but only when they are changed afterwards.
     def get_current_state(self):
-        return (self.ctm, self.textstate.copy(), self.graphicstate.copy())
+        self.textstate_shared = self.graphicstate_shared = True
+        return (self.ctm, self.textstate, self.graphicstate)
 
     def set_current_state(self, state):
         (self.ctm, self.textstate, self.graphicstate) = state
+        # The restored objects may still be on gstack,
+        # in which case they are found at the top.
+        if self.gstack:
+            (_, textstate, graphicstate) = self.gstack[-1]
+            self.textstate_shared = textstate is self.textstate
+            self.graphicstate_shared = graphicstate is self.graphicstate
+        else:
+            self.textstate_shared = self.graphicstate_shared = False
         self.device.set_ctm(self.ctm)
         return
 
+    # get_textstate(), get_graphicstate()
+    #   Returns the state object that can be changed.
+    def get_textstate(self):
+        if self.textstate_shared:
+            self.textstate = self.textstate.copy()
+            self.textstate_shared = False
+        return self.textstate
+
+    def get_graphicstate(self):
+        if self.graphicstate_shared:
+            self.graphicstate = self.graphicstate.copy()
+            self.graphicstate_shared = False
+        return self.graphicstate
+
     # gsave
     def do_q(self):
         self.gstack.append(self.get_current_state())
@@ -422,37 +929,37 @@ class PDFPageInterpreter:
 
     # setlinewidth
     def do_w(self, linewidth):
-        self.graphicstate.linewidth = linewidth
+        self.get_graphicstate().linewidth = linewidth
         return
 
     # setlinecap
     def do_J(self, linecap):
-        self.graphicstate.linecap = linecap
+        self.get_graphicstate().linecap = linecap
         return
 
     # setlinejoin
     def do_j(self, linejoin):
-        self.graphicstate.linejoin = linejoin
+        self.get_graphicstate().linejoin = linejoin
         return
 
     # setmiterlimit
     def do_M(self, miterlimit):
-        self.graphicstate.miterlimit = miterlimit
+        self.get_graphicstate().miterlimit = miterlimit
         return
 
     # setdash
     def do_d(self, dash, phase):
-        self.graphicstate.dash = (dash, phase)
+        self.get_graphicstate().dash = (dash, phase)
         return
 
     # setintent
     def do_ri(self, intent):
-        self.graphicstate.intent = intent
+        self.get_graphicstate().intent = intent
         return
 
     # setflatness
     def do_i(self, flatness):
-        self.graphicstate.flatness = flatness
+        self.get_graphicstate().flatness = flatness
         return
 
     # load-gstate
@@ -645,7 +1152,7 @@ class PDFPageInterpreter:
 
     # begin-text
     def do_BT(self):
-        self.textstate.reset()
+        self.get_textstate().reset()
         return
 
     # end-text
@@ -683,73 +1190,78 @@ class PDFPageInterpreter:
 
     # setcharspace
     def do_Tc(self, space):
-        self.textstate.charspace = space
+        self.get_textstate().charspace = space
         return
 
     # setwordspace
     def do_Tw(self, space):
-        self.textstate.wordspace = space
+        self.get_textstate().wordspace = space
         return
 
     # textscale
     def do_Tz(self, scale):
-        self.textstate.scaling = scale
+        self.get_textstate().scaling = scale
         return
 
     # setleading
     def do_TL(self, leading):
-        self.textstate.leading = -leading
+        self.get_textstate().leading = -leading
         return
 
     # selectfont
     def do_Tf(self, fontid, fontsize):
+        textstate = self.get_textstate()
         try:
-            self.textstate.font = self.fontmap[literal_name(fontid)]
+            textstate.font = self.fontmap[literal_name(fontid)]
         except KeyError:
             if STRICT:
                 raise PDFInterpreterError('Undefined Font id: %r' % fontid)
-            self.textstate.font = self.rsrcmgr.get_font(None, {})
-        self.textstate.fontsize = fontsize
+            textstate.font = self.rsrcmgr.get_font(None, {})
+        textstate.fontsize = fontsize
         return
 
     # setrendering
     def do_Tr(self, render):
-        self.textstate.render = render
+        self.get_textstate().render = render
         return
 
     # settextrise
     def do_Ts(self, rise):
-        self.textstate.rise = rise
+        self.get_textstate().rise = rise
         return
 
     # text-move
     def do_Td(self, tx, ty):
-        (a, b, c, d, e, f) = self.textstate.matrix
-        self.textstate.matrix = (a, b, c, d, tx*a+ty*c+e, tx*b+ty*d+f)
-        self.textstate.linematrix = (0, 0)
+        textstate = self.get_textstate()
+        (a, b, c, d, e, f) = textstate.matrix
+        textstate.matrix = (a, b, c, d, tx*a+ty*c+e, tx*b+ty*d+f)
+        textstate.linematrix = (0, 0)
         #print('Td(%r,%r): %r' % (tx, ty, self.textstate), file=sys.stderr)
         return
 
     # text-move
     def do_TD(self, tx, ty):
-        (a, b, c, d, e, f) = self.textstate.matrix
-        self.textstate.matrix = (a, b, c, d, tx*a+ty*c+e, tx*b+ty*d+f)
-        self.textstate.leading = ty
-        self.textstate.linematrix = (0, 0)
+        textstate = self.get_textstate()
+        (a, b, c, d, e, f) = textstate.matrix
+        textstate.matrix = (a, b, c, d, tx*a+ty*c+e, tx*b+ty*d+f)
+        textstate.leading = ty
+        textstate.linematrix = (0, 0)
         #print('TD(%r,%r): %r' % (tx, ty, self.textstate), file=sys.stderr)
         return
 
     # textmatrix
     def do_Tm(self, a, b, c, d, e, f):
-        self.textstate.matrix = (a, b, c, d, e, f)
-        self.textstate.linematrix = (0, 0)
+        textstate = self.get_textstate()
+        textstate.matrix = (a, b, c, d, e, f)
+        textstate.linematrix = (0, 0)
         return
 
     # nextline
     def do_T_a(self):
-        (a, b, c, d, e, f) = self.textstate.matrix
-        self.textstate.matrix = (a, b, c, d, self.textstate.leading*c+e, self.textstate.leading*d+f)
-        self.textstate.linematrix = (0, 0)
+        textstate = self.get_textstate()
+        (a, b, c, d, e, f) = textstate.matrix
+        textstate.matrix = (a, b, c, d, textstate.leading*c+e, textstate.leading*d+f)
+        textstate.linematrix = (0, 0)
         return
 
     # show-pos
@@ -759,7 +1271,18 @@ class PDFPageInterpreter:
             if STRICT:
                 raise PDFInterpreterError('No font specified!')
             return
-        self.device.render_string(self.textstate, seq)
+        if self.budget is not None or self.profile is not None:
+            font = self.textstate.font
+            if font.is_multibyte():
+                nchars = sum(len(font.decode(obj)) for obj in seq if isinstance(obj, bytes))
+            else:
+                nchars = sum(len(obj) for obj in seq if isinstance(obj, bytes))
+            if self.budget is not None:
+                self.budget.add_chars(nchars)
+            if self.profile is not None:
+                self.profile.add_chars(font.fontname, nchars)
+        # the device advances textstate.linematrix.
+        self.device.render_string(self.get_textstate(), seq)
         return
 
     # show
@@ -788,6 +1311,8 @@ class PDFPageInterpreter:
         return
 
     def do_EI(self, obj):
+        if self.budget is not None:
+            self.budget.add_decoded_bytes(len(obj.get_rawdata() or b''))
         if 'W' in obj and 'H' in obj:
             iobjid = str(id(obj))
             self.device.begin_figure(iobjid, (0, 0, 1, 1), MATRIX_IDENTITY)
@@ -798,6 +1323,17 @@ class PDFPageInterpreter:
     # invoke an XObject
     def do_Do(self, xobjid):
         xobjid = literal_name(xobjid)
+        if self.profile is None:
+            self.render_xobject(xobjid)
+        else:
+            t0 = time.perf_counter()
+            self.render_xobject(xobjid)
+            self.profile.add_xobject(xobjid, time.perf_counter()-t0)
+        return
+
+    # render_xobject(xobjid)
+    #   Draws a Form or Image XObject.
+    def render_xobject(self, xobjid):
         try:
             xobj = stream_value(self.xobjmap[xobjid])
         except KeyError:
@@ -808,16 +1344,24 @@ class PDFPageInterpreter:
         subtype = xobj.get('Subtype')
         if subtype is LITERAL_FORM and 'BBox' in xobj:
             interpreter = self.dup()
+            if self.budget is not None:
+                self.budget.check_depth(interpreter.depth)
             bbox = list_value(xobj['BBox'])
             matrix = list_value(xobj.get('Matrix', MATRIX_IDENTITY))
             # According to PDF reference 1.7 section 4.9.1, XObjects in
             # earlier PDFs (prior to v1.2) use the page's Resources entry
             # instead of having their own Resources entry.
-            resources = dict_value(xobj.get('Resources')) or self.resources.copy()
-            self.device.begin_figure(xobjid, bbox, matrix)
-            interpreter.render_contents(resources, [xobj], ctm=mult_matrix(matrix, self.ctm))
-            self.device.end_figure(xobjid)
+            resources = dict_value(xobj.get('Resources')) or self.resources
+            ctm = mult_matrix(matrix, self.ctm)
+            if self.form_cache is None:
+                self.device.begin_figure(xobjid, bbox, matrix)
+                interpreter.render_contents(resources, [xobj], ctm=ctm)
+                self.device.end_figure(xobjid)
+            else:
+                self.render_form(interpreter, xobjid, xobj, resources, bbox, matrix, ctm)
         elif subtype is LITERAL_IMAGE and 'Width' in xobj and 'Height' in xobj:
+            if 'images' not in self.capabilities:
+                return
             self.device.begin_figure(xobjid, (0, 0, 1, 1), MATRIX_IDENTITY)
             self.device.render_image(xobjid, xobj)
             self.device.end_figure(xobjid)
@@ -826,6 +1370,33 @@ class PDFPageInterpreter:
             pass
         return
 
+    # render_form(interpreter, xobjid, xobj, resources, bbox, matrix, ctm)
+    #   Draws a Form XObject through the form cache.
+    def render_form(self, interpreter, xobjid, xobj, resources, bbox, matrix, ctm):
+        (a, b, c, d, e, f) = ctm
+        # The entry keeps xobj and resources, so their ids stay valid.
+        key = (id(xobj), id(resources), xobjid, a, b, c, d)
+        entry = self.form_cache.get(key)
+        if entry is not None:
+            (_, _, (e0, f0), figure, usage, _) = entry
+            if self.budget is not None:
+                self.budget.charge(usage)
+            self.device.replay_figure(figure, e-e0, f-f0)
+            return
+        if self.budget is not None:
+            usage0 = self.budget.get_usage()
+        self.device.begin_figure(xobjid, bbox, matrix)
+        interpreter.render_contents(resources, [xobj], ctm=ctm)
+        self.device.end_figure(xobjid)
+        saved = self.device.save_figure()
+        if saved is not None:
+            (figure, nitems) = saved
+            usage = (0, 0, 0)
+            if self.budget is not None:
+                usage = tuple(v1-v0 for (v0, v1) in zip(usage0, self.budget.get_usage()))
+            self.form_cache.put(key, (xobj, resources, (e, f), figure, usage), nitems)
+        return
+
     def process_page(self, page):
         if self.debug: logging.info('Processing page: %r' % page)
         (x0, y0, x1, y1) = page.mediabox
@@ -837,9 +1408,16 @@ class PDFPageInterpreter:
             ctm = (0, 1, -1, 0, y1, -x0)
         else:
             ctm = (1, 0, 0, 1, -x0, -y0)
+        if self.budget is not None:
+            self.budget.start()
+        if self.profile is not None:
+            self.profile.start()
+        self.device.set_budget(self.budget)
         self.device.begin_page(page, ctm)
         self.render_contents(page.resources, page.contents, ctm=ctm)
         self.device.end_page(page)
+        if self.profile is not None:
+            self.profile.end(page)
         return
 
     # render_contents(resources, streams, ctm)
@@ -855,35 +1433,103 @@ class PDFPageInterpreter:
         return
 
     def execute(self, streams):
+        budget = self.budget
         try:
-            parser = PDFContentParser(streams)
+            parser = PDFContentParser(streams, budget=budget)
         except PSEOF:
             # empty page
             return
+        operators = self.operators
+        profile = self.profile
+        if profile is not None:
+            t0 = time.perf_counter()
         while 1:
             try:
                 (_, obj) = parser.nextobject()
             except PSEOF:
                 break
             if isinstance(obj, PSKeyword):
-                name = keyword_name(obj).decode('ascii')
-                method = 'do_%s' % name.replace('*', '_a').replace('"', '_w').replace("'", '_q')
-                if hasattr(self, method):
-                    func = getattr(self, method)
-                    nargs = func.__code__.co_argcount-1
+                if budget is not None:
+                    budget.add_operator()
+                name = obj.name
+                try:
+                    (func, nargs) = operators[name]
+                except KeyError:
+                    (func, nargs) = self.get_operator(name)
+                    # unknown names are not cached; the dict is shared.
+                    if func is not None:
+                        operators[name] = (func, nargs)
+                if func is not None:
                     if nargs:
                         args = self.pop(nargs)
                         if self.debug:
-                            logging.debug('exec: %s %r' % (name, args))
+                            logging.debug('exec: %s %r' % (name.decode('latin-1'), args))
                         if len(args) == nargs:
-                            func(*args)
+                            func(self, *args)
                     else:
                         if self.debug:
-                            logging.debug('exec: %s' % name)
-                        func()
+                            logging.debug('exec: %s' % name.decode('latin-1'))
+                        func(self)
+                elif nargs is not None:
+                    # skipped operator.
+                    del self.argstack[:]
                 else:
                     if STRICT:
-                        raise PDFInterpreterError('Unknown operator: %r' % name)
+                        raise PDFInterpreterError('Unknown operator: %r' % name.decode('latin-1'))
+                if profile is not None:
+                    t1 = time.perf_counter()
+                    profile.add_operator(name, t1-t0)
+                    t0 = t1
             else:
                 self.push(obj)
         return
+
+
+import unittest
+
+
+##  Simplistic Test cases
+##
+class TestPDFContentParser(unittest.TestCase):
+
+    IMAGE = b'BI /W 2 /H 1 /BPC 8 /CS /G%s ID \x00\x01 EI'
+
+    def get_objects(self, *streams):
+        parser = PDFContentParser([PDFStream({}, s) for s in streams])
+        r = []
+        try:
+            while 1:
+                (_, obj) = parser.nextobject()
+                if isinstance(obj, PDFStream):
+                    obj = obj.get_data()
+                r.append(obj)
+        except PSEOF:
+            pass
+        return r
+
+    # EI at the end of a stream, followed by another stream.
+    def test_1(self):
+        objs = self.get_objects(b'q '+self.IMAGE % b'', b'\nQ 1 0 0 1 5 5 cm')
+        print(objs)
+        self.assertEqual(objs, [KWD(b'q'), b'\x00\x01 ', KWD(b'EI'),
+                                KWD(b'Q'), 1, 0, 0, 1, 5, 5])
+        return
+
+    # /L gives the same data as scanning for EI.
+    def test_2(self):
+        objs1 = self.get_objects(self.IMAGE % b'' + b' Q\n')
+        objs2 = self.get_objects(self.IMAGE % b' /L 2' + b' Q\n')
+        print(objs1, objs2)
+        self.assertEqual(objs1, [b'\x00\x01 ', KWD(b'EI'), KWD(b'Q')])
+        self.assertEqual(objs2, objs1)
+        return
+
+    # /L skips EI within the image data.
+    def test_3(self):
+        objs = self.get_objects(b'BI /L 6 ID a EI b\nEI Q\n')
+        print(objs)
+        self.assertEqual(objs, [b'a EI b', KWD(b'EI'), KWD(b'Q')])
+        return
+
+if __name__ == '__main__':
+    unittest.main()
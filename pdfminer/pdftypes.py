@@ -4,7 +4,6 @@ from .lzw import lzwdecode
 from .ascii85 import ascii85decode
 from .ascii85 import asciihexdecode
 from .runlength import rldecode
-from .ccitt import ccittfaxdecode
 from .psparser import PSException
 from .psparser import PSObject
 from .psparser import LIT
@@ -259,6 +258,7 @@ class PDFStream(PDFObject):
             elif f in LITERALS_RUNLENGTH_DECODE:
                 data = rldecode(data)
             elif f in LITERALS_CCITTFAX_DECODE:
+                from .ccitt import ccittfaxdecode
                 data = ccittfaxdecode(data, params)
             elif f in LITERALS_DCT_DECODE:
                 # This is probably a JPG stream - it does not need to be decoded twice.
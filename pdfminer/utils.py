@@ -248,15 +248,20 @@ def matrix2str(m):
 ##
 ##  A set-like data structure for objects placed on a plane.
 ##  Can efficiently find objects in a certain rectangular area.
-##  It maintains two parallel lists of objects, each of
-##  which is sorted by its x or y coordinate.
+##  It maintains a hierarchy of uniform grids whose cell size doubles
+##  at each level. Each object is registered at the level where it
+##  spans at most two cells in each direction, so adding or removing
+##  an object takes constant time regardless of its size.
+##  Unless specified, the cell size of the lowest level is estimated
+##  from the average size of the objects given to the first extend().
+##  Objects are iterated and found in the order they were added.
 ##
 class Plane:
 
-    def __init__(self, bbox, gridsize=50):
-        self._seq = []          # preserve the object order.
-        self._objs = set()
-        self._grid = {}
+    def __init__(self, bbox, gridsize=None):
+        self._objs = {}         # {obj: (seq, level, cells)}, preserves the order.
+        self._levels = []       # [(cellsize, {(x, y): {obj: (x0, y0)}})]
+        self._seq = 0
         self.gridsize = gridsize
         (self.x0, self.y0, self.x1, self.y1) = bbox
         return
@@ -265,7 +270,7 @@ class Plane:
         return ('<Plane objs=%r>' % list(self))
 
     def __iter__(self):
-        return ( obj for obj in self._seq if obj in self._objs )
+        return iter(list(self._objs))
 
     def __len__(self):
         return len(self._objs)
@@ -273,61 +278,105 @@ class Plane:
     def __contains__(self, obj):
         return obj in self._objs
 
-    def _getrange(self, bbox):
-        (x0, y0, x1, y1) = bbox
-        if (x1 <= self.x0 or self.x1 <= x0 or
-            y1 <= self.y0 or self.y1 <= y0): return
-        x0 = max(self.x0, x0)
-        y0 = max(self.y0, y0)
-        x1 = min(self.x1, x1)
-        y1 = min(self.y1, y1)
-        for y in drange(y0, y1, self.gridsize):
-            for x in drange(x0, x1, self.gridsize):
-                yield (x, y)
-        return
-
     # extend(objs)
     def extend(self, objs):
+        if self.gridsize is None:
+            objs = list(objs)
+            self.gridsize = get_gridsize(objs)
         for obj in objs:
             self.add(obj)
         return
 
     # add(obj): place an object.
     def add(self, obj):
-        for k in self._getrange((obj.x0, obj.y0, obj.x1, obj.y1)):
-            if k not in self._grid:
-                r = []
-                self._grid[k] = r
-            else:
-                r = self._grid[k]
-            r.append(obj)
-        self._seq.append(obj)
-        self._objs.add(obj)
+        if self.gridsize is None:
+            self.gridsize = 50
+        level = cells = None
+        (x0, y0, x1, y1) = (obj.x0, obj.y0, obj.x1, obj.y1)
+        if not (x1 <= self.x0 or self.x1 <= x0 or
+                y1 <= self.y0 or self.y1 <= y0):
+            x0 = max(self.x0, x0)
+            y0 = max(self.y0, y0)
+            x1 = min(self.x1, x1)
+            y1 = min(self.y1, y1)
+            size = max(x1-x0, y1-y0)
+            level = 0
+            while True:
+                if len(self._levels) <= level:
+                    self._levels.append((self.gridsize * (1 << level), {}))
+                (d, grid) = self._levels[level]
+                if size <= d:
+                    break
+                level += 1
+            (i0, j0, i1, j1) = cells = (int(x0//d), int(y0//d), int(x1//d), int(y1//d))
+            for j in range(j0, j1+1):
+                for i in range(i0, i1+1):
+                    k = (i, j)
+                    if k in grid:
+                        grid[k][obj] = (i0, j0)
+                    else:
+                        grid[k] = {obj: (i0, j0)}
+        self._objs[obj] = (self._seq, level, cells)
+        self._seq += 1
         return
 
     # remove(obj): displace an object.
     def remove(self, obj):
-        for k in self._getrange((obj.x0, obj.y0, obj.x1, obj.y1)):
-            try:
-                self._grid[k].remove(obj)
-            except (KeyError, ValueError):
-                pass
-        self._objs.remove(obj)
+        (_, level, cells) = self._objs.pop(obj)
+        if cells is not None:
+            (_, grid) = self._levels[level]
+            (i0, j0, i1, j1) = cells
+            for j in range(j0, j1+1):
+                for i in range(i0, i1+1):
+                    k = (i, j)
+                    r = grid[k]
+                    del r[obj]
+                    if not r:
+                        del grid[k]
         return
 
     # find(): finds objects that are in a certain area.
     def find(self, bbox):
         (x0, y0, x1, y1) = bbox
-        done = set()
-        for k in self._getrange(bbox):
-            if k not in self._grid:
+        if (x1 <= self.x0 or self.x1 <= x0 or
+            y1 <= self.y0 or self.y1 <= y0): return []
+        (cx0, cy0) = (max(self.x0, x0), max(self.y0, y0))
+        (cx1, cy1) = (min(self.x1, x1), min(self.y1, y1))
+        found = []
+        for (d, grid) in self._levels:
+            if not grid:
                 continue
-            for obj in self._grid[k]:
-                if obj in done:
-                    continue
-                done.add(obj)
-                if (obj.x1 <= x0 or x1 <= obj.x0 or
-                    obj.y1 <= y0 or y1 <= obj.y0):
-                    continue
-                yield obj
-        return
+            (i0, j0, i1, j1) = (int(cx0//d), int(cy0//d), int(cx1//d), int(cy1//d))
+            if (i1-i0+1)*(j1-j0+1) <= len(grid):
+                cells = [ (i, j) for j in range(j0, j1+1) for i in range(i0, i1+1)
+                          if (i, j) in grid ]
+            else:
+                # the area is larger than the occupied cells.
+                cells = [ (i, j) for (i, j) in grid
+                          if i0 <= i and i <= i1 and j0 <= j and j <= j1 ]
+            for (i, j) in cells:
+                for (obj, (a0, b0)) in grid[i, j].items():
+                    # report each object only at its first cell within the area.
+                    if (a0 < i and i0 < i) or (b0 < j and j0 < j):
+                        continue
+                    if (obj.x1 <= x0 or x1 <= obj.x0 or
+                        obj.y1 <= y0 or y1 <= obj.y0):
+                        continue
+                    found.append(obj)
+        if 1 < len(found):
+            objs = self._objs
+            found.sort(key=lambda obj: objs[obj][0])
+        return found
+
+
+# get_gridsize
+def get_gridsize(objs, default=50):
+    """Estimates a cell size from the average area of objects."""
+    n = 0
+    area = 0
+    for obj in objs:
+        n += 1
+        area += max(1, obj.x1-obj.x0) * max(1, obj.y1-obj.y0)
+    if not n:
+        return default
+    return max(1, 2*(area/n)**.5)
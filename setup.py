@@ -49,7 +49,7 @@ setup(
     packages = [
         'pdfminer',
     ],
-    python_requires = '>=3.6',
+    python_requires = '>=3.7',
     install_requires = [
         'pycryptodome',
     ],
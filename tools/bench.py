@@ -0,0 +1,631 @@
+#!/usr/bin/env python
+import sys
+import time
+import random
+from pdfminer.layout import LAParams
+from pdfminer.layout import LTChar
+from pdfminer.layout import LTCharStore
+from pdfminer.layout import LTLayoutContainer
+from pdfminer.layout import LTTextBoxHorizontal
+from pdfminer.layout import LTTextLineHorizontal
+from pdfminer.utils import Plane
+from pdfminer.psparser import LIT
+
+
+def timeit(func, repeat=3):
+    """Returns the best elapsed time of func() in seconds."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        t = time.perf_counter()-t0
+        if best is None or t < best:
+            best = t
+    return best
+
+
+# make_boxes: lay out n textboxes like the cells of a spreadsheet.
+def make_boxes(n, seed=0):
+    rnd = random.Random(seed)
+    ncols = max(1, int(n**.5))
+    boxes = []
+    for i in range(n):
+        (row, col) = divmod(i, ncols)
+        x = col*60 + rnd.uniform(0, 5)
+        y = 10000 - row*15 + rnd.uniform(0, 2)
+        box = LTTextBoxHorizontal()
+        box.set_bbox((x, y, x+rnd.uniform(10, 50), y+10))
+        boxes.append(box)
+    return boxes
+
+
+# make_lines: lay out n textlines in several columns.
+def make_lines(n, seed=0):
+    rnd = random.Random(seed)
+    ncols = max(1, int(n**.5)//4)
+    lines = []
+    for i in range(n):
+        (row, col) = divmod(i, ncols)
+        x = col*300
+        y = 100000 - row*12
+        line = LTTextLineHorizontal(0.1)
+        line.set_bbox((x, y, x+rnd.uniform(200, 280), y+10))
+        lines.append(line)
+    return lines
+
+
+# bench_textlines: LTLayoutContainer.group_textlines
+def bench_textlines(args, repeat):
+    laparams = LAParams()
+    for n in (args or [1000, 4000, 16000]):
+        lines = make_lines(int(n))
+        page = LTLayoutContainer((0, 0, 100000, 100100))
+        t = timeit(lambda: list(page.group_textlines(laparams, lines)), repeat)
+        print('textlines: n=%s: %.3f sec' % (n, t))
+    return
+
+
+# bench_plane: Plane.add/find/remove with n objects of the given size.
+def bench_plane(args, repeat):
+    rnd = random.Random(0)
+    for (n, size, pagesize) in ((20000, 2, 1000), (20000, 10, 100000), (2000, 5000, 100000)):
+        objs = []
+        for _ in range(n):
+            x = rnd.uniform(0, pagesize)
+            y = rnd.uniform(0, pagesize)
+            box = LTTextBoxHorizontal()
+            box.set_bbox((x, y, x+size*rnd.uniform(.5, 2), y+size*rnd.uniform(.5, 2)))
+            objs.append(box)
+        def run():
+            plane = Plane((0, 0, pagesize, pagesize))
+            plane.extend(objs)
+            for obj in objs:
+                list(plane.find((obj.x0-size, obj.y0-size, obj.x1+size, obj.y1+size)))
+            for obj in objs:
+                plane.remove(obj)
+        t = timeit(run, repeat)
+        print('plane: n=%s, size=%s, pagesize=%s: %.3f sec' % (n, size, pagesize, t))
+    return
+
+
+# bench_textboxes: LTLayoutContainer.group_textboxes
+def bench_textboxes(args, repeat):
+    laparams = LAParams()
+    for n in (args or [100, 200, 400, 800]):
+        boxes = make_boxes(int(n))
+        page = LTLayoutContainer((0, 0, 10000, 10100))
+        t = timeit(lambda: page.group_textboxes(laparams, boxes), repeat)
+        print('textboxes: n=%s: %.3f sec' % (n, t))
+    return
+
+
+# bench_chars: LTLayoutContainer.group_objects for each page, with and without NumPy.
+def bench_chars(args, repeat):
+    from pdfminer import layout
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfpage import PDFPage
+    laparams = LAParams()
+    np = layout.get_numpy()
+    for path in args:
+        rsrcmgr = PDFResourceManager()
+        device = PDFPageAggregator(rsrcmgr)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        with open(path, 'rb') as fp:
+            for (pageno, page) in enumerate(PDFPage.get_pages(fp), start=1):
+                interpreter.process_page(page)
+                ltpage = device.get_result()
+                objs = [obj for obj in ltpage if isinstance(obj, LTChar)]
+                if not objs: continue
+                container = LTLayoutContainer(ltpage.bbox)
+                func = lambda: list(container.group_objects(laparams, objs))
+                try:
+                    layout.numpy = None
+                    t0 = timeit(func, repeat)
+                    layout.numpy = np
+                    t1 = timeit(func, repeat) if np is not None else None
+                finally:
+                    layout.numpy = np
+                print('chars: %s: page=%d, chars=%d: python=%.4f sec, numpy=%s' %
+                      (path, pageno, len(objs), t0,
+                       'n/a' if t1 is None else '%.4f sec' % t1))
+    return
+
+
+# bench_cmap: CMap.decode throughput on Japanese and Chinese strings.
+def bench_cmap(args, repeat):
+    from pdfminer.cmapdb import CMapDB
+    rnd = random.Random(0)
+    # each string is either ideographs or ASCII, as shown by a PDF.
+    texts = []
+    for _ in range(5000):
+        if rnd.random() < .8:
+            (c0, c1) = (0x4e00, 0x9fa6)
+        else:
+            (c0, c1) = (0x20, 0x7f)
+        texts.append(''.join(chr(rnd.randrange(c0, c1))
+                             for _ in range(rnd.randint(1, 30))))
+    for (name, codec) in (args and [arg.split(':') for arg in args] or
+                          [('90ms-RKSJ-H', 'cp932'), ('EUC-H', 'euc_jp'),
+                           ('UniJIS-UTF16-H', 'utf-16be'), ('GBK-EUC-H', 'gbk'),
+                           ('B5pc-H', 'big5'), ('UniGB-UTF16-H', 'utf-16be')]):
+        cmap = CMapDB.get_cmap(name)
+        strings = [text.encode(codec, 'ignore') for text in texts]
+        nbytes = sum(map(len, strings))
+        t = timeit(lambda: [list(cmap.decode(s)) for s in strings], repeat)
+        print('cmap: %s: %d bytes: %.3f sec, %.1f MB/sec' %
+              (name, nbytes, t, nbytes/t/1e6))
+    return
+
+
+# bench_cmapload: cold start of CMapDB with the CMap files in CMAP_PATH.
+def bench_cmapload(args, repeat):
+    import tracemalloc
+    from pdfminer.cmapdb import CMapDB
+    for (name, registry) in (args and [arg.split(':') for arg in args] or
+                             [('90ms-RKSJ-H', 'Adobe-Japan1'),
+                              ('UniJIS-UTF16-H', 'Adobe-Japan1'),
+                              ('GBK-EUC-H', 'Adobe-GB1'),
+                              ('UniKS-UTF16-H', 'Adobe-Korea1')]):
+        def load():
+            CMapDB._cmap_cache.clear()
+            CMapDB._umap_cache.clear()
+            cmap = CMapDB.get_cmap(name)
+            umap = CMapDB.get_unicode_map(registry, cmap.is_vertical())
+            for cid in cmap.decode(bytes(range(0x81, 0x100))):
+                try:
+                    umap.get_unichr(cid)
+                except KeyError:
+                    pass
+            return (cmap, umap)
+        t = timeit(load, repeat)
+        tracemalloc.start()
+        maps = load()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del maps
+        print('cmapload: %s, %s: %.4f sec, %.1f KB' % (name, registry, t, size/1024))
+    return
+
+
+# bench_tounicode: parsing a ToUnicode CMap with large bfranges.
+def bench_tounicode(args, repeat):
+    import io
+    import tracemalloc
+    from pdfminer.cmapdb import CMapParser, FileUnicodeMap
+    for n in (args or [1, 16, 256]):
+        n = int(n)
+        step = 65536//n
+        ranges = ' '.join('<%04x> <%04x> <%04x>' % (i*step, i*step+step-1, 0x4e00+i)
+                          for i in range(n))
+        data = ('begincmap %d beginbfrange %s endbfrange endcmap' % (n, ranges)).encode('ascii')
+        def parse():
+            umap = FileUnicodeMap()
+            CMapParser(umap, io.BytesIO(data)).run()
+            return umap
+        t = timeit(parse, repeat)
+        tracemalloc.start()
+        umap = parse()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        t1 = timeit(lambda: [umap.get_unichr(cid) for cid in range(0, 65536, 7)], repeat)
+        print('tounicode: ranges=%d: parse=%.4f sec, %.1f KB, lookup=%.4f sec' %
+              (n, t, size/1024, t1))
+    return
+
+
+# bench_charwidth: PDFFont.char_width and char_disp for the fonts of each file.
+def bench_charwidth(args, repeat):
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfpage import PDFPage
+    for path in args:
+        rsrcmgr = PDFResourceManager()
+        device = PDFPageAggregator(rsrcmgr)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        with open(path, 'rb') as fp:
+            for page in PDFPage.get_pages(fp):
+                interpreter.process_page(page)
+        for font in rsrcmgr._cached_fonts.values():
+            cids = range(0, 65536, 7) if font.is_multibyte() else range(256)
+            def run():
+                for cid in cids:
+                    font.char_width(cid)
+                    font.char_disp(cid)
+            t = timeit(run, repeat)
+            print('charwidth: %s: %r: %.1f nsec/char' % (path, font, t/len(cids)*1e9))
+    return
+
+
+# bench_importtime: cold import of pdfminer modules, as reported by python -X importtime.
+def bench_importtime(args, repeat):
+    import subprocess
+    for name in (args or ['pdfminer.pdfinterp', 'pdfminer.pdfdocument', 'pdfminer.converter']):
+        best = None
+        for _ in range(repeat):
+            p = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import '+name],
+                               stderr=subprocess.PIPE, universal_newlines=True)
+            modules = {}
+            for line in p.stderr.splitlines():
+                if not line.startswith('import time:'): continue
+                (self_us, total_us, mod) = line[12:].split('|')
+                if not self_us.strip().isdigit(): continue
+                modules[mod.strip()] = (int(self_us), int(total_us))
+            if name not in modules: break
+            if best is None or modules[name][1] < best[name][1]:
+                best = modules
+        if best is None:
+            print('importtime: %s: cannot import' % name)
+            continue
+        top = sorted((v[0], k) for (k, v) in best.items() if k.startswith('pdfminer'))[-3:]
+        print('importtime: %s: %.1f msec (%s)' %
+              (name, best[name][1]/1000,
+               ', '.join('%s %.1f' % (k, t/1000) for (t, k) in reversed(top))))
+    return
+
+
+# bench_glyphrun: PDFTextDevice.render_string with and without glyph runs.
+def bench_glyphrun(args, repeat):
+    from pdfminer.pdfinterp import PDFResourceManager, PDFTextState
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.layout import LTPage
+    rsrcmgr = PDFResourceManager()
+    for name in (args or ['Helvetica', 'Times-Roman']):
+        font = rsrcmgr.get_font(None, {'Subtype': LIT('Type1'), 'BaseFont': LIT(name)})
+        textstate = PDFTextState()
+        textstate.font = font
+        textstate.fontsize = 10
+        seq = [b'The quick brown fox jumps over the lazy dog.', -250, b'Hello, world!']*4
+        nchars = sum(len(obj) for obj in seq if isinstance(obj, bytes))
+        for charstore in (False, True):
+            device = PDFPageAggregator(rsrcmgr)
+            device.charstore = charstore
+            device.set_ctm((1, 0, 0, 1, 0, 0))
+            def run():
+                device.cur_item = LTPage(1, (0, 0, 1000, 1000))
+                if charstore:
+                    device._charstore = LTCharStore()
+                for _ in range(100):
+                    textstate.linematrix = (0, 0)
+                    device.render_string(textstate, seq)
+            cache = PDFPageAggregator._glyph_runs_cache
+            try:
+                cache[PDFPageAggregator] = False
+                t0 = timeit(run, repeat)
+                cache[PDFPageAggregator] = True
+                t1 = timeit(run, repeat)
+            finally:
+                del cache[PDFPageAggregator]
+            print('glyphrun: %s: charstore=%r: per-char=%.1f usec, run=%.1f usec per 100 chars' %
+                  (name, charstore, t0/nchars*1e6, t1/nchars*1e6))
+    return
+
+
+# bench_profile: the interpreter with and without PDFProfile.
+#   The two are run in turn after a warm-up, and one more
+#   profiled pass of each file is added up and reported.
+def bench_profile(args, repeat):
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter, PDFProfile
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfpage import PDFPage
+    def run(pages, profile):
+        rsrcmgr = PDFResourceManager()
+        device = PDFPageAggregator(rsrcmgr)
+        interpreter = PDFPageInterpreter(rsrcmgr, device, profile=profile)
+        for page in pages:
+            interpreter.process_page(page)
+        return
+    total = PDFProfile()
+    for path in args:
+        with open(path, 'rb') as fp:
+            pages = list(PDFPage.get_pages(fp))
+            run(pages, None)
+            best = {False: None, True: None}
+            for _ in range(repeat):
+                for profiling in (False, True):
+                    profile = PDFProfile() if profiling else None
+                    t = timeit(lambda: run(pages, profile), 1)
+                    if best[profiling] is None or t < best[profiling]:
+                        best[profiling] = t
+            for profiling in (False, True):
+                print('profile: %s: profiling=%r: %.3f sec' % (path, profiling, best[profiling]))
+            run(pages, PDFProfile(callback=lambda page, profile: total.merge(profile)))
+    total.write_report(sys.stdout)
+    return
+
+
+# bench_resources: interpreting pages with and without the resources cache.
+def bench_resources(args, repeat):
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.pdfdevice import PDFDevice
+    from pdfminer.pdfpage import PDFPage
+    for path in args:
+        with open(path, 'rb') as fp:
+            pages = list(PDFPage.get_pages(fp))
+            for caching in (False, True):
+                def run():
+                    rsrcmgr = PDFResourceManager()
+                    if not caching:
+                        rsrcmgr.get_resources = rsrcmgr.create_resources
+                    interpreter = PDFPageInterpreter(rsrcmgr, PDFDevice(rsrcmgr))
+                    for page in pages:
+                        interpreter.process_page(page)
+                t = timeit(run, repeat)
+                print('resources: %s: caching=%r: %.3f sec, %d pages' % (path, caching, t, len(pages)))
+    return
+
+
+# bench_glyphs: iter_glyphs() against walking the layout tree.
+def bench_glyphs(args, repeat):
+    import tracemalloc
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import PDFPageAggregator, iter_glyphs
+    from pdfminer.layout import LTContainer
+    from pdfminer.pdfpage import PDFPage
+    def walk(item):
+        if isinstance(item, LTChar):
+            yield item
+        elif isinstance(item, LTContainer):
+            for obj in item:
+                yield from walk(obj)
+        return
+    def run_tree(doc):
+        rsrcmgr = PDFResourceManager()
+        device = PDFPageAggregator(rsrcmgr)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        n = 0
+        for (i, page) in enumerate(PDFPage.create_pages(doc)):
+            interpreter.process_page(page)
+            for obj in walk(device.get_result()):
+                (i+1, obj.get_text(), obj.x0, obj.y0, obj.x1, obj.y1,
+                 obj.fontname, obj.size, obj.upright)
+                n += 1
+        return n
+    def run_records(doc):
+        return sum(1 for _ in iter_glyphs(doc))
+    def run_columns(doc):
+        return sum(len(store) for (_, store) in iter_glyphs(doc, columns=True))
+    for path in args:
+        with open(path, 'rb') as fp:
+            doc = PDFDocument(PDFParser(fp))
+            for func in (run_tree, run_records, run_columns):
+                result = []
+                t = timeit(lambda: result.append(func(doc)), repeat)
+                tracemalloc.start()
+                func(doc)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print('glyphs: %s: %s: %.3f sec, %d chars, peak %.1f MB' %
+                      (path, func.__name__, t, result[-1], peak/1e6))
+    return
+
+
+# bench_gstate: q/Q-heavy content with and without copying the states on q.
+def bench_gstate(args, repeat):
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.pdfdevice import PDFDevice
+    from pdfminer.pdftypes import PDFStream
+    class EagerInterpreter(PDFPageInterpreter):
+        def get_current_state(self):
+            return (self.ctm, self.textstate.copy(), self.graphicstate.copy())
+    rsrcmgr = PDFResourceManager()
+    resources = {'Font': {'F1': {'Subtype': LIT('Type1'), 'BaseFont': LIT('Helvetica')}}}
+    contents = {
+        'path': b'q 1 0 0 1 5 5 cm 0 0 m 10 10 l S Q\n',
+        'text': b'q BT /F1 9 Tf 10 10 Td (x) Tj ET Q\n',
+        'nested': b'q q 2 w q 1 0 0 1 5 5 cm Q Q Q\n',
+    }
+    n = 2000
+    for name in sorted(args or contents):
+        strm = PDFStream({}, contents[name]*n)
+        for klass in (EagerInterpreter, PDFPageInterpreter):
+            interpreter = klass(rsrcmgr, PDFDevice(rsrcmgr))
+            def run():
+                interpreter.render_contents(resources, [strm])
+            t = timeit(run, repeat)
+            print('gstate: %s: %s: %.2f usec per line' % (name, klass.__name__, t/n*1e6))
+    for klass in (EagerInterpreter, PDFPageInterpreter):
+        interpreter = klass(rsrcmgr, PDFDevice(rsrcmgr))
+        interpreter.init_resources(resources)
+        interpreter.init_state((1, 0, 0, 1, 0, 0))
+        def run():
+            for _ in range(n):
+                interpreter.do_q()
+                interpreter.do_Q()
+        t = timeit(run, repeat)
+        print('gstate: do_q/do_Q only: %s: %.3f usec per q/Q' % (klass.__name__, t/n*1e6))
+    return
+
+
+# bench_inlineimage: parsing content streams with large inline images.
+def bench_inlineimage(args, repeat):
+    from pdfminer.pdfinterp import PDFContentParser
+    from pdfminer.pdftypes import PDFStream
+    from pdfminer.psparser import PSEOF
+    rnd = random.Random(0)
+    for size in [int(v) for v in args] or [10000, 100000, 1000000]:
+        # many 'EI's that are not followed by a whitespace.
+        img = bytes(rnd.choice(b'EEEI\x00\xff ') for _ in range(size))
+        img = img.replace(b'I ', b'I\x00')
+        for withlength in (False, True):
+            attrs = b'/L %d ' % size if withlength else b''
+            strm = PDFStream({}, b'q BI /W 100 /H 100 /BPC 8 /CS /G ' + attrs + b'ID ' + img + b'\nEI Q\n')
+            def run():
+                parser = PDFContentParser([strm])
+                try:
+                    while 1:
+                        parser.nextobject()
+                except PSEOF:
+                    pass
+            t = timeit(run, repeat)
+            print('inlineimage: %d bytes: /L=%r: %.2f msec' % (size, withlength, t*1e3))
+    return
+
+
+# bench_contentparser: tokenizing a page split into many content streams.
+def bench_contentparser(args, repeat):
+    from pdfminer.pdfinterp import PDFContentParser
+    from pdfminer.pdftypes import PDFStream
+    from pdfminer.psparser import PSEOF
+    rnd = random.Random(0)
+    ops = []
+    for i in range(20000):
+        (x, y) = (rnd.uniform(0, 600), rnd.uniform(0, 800))
+        ops.append(b'%.2f %.2f m %.2f %.2f l S' % (x, y, x+3, y+4))
+        if i % 50 == 0:
+            ops.append(b'BT /F1 9 Tf %.1f %.1f Td (Label %d) Tj ET' % (x, y, i))
+    data = b'\n'.join(ops)
+    for nstreams in [int(v) for v in args] or [1, 100, 1000, 10000]:
+        # split at arbitrary places, so some tokens span two streams.
+        cuts = sorted(rnd.sample(range(1, len(data)), nstreams-1))
+        streams = [PDFStream({}, data[i:j]) for (i, j) in zip([0]+cuts, cuts+[len(data)])]
+        def run():
+            parser = PDFContentParser(streams)
+            n = 0
+            try:
+                while 1:
+                    parser.nextobject()
+                    n += 1
+            except PSEOF:
+                pass
+            return n
+        t = timeit(run, repeat)
+        print('contentparser: %d streams: %.3f sec, %.2f usec/object' % (nstreams, t, t/run()*1e6))
+    return
+
+
+# bench_fasttext: FastTextConverter against TextConverter.
+#   The accuracy is the fraction of the words (and of the
+#   non-space characters) of TextConverter that are also
+#   produced by FastTextConverter.
+def bench_fasttext(args, repeat):
+    import io
+    from collections import Counter
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import TextConverter, FastTextConverter
+    from pdfminer.pdfpage import PDFPage
+    for path in args:
+        with open(path, 'rb') as fp:
+            pages = list(PDFPage.get_pages(fp))
+            results = {}
+            for klass in (TextConverter, FastTextConverter):
+                def run():
+                    rsrcmgr = PDFResourceManager()
+                    outfp = io.StringIO()
+                    if klass is TextConverter:
+                        device = klass(rsrcmgr, outfp, laparams=LAParams())
+                    else:
+                        device = klass(rsrcmgr, outfp)
+                    interpreter = PDFPageInterpreter(rsrcmgr, device)
+                    for page in pages:
+                        interpreter.process_page(page)
+                    results[klass] = outfp.getvalue()
+                t = timeit(run, repeat)
+                (text0, text1) = (results[TextConverter], results[klass])
+                words0 = Counter(text0.split())
+                words1 = Counter(text1.split())
+                wacc = sum((words0 & words1).values()) / max(1, sum(words0.values()))
+                chars0 = Counter(''.join(text0.split()))
+                chars1 = Counter(''.join(text1.split()))
+                cacc = sum((chars0 & chars1).values()) / max(1, sum(chars0.values()))
+                print('fasttext: %s: %s: %.3f sec, words=%.3f, chars=%.3f' %
+                      (path, klass.__name__, t, wacc, cacc))
+    return
+
+
+# bench_formcache: layout analysis with and without the form cache.
+def bench_formcache(args, repeat):
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter, PDFFormCache
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfpage import PDFPage
+    for path in args:
+        with open(path, 'rb') as fp:
+            pages = list(PDFPage.get_pages(fp))
+            for caching in (False, True):
+                form_cache = None
+                def run():
+                    nonlocal form_cache
+                    rsrcmgr = PDFResourceManager()
+                    device = PDFPageAggregator(rsrcmgr, laparams=LAParams())
+                    form_cache = PDFFormCache() if caching else None
+                    interpreter = PDFPageInterpreter(rsrcmgr, device, form_cache=form_cache)
+                    for page in pages:
+                        interpreter.process_page(page)
+                t = timeit(run, repeat)
+                print('formcache: %s: %.3f sec, %r' % (path, t, form_cache))
+    return
+
+
+# bench_memory: memory used by the layout objects of each page.
+def bench_memory(args, repeat):
+    import tracemalloc
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfpage import PDFPage
+    for path in args:
+        for charstore in (False, True):
+            rsrcmgr = PDFResourceManager()
+            device = PDFPageAggregator(rsrcmgr)
+            device.charstore = charstore
+            interpreter = PDFPageInterpreter(rsrcmgr, device)
+            (npages, nchars, total) = (0, 0, 0)
+            with open(path, 'rb') as fp:
+                for page in PDFPage.get_pages(fp):
+                    # parse the page once so that fonts and streams are cached.
+                    interpreter.process_page(page)
+                    tracemalloc.start()
+                    interpreter.process_page(page)
+                    ltpage = device.get_result()
+                    total += tracemalloc.get_traced_memory()[0]
+                    tracemalloc.stop()
+                    npages += 1
+                    nchars += sum(1 for obj in ltpage if isinstance(obj, LTChar))
+                    del ltpage
+            print('memory: %s: charstore=%r: pages=%d, chars=%d, %.1f bytes/char' %
+                  (path, charstore, npages, nchars, total/max(1, nchars)))
+    return
+
+
+BENCHMARKS = {
+    'chars': bench_chars,
+    'charwidth': bench_charwidth,
+    'cmap': bench_cmap,
+    'cmapload': bench_cmapload,
+    'contentparser': bench_contentparser,
+    'fasttext': bench_fasttext,
+    'formcache': bench_formcache,
+    'glyphrun': bench_glyphrun,
+    'glyphs': bench_glyphs,
+    'gstate': bench_gstate,
+    'importtime': bench_importtime,
+    'inlineimage': bench_inlineimage,
+    'memory': bench_memory,
+    'plane': bench_plane,
+    'profile': bench_profile,
+    'resources': bench_resources,
+    'textboxes': bench_textboxes,
+    'textlines': bench_textlines,
+    'tounicode': bench_tounicode,
+}
+
+# main
+def main(argv):
+    import getopt
+    def usage():
+        print('usage: %s [-n repeat] {%s} [args ...]' %
+              (argv[0], '|'.join(sorted(BENCHMARKS))))
+        return 100
+    try:
+        (opts, args) = getopt.getopt(argv[1:], 'n:')
+    except getopt.GetoptError:
+        return usage()
+    if not args or args[0] not in BENCHMARKS: return usage()
+    repeat = 3
+    for (k, v) in opts:
+        if k == '-n': repeat = int(v)
+    BENCHMARKS[args[0]](args[1:], repeat)
+    return
+
+if __name__ == '__main__': sys.exit(main(sys.argv))
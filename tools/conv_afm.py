@@ -1,6 +1,12 @@
 #!/usr/bin/env python
 import sys
+import struct
 import fileinput
+from pdfminer.encodingdb import name2unicode
+
+# the order of the descriptor keys in fontmetrics.py.
+PROPS = ('FontName', 'Descent', 'FontBBox', 'FontWeight', 'CapHeight',
+         'FontFamily', 'Flags', 'XHeight', 'ItalicAngle', 'Ascent')
 
 def main(argv):
     fonts = {}
@@ -14,10 +20,12 @@ def main(argv):
             chars = {}
             fonts[fontname] = (props, chars)
         elif k == 'C':
-            cid = int(f[1])
-            if 0 <= cid and cid <= 255:
-                width = int(f[4])
-                chars[cid] = width
+            # C code ; WX width ; N name ; ...
+            width = int(f[4])
+            try:
+                chars[name2unicode(f[7])] = width
+            except KeyError:
+                pass
         elif k in ('CapHeight', 'XHeight', 'ItalicAngle',
                    'Ascender', 'Descender'):
             k = {'Ascender':'Ascent', 'Descender':'Descent'}.get(k,k)
@@ -31,9 +39,13 @@ def main(argv):
         elif k == 'FontBBox':
             props[k] = tuple(map(float, f[1:5]))
     print('# -*- python -*-')
-    print('FONT_METRICS = {')
-    for (fontname,(props,chars)) in fonts.iteritems():
-        print(' %r: %r,' % (fontname, (props,chars)))
+    print('import struct')
+    print('PACKED_FONT_METRICS = {')
+    for (fontname,(props,chars)) in sorted(fonts.items()):
+        props = dict((k, props[k]) for k in PROPS if k in props)
+        keys = ''.join(sorted(chars))
+        data = struct.pack('<%dH' % len(keys), *[chars[c] for c in keys])
+        print(' %r: (%r,\n  %r,\n  %r),' % (fontname, props, keys, data))
     print('}')
     return 0
 
@@ -7,15 +7,17 @@ def main(argv):
     import getopt
 
     def usage():
-        print('usage: %s [-c enc=codec] output_dir regname [cid2code.txt ...]' % argv[0])
+        print('usage: %s [-b] [-c enc=codec] output_dir regname [cid2code.txt ...]' % argv[0])
         return 100
     try:
-        (opts, args) = getopt.getopt(argv[1:], 'c:')
+        (opts, args) = getopt.getopt(argv[1:], 'bc:')
     except getopt.GetoptError:
         return usage()
     enc2codec = {}
+    binary = False
     for (k, v) in opts:
-        if k == '-c':
+        if k == '-b': binary = True
+        elif k == '-c':
             (enc,_,codec) = v.partition('=')
             enc2codec[enc] = codec
     if not args: return usage()
@@ -23,7 +25,7 @@ def main(argv):
     if not args: return usage()
     regname = args.pop(0)
 
-    convert_cmap(outdir, regname, enc2codec, args)
+    convert_cmap(outdir, regname, enc2codec, args, binary=binary)
     return
 
 if __name__ == '__main__': sys.exit(main(sys.argv))
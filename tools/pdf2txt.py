@@ -6,6 +6,7 @@ from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer.pdfdevice import PDFDevice, TagExtractor
 from pdfminer.pdfpage import PDFPage
 from pdfminer.converter import XMLConverter, HTMLConverter, TextConverter
+from pdfminer.converter import FastTextConverter
 from pdfminer.cmapdb import CMapDB
 from pdfminer.layout import LAParams
 from pdfminer.image import ImageWriter
@@ -14,7 +15,7 @@ from pdfminer.image import ImageWriter
 def main(argv):
     import getopt
     def usage():
-        print(f'usage: {argv[0]} [-P password] [-o output] [-t text|html|xml|tag]'
+        print(f'usage: {argv[0]} [-P password] [-o output] [-t text|fasttext|html|xml|tag]'
                ' [-O output_dir] [-c encoding] [-s scale] [-R rotation]'
                ' [-Y normal|loose|exact] [-p pagenos] [-m maxpages]'
                ' [-S] [-C] [-n] [-A] [-V] [-M char_margin] [-L line_margin]'
@@ -88,6 +89,8 @@ def main(argv):
     if outtype == 'text':
         device = TextConverter(rsrcmgr, outfp, laparams=laparams,
                                imagewriter=imagewriter)
+    elif outtype == 'fasttext':
+        device = FastTextConverter(rsrcmgr, outfp)
     elif outtype == 'xml':
         device = XMLConverter(rsrcmgr, outfp, laparams=laparams,
                               imagewriter=imagewriter,
@@ -110,6 +113,9 @@ def main(argv):
                 interpreter.process_page(page)
     device.close()
     outfp.close()
+    if debug:
+        print('ToUnicode maps: %d parsed, %d reused' %
+              (CMapDB.tounicode_misses, CMapDB.tounicode_hits), file=sys.stderr)
     return
 
 if __name__ == '__main__': sys.exit(main(sys.argv))